@@ -0,0 +1 @@
+"""Performance benchmarks for yaml2pydantic."""
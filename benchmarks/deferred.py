@@ -0,0 +1,58 @@
+"""Compare the time to first use of eager and deferred builds.
+
+The time to first use is the time taken by ``build_all`` plus the first
+validation against the top model. Deferred builds then complete the
+remaining models with ``finalize``.
+
+Run with ``python -m benchmarks.deferred [models]``.
+"""
+
+import sys
+import time
+from typing import Any
+
+from benchmarks.parallel_build import LEVELS, layered_schema
+from yaml2pydantic import ModelFactory, serializers, types, validators
+
+
+def record(level: int) -> dict[str, Any]:
+    """Generate a record of a model at the given level."""
+    data: dict[str, Any] = {"name": "item", "amount": 1.5}
+    if level > 0:
+        data["left"] = record(level - 1)
+    return data
+
+
+def measure(schema: dict[str, Any], defer_build: bool) -> tuple[float, float]:
+    """Build a schema and use its last model.
+
+    Returns
+    -------
+        The time to first use, and the time ``finalize`` takes afterwards
+
+    """
+    factory = ModelFactory(types, validators, serializers, defer_build=defer_build)
+    start = time.perf_counter()
+    models = factory.build_all(schema)
+    models[list(schema)[-1]].model_validate(record(LEVELS - 1))
+    first_use = time.perf_counter() - start
+    start = time.perf_counter()
+    factory.finalize()
+    return first_use, time.perf_counter() - start
+
+
+def main() -> None:
+    """Run the benchmark and print the times of both modes."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2_000
+    schema = layered_schema(count)
+    print(f"models:    {count}")
+    for label, defer_build in (("eager", False), ("deferred", True)):
+        first_use, finalize = measure(schema, defer_build)
+        print(
+            f"{label + ':':<10} first use {first_use:6.2f}s"
+            f"  finalize {finalize:6.2f}s  total {first_use + finalize:6.2f}s"
+        )
+
+
+if __name__ == "__main__":
+    main()
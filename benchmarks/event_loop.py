@@ -0,0 +1,105 @@
+"""Measure how long loading and validation stall an asyncio event loop.
+
+A ticker task sleeps one millisecond at a time and records the longest gap
+between two ticks, while another task loads a large schema and validates
+a stream of records, either with the blocking or with the async API.
+
+Run with ``python -m benchmarks.event_loop [models] [records]``.
+"""
+
+import asyncio
+import json
+import sys
+import tempfile
+import time
+from collections.abc import AsyncIterator
+from pathlib import Path
+from typing import Any
+
+from benchmarks.deferred import record
+from benchmarks.parallel_build import LEVELS, layered_schema
+from yaml2pydantic import SchemaLoader
+from yaml2pydantic.core.validation import avalidate_stream, validate_many
+
+
+async def produce(records: list[Any]) -> AsyncIterator[Any]:
+    """Yield records as a queue consumer would."""
+    for item in records:
+        yield item
+        await asyncio.sleep(0)
+
+
+async def workload(path: str, name: str, records: list[Any], blocking: bool) -> int:
+    """Load the schema and validate the records.
+
+    Returns
+    -------
+        The number of valid records
+
+    """
+    if blocking:
+        model = SchemaLoader.load(path, name)
+        return len(validate_many(model, records).valid)
+    model = await SchemaLoader.aload(path, name)
+    valid = 0
+    async for result in avalidate_stream(model, produce(records), batch_size=500):
+        valid += len(result.valid)
+    return valid
+
+
+async def measure(
+    path: str, name: str, records: list[Any], blocking: bool
+) -> tuple[float, float]:
+    """Run the workload next to a ticker task.
+
+    Returns
+    -------
+        The time the workload took and the longest stall of the loop
+
+    """
+    SchemaLoader.invalidate()
+    longest = 0.0
+
+    async def tick() -> None:
+        nonlocal longest
+        last = time.perf_counter()
+        while True:
+            await asyncio.sleep(0.001)
+            now = time.perf_counter()
+            longest = max(longest, now - last)
+            last = now
+
+    ticker = asyncio.create_task(tick())
+    await asyncio.sleep(0)
+    start = time.perf_counter()
+    valid = await workload(path, name, records, blocking)
+    elapsed = time.perf_counter() - start
+    # Let the ticker see the gap left by a blocking workload
+    await asyncio.sleep(0.01)
+    ticker.cancel()
+    assert valid == len(records)
+    return elapsed, longest
+
+
+def main() -> None:
+    """Run the benchmark and print the stalls of both APIs."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2_000
+    record_count = int(sys.argv[2]) if len(sys.argv) > 2 else 20_000
+    schema = layered_schema(count)
+    name = list(schema)[-1]
+    records = [record(LEVELS - 1)] * record_count
+    with tempfile.TemporaryDirectory() as directory:
+        path = str(Path(directory) / "schema.json")
+        Path(path).write_text(json.dumps(schema))
+        print(f"models:    {count}")
+        print(f"records:   {record_count}")
+        for label, blocking in (("blocking", True), ("async", False)):
+            elapsed, longest = asyncio.run(measure(path, name, records, blocking))
+            print(
+                f"{label + ':':<10} total {elapsed:6.2f}s"
+                f"  longest stall {longest * 1000:8.1f} ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""Compare the slotted Money type with the former BaseModel implementation.
+
+Run with ``python -m benchmarks.money [records]``.
+"""
+
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
+
+from pydantic import BaseModel, create_model, field_validator
+
+from yaml2pydantic.components.types.money import Money
+
+
+class ModelMoney(BaseModel):
+    """The Money type as it was before, a Pydantic model."""
+
+    amount: int | float
+    currency: str = "R$"
+
+    @field_validator("amount", mode="before")
+    @classmethod
+    def convert_float_to_cents(cls, v: int | float) -> int:
+        """Convert float values to cents."""
+        if isinstance(v, float):
+            return round(v * 100)
+        return v
+
+
+def make_records(count: int) -> list[dict]:
+    """Generate invoice records with a few money values each."""
+    return [
+        {
+            "total": {"amount": i * 1.25, "currency": "USD"},
+            "tax": {"amount": i},
+            "discount": {"amount": 0.5},
+        }
+        for i in range(count)
+    ]
+
+
+def invoice_model(money_type: type) -> type[BaseModel]:
+    """Build an invoice model whose money fields use the given type."""
+    return create_model(
+        "Invoice",
+        total=(money_type, ...),
+        tax=(money_type, ...),
+        discount=(money_type, ...),
+    )
+
+
+def best_time(run: Callable[[], Any], repeat: int = 3) -> float:
+    """Get the best time, in seconds, of a few runs."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def throughput(
+    model: type[BaseModel], records: list[dict]
+) -> tuple[float, float, float]:
+    """Get the times to validate, dump and dump to JSON every record."""
+    instances = [model.model_validate(record) for record in records]
+    return (
+        best_time(lambda: [model.model_validate(r) for r in records]),
+        best_time(lambda: [i.model_dump() for i in instances]),
+        best_time(lambda: [i.model_dump_json() for i in instances]),
+    )
+
+
+def instance_memory(money_type: type, count: int) -> int:
+    """Get the memory, in bytes, held by ``count`` money values."""
+    tracemalloc.start()
+    values = [money_type(amount=i, currency="USD") for i in range(count)]
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del values
+    return size
+
+
+def main() -> None:
+    """Run the benchmark and print throughput and memory for each type."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    records = make_records(count)
+
+    print(f"records: {count}")
+    columns = ["validate/s", "dump/s", "dump_json/s", "bytes/value"]
+    print(f"  {'':<10}" + "".join(f" {column:>12}" for column in columns))
+    for label, money_type in [("BaseModel", ModelMoney), ("slots", Money)]:
+        validate, dump, dump_json = throughput(invoice_model(money_type), records)
+        memory = instance_memory(money_type, count)
+        print(
+            f"  {label:<10} {count / validate:12,.0f} {count / dump:12,.0f}"
+            f" {count / dump_json:12,.0f} {memory / count:12.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
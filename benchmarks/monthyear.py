@@ -0,0 +1,67 @@
+"""Compare MonthYear parsing with the former strptime-based implementation.
+
+Run with ``python -m benchmarks.monthyear [values]``.
+"""
+
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+
+from pydantic import TypeAdapter
+
+from yaml2pydantic.components.types.monthyear import MonthYear
+
+
+class DatetimeMonthYear:
+    """The MonthYear type as it was before, holding a datetime."""
+
+    def __init__(self, value: str):
+        """Parse the value with strptime."""
+        self.value = datetime.strptime(value, "%m/%Y")
+
+
+def make_values(count: int) -> list[str]:
+    """Generate ``MM/YYYY`` strings over a few decades."""
+    return [f"{i % 12 + 1:02d}/{1990 + i % 40}" for i in range(count)]
+
+
+def main() -> None:
+    """Run the benchmark and print values per second and memory per value."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    values = make_values(count)
+    adapter = TypeAdapter(list[MonthYear])
+
+    start = time.perf_counter()
+    [DatetimeMonthYear(value) for value in values]
+    before = time.perf_counter() - start
+
+    start = time.perf_counter()
+    parsed = adapter.validate_python(values)
+    after = time.perf_counter() - start
+
+    tracemalloc.start()
+    old = [DatetimeMonthYear(value) for value in values[:100_000]]
+    old_memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del old
+
+    tracemalloc.start()
+    new = adapter.validate_python(values[:100_000])
+    new_memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del new
+
+    assert parsed[0] == MonthYear(values[0])
+    print(f"values:      {count}")
+    print(
+        f"strptime:    {count / before:12,.0f} values/s  {old_memory / 100_000:6.1f} B"
+    )
+    print(
+        f"MonthYear:   {count / after:12,.0f} values/s  {new_memory / 100_000:6.1f} B"
+    )
+    print(f"speedup:     {before / after:12.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""Compare serial and parallel builds of large schemas.
+
+Models are spread over ten dependency levels, each referencing two models
+of the level below, so every level has many models to build concurrently.
+
+Run with ``python -m benchmarks.parallel_build [models ...]``.
+"""
+
+import os
+import sys
+import time
+from typing import Any
+
+from yaml2pydantic import ModelFactory, serializers, types, validators
+
+LEVELS = 10
+
+
+def layered_schema(count: int) -> dict[str, Any]:
+    """Generate ``count`` models over ``LEVELS`` dependency levels."""
+    width = max(1, count // LEVELS)
+    schema: dict[str, Any] = {}
+    for i in range(count):
+        level, position = divmod(i, width)
+        fields: dict[str, Any] = {
+            "name": {"type": "str", "max_length": 40},
+            "amount": {"type": "float", "ge": 0},
+            "tags": {"type": "list[str]", "default": []},
+        }
+        if level > 0:
+            below = (level - 1) * width
+            fields["left"] = {"type": f"Model{below + position}"}
+            fields["right"] = {
+                "type": f"Optional[Model{below + (position + 1) % width}]",
+                "default": None,
+            }
+        schema[f"Model{i}"] = {"fields": fields}
+    return schema
+
+
+def build(schema: dict[str, Any], workers: int) -> tuple[float, list[str]]:
+    """Build a schema with a new factory.
+
+    Returns
+    -------
+        The time taken and the names of the models, in build order
+
+    """
+    factory = ModelFactory(types, validators, serializers)
+    start = time.perf_counter()
+    models = factory.build_all(schema, workers=workers)
+    return time.perf_counter() - start, list(models)
+
+
+def main() -> None:
+    """Run the benchmark and print the build time per worker count."""
+    counts = [int(arg) for arg in sys.argv[1:]] or [1_000, 5_000, 10_000]
+    worker_counts = sorted({1, 2, 4, os.cpu_count() or 1})
+    print(f"{'models':>8} " + " ".join(f"{w:>7}w" for w in worker_counts))
+    for count in counts:
+        schema = layered_schema(count)
+        times = []
+        order = None
+        for workers in worker_counts:
+            elapsed, names = build(schema, workers)
+            assert order is None or names == order, "build order differs"
+            order = names
+            times.append(elapsed)
+        print(f"{count:>8} " + " ".join(f"{t:7.2f}s" for t in times))
+
+
+if __name__ == "__main__":
+    main()
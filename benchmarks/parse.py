@@ -0,0 +1,73 @@
+"""Measure schema parse time per megabyte for each parser backend.
+
+Run with ``python -m benchmarks.parse [models]``.
+"""
+
+import json
+import sys
+import time
+from collections.abc import Callable
+from typing import Any
+
+import yaml
+
+from yaml2pydantic.core.parsers import parsers
+
+
+def make_schema(count: int) -> dict:
+    """Generate a schema with ``count`` models of a few fields each."""
+    return {
+        f"Model{i}": {
+            "fields": {
+                "name": {"type": "str", "max_length": 50},
+                "count": {"type": "int", "ge": 0, "default": 0},
+                "tags": {"type": "list[str]", "default": []},
+                "parent": {
+                    "type": f"Optional[Model{i - 1}]" if i else "Optional[str]",
+                    "default": None,
+                },
+            },
+            "validators": [],
+        }
+        for i in range(count)
+    }
+
+
+def time_parse(parse: Callable[[bytes], Any], data: bytes, repeat: int = 3) -> float:
+    """Get the best time, in seconds, to parse the data."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        parse(data)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    """Run the benchmark and print the parse time per MB of each backend."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 4000
+    schema = make_schema(count)
+    documents = {
+        "yaml": yaml.dump(schema, Dumper=getattr(yaml, "CSafeDumper", yaml.SafeDumper)),
+        "json": json.dumps(schema),
+    }
+    backends = {
+        "yaml": ["yaml", "yaml-python"],
+        "json": ["json", "orjson"],
+    }
+
+    print(f"models: {count}")
+    for kind, text in documents.items():
+        data = text.encode()
+        megabytes = len(data) / 1_000_000
+        print(f"{kind} document: {megabytes:.2f} MB")
+        for name in backends[kind]:
+            if name not in parsers.backends:
+                print(f"  {name:<12} not installed")
+                continue
+            elapsed = time_parse(parsers.backends[name], data)
+            print(f"  {name:<12} {elapsed / megabytes * 1000:10.1f} ms/MB")
+
+
+if __name__ == "__main__":
+    main()
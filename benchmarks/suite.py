@@ -0,0 +1,236 @@
+"""Benchmark suite for schema compilation, validation and serialization.
+
+Each scenario builds a synthetic schema (see ``benchmarks.synthetic``) and
+measures:
+- ``compile_ms``: time for ``ModelFactory.build_all`` on a new factory
+- ``resolve_per_s``: ``TypeRegistry.resolve`` calls per second on the
+  schema's field types
+- ``validate_per_s``, ``dump_per_s``, ``dump_json_per_s``: records per
+  second through the root model, one record at a time
+- ``peak_mb``: peak memory allocated while compiling and validating
+
+Results are compared against a baseline file and regressions beyond the
+tolerance are reported. Run with ``make bench``, or
+``python -m benchmarks.suite --save`` to record a new baseline.
+"""
+
+import argparse
+import gc
+import json
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from benchmarks.synthetic import make_records, make_schema, model_name
+from yaml2pydantic import ModelFactory, serializers, types, validators
+
+BASELINE = Path(__file__).with_name("baseline.json")
+TOLERANCE = 0.25
+
+# Whether a larger value of a metric is better
+HIGHER_IS_BETTER = {
+    "compile_ms": False,
+    "resolve_per_s": True,
+    "validate_per_s": True,
+    "dump_per_s": True,
+    "dump_json_per_s": True,
+    "peak_mb": False,
+}
+
+
+@dataclass(frozen=True)
+class Scenario:
+    """Size of a synthetic schema and of its payload.
+
+    Attributes
+    ----------
+        width: Number of fields of each model
+        depth: Number of nested models in each chain
+        trees: Number of independent chains
+        records: Number of records validated
+
+    """
+
+    width: int
+    depth: int
+    trees: int
+    records: int
+
+
+SCENARIOS = {
+    "narrow": Scenario(width=5, depth=2, trees=50, records=5000),
+    "wide": Scenario(width=60, depth=1, trees=20, records=1000),
+    "deep": Scenario(width=10, depth=10, trees=10, records=500),
+}
+
+
+def best_time(run: Callable[[], Any], repeat: int) -> float:
+    """Get the best time, in seconds, of a few runs, like ``timeit`` does."""
+    best = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            run()
+            best = min(best, time.perf_counter() - start)
+        finally:
+            gc.enable()
+    return best
+
+
+def compile_schema(schema: dict[str, Any]) -> ModelFactory:
+    """Build every model of a schema with a new factory."""
+    factory = ModelFactory(types, validators, serializers)
+    factory.build_all(schema)
+    return factory
+
+
+def run_scenario(scenario: Scenario, repeat: int = 5) -> dict[str, float]:
+    """Measure one scenario.
+
+    Args:
+    ----
+        scenario: The size of the schema and payload
+        repeat: Number of runs each time is the best of
+
+    Returns:
+    -------
+        The value of every metric
+
+    """
+    schema = make_schema(scenario.width, scenario.depth, scenario.trees)
+    records = make_records(scenario.width, scenario.depth, scenario.records)
+    field_types = [
+        field["type"]
+        for definition in schema.values()
+        for field in definition["fields"].values()
+    ]
+    # Enough lookups to time them reliably
+    field_types *= max(1, 100_000 // len(field_types))
+
+    compile_time = best_time(lambda: compile_schema(schema), repeat)
+    factory = compile_schema(schema)
+    model = factory.models[model_name(0, 0)]
+    resolve = factory.types.resolve
+    resolve_time = best_time(lambda: [resolve(t) for t in field_types], repeat)
+    instances = [model.model_validate(record) for record in records]
+    validate_time = best_time(
+        lambda: [model.model_validate(record) for record in records], repeat
+    )
+    dump_time = best_time(lambda: [i.model_dump() for i in instances], repeat)
+    dump_json_time = best_time(lambda: [i.model_dump_json() for i in instances], repeat)
+
+    tracemalloc.start()
+    memory_model = compile_schema(schema).models[model_name(0, 0)]
+    kept = [memory_model.model_validate(record) for record in records]
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    del kept
+
+    count = len(records)
+    return {
+        "compile_ms": compile_time * 1000,
+        "resolve_per_s": len(field_types) / resolve_time,
+        "validate_per_s": count / validate_time,
+        "dump_per_s": count / dump_time,
+        "dump_json_per_s": count / dump_json_time,
+        "peak_mb": peak / 1_000_000,
+    }
+
+
+def compare(
+    results: dict[str, dict[str, float]],
+    baseline: dict[str, dict[str, float]],
+    tolerance: float = TOLERANCE,
+) -> list[str]:
+    """Find the metrics that regressed against a baseline.
+
+    Args:
+    ----
+        results: The measured metrics of each scenario
+        baseline: The baseline metrics of each scenario
+        tolerance: Relative change allowed before a metric regresses
+
+    Returns:
+    -------
+        A description of each regression
+
+    """
+    regressions = []
+    for name, metrics in results.items():
+        for metric, value in metrics.items():
+            expected = baseline.get(name, {}).get(metric)
+            if not expected:
+                continue
+            change = value / expected - 1
+            if not HIGHER_IS_BETTER[metric]:
+                change = -change
+            if change < -tolerance:
+                regressions.append(
+                    f"{name}.{metric}: {value:,.2f} against {expected:,.2f}"
+                    f" ({change:+.0%})"
+                )
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the suite and compare it against the baseline.
+
+    Returns
+    -------
+        1 if a metric regressed, 0 otherwise
+
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "scenarios",
+        nargs="*",
+        metavar="scenario",
+        help=f"One of {', '.join(SCENARIOS)}",
+    )
+    parser.add_argument("--baseline", type=Path, default=BASELINE)
+    parser.add_argument("--tolerance", type=float, default=TOLERANCE)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--save", action="store_true", help="Write the results as the new baseline"
+    )
+    args = parser.parse_args(argv)
+    unknown = set(args.scenarios) - SCENARIOS.keys()
+    if unknown:
+        parser.error(f"unknown scenarios: {', '.join(sorted(unknown))}")
+
+    baseline: dict[str, dict[str, float]] = {}
+    if args.baseline.exists():
+        baseline = json.loads(args.baseline.read_text())
+
+    results: dict[str, dict[str, float]] = {}
+    for name in args.scenarios or SCENARIOS:
+        results[name] = run_scenario(SCENARIOS[name], args.repeat)
+        print(f"{name}:")
+        for metric, value in results[name].items():
+            expected = baseline.get(name, {}).get(metric)
+            against = f"  (baseline {expected:,.2f})" if expected else ""
+            print(f"  {metric:<16} {value:14,.2f}{against}")
+
+    if args.save:
+        rounded = {
+            name: {metric: round(value, 2) for metric, value in metrics.items()}
+            for name, metrics in results.items()
+        }
+        args.baseline.write_text(json.dumps({**baseline, **rounded}, indent=2) + "\n")
+        print(f"Baseline written to {args.baseline}")
+        return 0
+
+    regressions = compare(results, baseline, args.tolerance)
+    for regression in regressions:
+        print(f"REGRESSION {regression}", file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
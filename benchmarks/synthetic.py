@@ -0,0 +1,90 @@
+"""Synthetic schemas and payloads for the benchmarks.
+
+A schema is made of ``trees`` independent chains of ``depth`` models. Each
+model has ``width`` fields, cycling through the field kinds below, and all
+but the last model of a chain reference the next one, so a payload for the
+root of a chain nests ``depth`` levels deep.
+"""
+
+from typing import Any
+
+# Field kinds: the field definition, and the payload value for record ``i``
+FIELD_KINDS: list[tuple[dict[str, Any], Any]] = [
+    ({"type": "str", "max_length": 64}, lambda i: f"name {i}"),
+    ({"type": "int", "validators": ["check_positive"]}, lambda i: i + 1),
+    ({"type": "float", "ge": 0}, lambda i: i * 1.5),
+    ({"type": "Optional[str]", "default": None}, lambda i: None if i % 2 else "x"),
+    ({"type": "list[int]", "default": []}, lambda i: [i, i + 1, i + 2]),
+    ({"type": "dict[str, int]"}, lambda i: {"a": i, "b": i + 1}),
+    ({"type": "bool"}, lambda i: i % 2 == 0),
+    ({"type": "datetime"}, lambda i: f"2025-04-{i % 28 + 1:02d}T12:00:00"),
+    (
+        {"type": "Money", "serializers": ["money_as_string"]},
+        lambda i: {"amount": i * 1.25, "currency": "USD"},
+    ),
+    ({"type": "MonthYear"}, lambda i: f"{i % 12 + 1:02d}/2025"),
+]
+
+
+def model_name(tree: int, level: int) -> str:
+    """Get the name of the model at a level of a chain."""
+    return f"Tree{tree}Level{level}"
+
+
+def make_schema(width: int, depth: int, trees: int = 1) -> dict[str, Any]:
+    """Generate a schema of ``trees`` chains of ``depth`` models.
+
+    Args:
+    ----
+        width: Number of fields of each model, besides the nested one
+        depth: Number of models in each chain
+        trees: Number of independent chains
+
+    Returns:
+    -------
+        The schema definitions, leaves first
+
+    """
+    schema: dict[str, Any] = {}
+    for tree in range(trees):
+        for level in reversed(range(depth)):
+            fields = {
+                f"field{i}": dict(FIELD_KINDS[i % len(FIELD_KINDS)][0])
+                for i in range(width)
+            }
+            if level < depth - 1:
+                fields["child"] = {"type": model_name(tree, level + 1)}
+            schema[model_name(tree, level)] = {"fields": fields}
+    return schema
+
+
+def make_record(width: int, depth: int, i: int) -> dict[str, Any]:
+    """Generate the payload of record ``i`` for the root of a chain."""
+    record: dict[str, Any] = {}
+    for level in range(depth):
+        values = {
+            f"field{f}": FIELD_KINDS[f % len(FIELD_KINDS)][1](i) for f in range(width)
+        }
+        if level == 0:
+            record = node = values
+        else:
+            node["child"] = values
+            node = values
+    return record
+
+
+def make_records(width: int, depth: int, count: int) -> list[dict[str, Any]]:
+    """Generate ``count`` payloads for the root of a chain.
+
+    Args:
+    ----
+        width: Number of fields of each model, as given to ``make_schema``
+        depth: Number of models in the chain, as given to ``make_schema``
+        count: Number of records
+
+    Returns:
+    -------
+        Records valid against ``model_name(0, 0)``
+
+    """
+    return [make_record(width, depth, i) for i in range(count)]
@@ -0,0 +1,103 @@
+"""Measure the memory saved by sharing identical models between tenants.
+
+Every synthetic tenant defines the same ``Address`` and ``LineItem`` models
+and an ``Invoice`` using them, plus one model of its own. The models of all
+tenants are built and kept alive, with and without a ``ModelInterner``.
+
+Run with ``python -m benchmarks.tenants [tenants]``.
+"""
+
+import gc
+import sys
+import time
+import tracemalloc
+from typing import Any
+
+from yaml2pydantic import ModelFactory, serializers, types, validators
+from yaml2pydantic.core.interning import ModelInterner
+
+
+def tenant_schema(tenant: int) -> dict[str, Any]:
+    """Generate the schema of one tenant."""
+    return {
+        "Address": {
+            "fields": {
+                "street": {"type": "str"},
+                "city": {"type": "str"},
+                "zip": {"type": "str", "pattern": "^[0-9]{5}$"},
+            }
+        },
+        "LineItem": {
+            "fields": {
+                "sku": {"type": "str"},
+                "quantity": {"type": "int", "validators": ["check_positive"]},
+                "price": {"type": "Money", "serializers": ["money_as_string"]},
+            }
+        },
+        "Invoice": {
+            "fields": {
+                "billing": {"type": "Address"},
+                "items": {"type": "list[LineItem]", "default": []},
+                "issued": {"type": "MonthYear"},
+            }
+        },
+        f"Tenant{tenant}Settings": {
+            "fields": {"currency": {"type": "str", "default": "R$"}},
+        },
+    }
+
+
+def build_tenants(
+    count: int, interner: ModelInterner | None
+) -> tuple[float, int, list]:
+    """Build the models of every tenant.
+
+    Returns
+    -------
+        The time taken, the memory still allocated and the models built
+
+    """
+    schemas = [tenant_schema(tenant) for tenant in range(count)]
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    models = [
+        ModelFactory(types, validators, serializers, interner=interner).build_all(
+            schema
+        )
+        for schema in schemas
+    ]
+    elapsed = time.perf_counter() - start
+    gc.collect()
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return elapsed, memory, models
+
+
+def main() -> None:
+    """Run the benchmark and print the time and memory per tenant."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000
+    # Import the components before measuring
+    build_tenants(1, None)
+
+    separate_time, separate_memory, separate = build_tenants(count, None)
+    del separate
+    interner = ModelInterner()
+    shared_time, shared_memory, shared = build_tenants(count, interner)
+    assert shared[0]["Invoice"] is shared[-1]["Invoice"]
+
+    print(f"tenants:   {count}")
+    print(
+        f"separate:  {separate_time * 1000 / count:6.2f} ms/tenant"
+        f"  {separate_memory / count / 1024:8.1f} KiB/tenant"
+    )
+    print(
+        f"shared:    {shared_time * 1000 / count:6.2f} ms/tenant"
+        f"  {shared_memory / count / 1024:8.1f} KiB/tenant"
+        f"  ({len(interner)} shared models)"
+    )
+    print(f"reduction: {1 - shared_memory / separate_memory:.0%}")
+
+
+if __name__ == "__main__":
+    main()
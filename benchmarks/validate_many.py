@@ -0,0 +1,88 @@
+"""Compare batched validation with a per-row validation loop.
+
+Run with ``python -m benchmarks.validate_many [records] [batch_size] [invalid_every]``
+(use 0 for ``invalid_every`` to validate clean data).
+"""
+
+import sys
+import time
+
+from pydantic import BaseModel
+
+from yaml2pydantic.core.loader import SchemaLoader
+from yaml2pydantic.core.validation import validate_many
+
+SCHEMA = {
+    "Address": {
+        "fields": {
+            "street": {"type": "str"},
+            "city": {"type": "str"},
+            "zip": {"type": "str", "pattern": "^[0-9]{5}$"},
+        }
+    },
+    "Person": {
+        "fields": {
+            "name": {"type": "str", "max_length": 50},
+            "age": {"type": "int", "ge": 0},
+            "email": {"type": "Optional[str]", "default": None},
+            "address": {"type": "Address"},
+            "tags": {"type": "list[str]", "default": []},
+        }
+    },
+}
+
+
+def make_records(count: int, invalid_every: int = 10) -> list[dict]:
+    """Generate records, one in ``invalid_every`` of them invalid."""
+    return [
+        {
+            "name": f"person {i}",
+            "age": -1 if invalid_every and i % invalid_every == 0 else i % 90,
+            "email": f"p{i}@example.com",
+            "address": {
+                "street": f"{i} Main St",
+                "city": "Springfield",
+                "zip": "12345",
+            },
+            "tags": ["a", "b"],
+        }
+        for i in range(count)
+    ]
+
+
+def per_row(model: type[BaseModel], records: list[dict]) -> list[BaseModel]:
+    """Validate records one at a time, the way callers did before."""
+    valid = []
+    for record in records:
+        try:
+            valid.append(model(**record))
+        except ValueError:
+            pass
+    return valid
+
+
+def main() -> None:
+    """Run the benchmark and print records per second for each strategy."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    batch_size = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+    invalid_every = int(sys.argv[3]) if len(sys.argv) > 3 else 10
+    model = SchemaLoader.load(SCHEMA, "Person")
+    records = make_records(count, invalid_every)
+
+    start = time.perf_counter()
+    valid = per_row(model, records)
+    loop_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    result = validate_many(model, records, batch_size=batch_size, pause_gc=True)
+    batch_time = time.perf_counter() - start
+
+    assert len(valid) == len(result.valid)
+    print(f"records:        {count} ({len(result.errors)} invalid)")
+    print(f"per-row loop:   {count / loop_time:12,.0f} records/s")
+    print(f"validate_many:  {count / batch_time:12,.0f} records/s")
+    print(f"speedup:        {loop_time / batch_time:12.2f}x")
+
+
+if __name__ == "__main__":
+    main()
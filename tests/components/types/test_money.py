@@ -1,4 +1,7 @@
+from typing import Any
+
 import pytest
+from pydantic import BaseModel, ValidationError
 
 from yaml2pydantic.components.types.money import Money
 
@@ -46,3 +49,57 @@ def test_money_equality() -> None:
 
     assert money1 == money2
     assert money1 != money3
+
+
+def test_money_is_compact() -> None:
+    """Test Money instances have no per-instance dictionary."""
+    assert not hasattr(Money(amount=1000), "__dict__")
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        (1000, Money(amount=1000)),
+        (10.5, Money(amount=1050)),
+        ({"amount": 10.5}, Money(amount=1050)),
+        ({"amount": 1000, "currency": "USD"}, Money(amount=1000, currency="USD")),
+        (Money(amount=7, currency="USD"), Money(amount=7, currency="USD")),
+    ],
+)
+def test_money_field_coercion(value: Any, expected: Money) -> None:
+    """Test a Money field accepts amounts, mappings and instances."""
+
+    class Invoice(BaseModel):
+        total: Money
+
+    invoice = Invoice(total=value)
+    assert invoice.total == expected
+    assert Invoice.model_validate_json(invoice.model_dump_json()) == invoice
+
+
+def test_money_field_serialization() -> None:
+    """Test a Money field is dumped as a dictionary."""
+
+    class Invoice(BaseModel):
+        total: Money
+
+    invoice = Invoice(total={"amount": 1000, "currency": "USD"})
+    assert invoice.model_dump() == {"total": {"amount": 1000, "currency": "USD"}}
+
+
+def test_money_field_rejects_invalid_values() -> None:
+    """Test a Money field rejects values that are not money."""
+
+    class Invoice(BaseModel):
+        total: Money
+
+    for value in ["invalid", None, {"currency": "USD"}]:
+        with pytest.raises(ValidationError):
+            Invoice(total=value)
+
+
+def test_money_model_validate() -> None:
+    """Test Money keeps the model-style validation helpers."""
+    money = Money.model_validate({"amount": 0})
+    assert money == Money(amount=0)
+    assert money.model_dump() == {"amount": 0, "currency": "R$"}
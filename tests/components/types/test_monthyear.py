@@ -1,7 +1,8 @@
+import pickle
 from datetime import datetime
 
 import pytest
-from pydantic import TypeAdapter
+from pydantic import TypeAdapter, ValidationError
 
 from yaml2pydantic.components.types.monthyear import MonthYear
 
@@ -68,3 +69,55 @@ def test_monthyear_from_invalid_type() -> None:
     """Test MonthYear from invalid type input."""
     with pytest.raises(ValueError):
         MonthYear(1)
+
+
+def test_monthyear_from_short_month() -> None:
+    """Test MonthYear from a string with a single-digit month."""
+    assert MonthYear("3/2025") == MonthYear("03/2025")
+
+
+@pytest.mark.parametrize(
+    "value", ["13/2025", "00/2025", "03/0000", "03-2025", "٠٣/2025"]
+)
+def test_monthyear_invalid_strings(value: str) -> None:
+    """Test MonthYear rejects strings that are not a valid month and year."""
+    with pytest.raises(ValueError):
+        MonthYear(value)
+
+
+def test_monthyear_ordering_and_hashing() -> None:
+    """Test MonthYear instances are ordered chronologically and hashable."""
+    months = [MonthYear("01/2025"), MonthYear("12/2024"), MonthYear("02/2025")]
+    assert sorted(months) == [months[1], months[0], months[2]]
+    assert MonthYear("12/2024") < MonthYear("01/2025") <= MonthYear("01/2025")
+    assert len({MonthYear("01/2025"), MonthYear(datetime(2025, 1, 20))}) == 1
+
+
+def test_monthyear_interning() -> None:
+    """Test common months are shared instances, and instances are immutable."""
+    monthyear = MonthYear("04/2025")
+    assert MonthYear(datetime(2025, 4, 30)) is monthyear
+    assert pickle.loads(pickle.dumps(monthyear)) is monthyear
+    assert MonthYear("04/2500") == MonthYear("04/2500")
+    with pytest.raises(AttributeError):
+        monthyear.index = 0  # type: ignore[misc]
+
+
+def test_monthyear_pydantic_validation() -> None:
+    """Test MonthYear fields convert strings and serialize back to strings."""
+    adapter = TypeAdapter(list[MonthYear])
+    values = adapter.validate_python(["04/2025", MonthYear("05/2025")])
+    assert values == [MonthYear("04/2025"), MonthYear("05/2025")]
+    assert adapter.validate_json('["04/2025"]') == [MonthYear("04/2025")]
+    assert adapter.dump_python(values) == ["04/2025", "05/2025"]
+    assert adapter.dump_json(values) == b'["04/2025","05/2025"]'
+    with pytest.raises(ValidationError):
+        adapter.validate_python(["13/2025"])
+
+
+@pytest.mark.parametrize("value", ["13/2025", 42, datetime(2025, 4, 1)])
+def test_monthyear_pydantic_single_error(value: object) -> None:
+    """Test invalid values get one validation error, not one per union member."""
+    with pytest.raises(ValidationError) as info:
+        TypeAdapter(MonthYear).validate_python(value)
+    assert info.value.error_count() == 1
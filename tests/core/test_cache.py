@@ -0,0 +1,220 @@
+"""Tests for the compiled schema cache."""
+
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+import yaml
+
+from yaml2pydantic import serializers, types, validators
+from yaml2pydantic.core.cache import (
+    CacheEntry,
+    SchemaCache,
+    component_fingerprints,
+    dict_key,
+    source_key,
+)
+from yaml2pydantic.core.dependencies import BuildPlan
+from yaml2pydantic.core.loader import SchemaLoader
+from yaml2pydantic.core.serializers import SerializerRegistry
+from yaml2pydantic.core.type_registry import TypeRegistry
+from yaml2pydantic.core.validators import ValidatorRegistry
+
+SCHEMA = {
+    "Person": {"fields": {"address": {"type": "Address"}}},
+    "Address": {"fields": {"street": {"type": "str"}}},
+}
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """Create a cache in a temporary directory."""
+    return SchemaCache(tmp_path / "cache")
+
+
+@pytest.fixture
+def schema_file(tmp_path):
+    """Write the test schema to a YAML file."""
+    path = tmp_path / "schema.yaml"
+    path.write_text(yaml.dump(SCHEMA))
+    return path
+
+
+def _entry() -> CacheEntry:
+    return CacheEntry(
+        definitions=SCHEMA,
+        plan=BuildPlan.from_definitions(SCHEMA),
+        components={},
+    )
+
+
+def test_source_key_depends_on_content_and_suffix() -> None:
+    """Test that the key changes with the content and the parser."""
+    assert source_key(b"a", ".yaml") == source_key(b"a", ".yaml")
+    assert source_key(b"a", ".yaml") != source_key(b"b", ".yaml")
+    assert source_key(b"a", ".yaml") != source_key(b"a", ".json")
+
+
+def test_dict_key_ignores_key_order() -> None:
+    """Test that equivalent dictionaries share a key."""
+    assert dict_key({"a": 1, "b": 2}) == dict_key({"b": 2, "a": 1})
+
+
+def test_cache_round_trip(cache) -> None:
+    """Test that stored entries can be read back."""
+    assert cache.get("key") is None
+    cache.put("key", _entry())
+
+    entry = cache.get("key")
+    assert entry.definitions == SCHEMA
+    assert entry.plan.groups == [["Address"], ["Person"]]
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_cache_ignores_corrupt_entries(cache) -> None:
+    """Test that unreadable entries are treated as misses."""
+    cache.put("key", _entry())
+    (cache.directory / "key.y2p").write_bytes(b"garbage")
+
+    assert cache.get("key") is None
+
+
+def test_cache_stores_plain_json(cache) -> None:
+    """Test that entries are JSON and that other data is not stored."""
+    cache.put("key", _entry())
+    assert json.loads((cache.directory / "key.y2p").read_bytes())["key"] == "key"
+
+    dated = CacheEntry(
+        definitions={"A": {"fields": {"x": {"type": "int", "default": (1, 2)}}}},
+        plan=BuildPlan([["A"]], {"A": []}),
+        components={},
+    )
+    cache.put("dated", dated)
+    assert cache.get("dated") is None
+
+
+def test_cache_evicts_least_recently_used(tmp_path) -> None:
+    """Test that the cache stays within its entry bound."""
+    cache = SchemaCache(tmp_path, max_entries=2)
+    for i, key in enumerate(["a", "b", "c"]):
+        cache.put(key, _entry())
+        os.utime(tmp_path / f"{key}.y2p", (i, i))
+    cache.evict()
+
+    assert sorted(p.stem for p in tmp_path.glob("*.y2p")) == ["b", "c"]
+
+
+def test_component_fingerprints_track_used_components() -> None:
+    """Test that only the components used by the schema are fingerprinted."""
+    types = TypeRegistry()
+    validators = ValidatorRegistry()
+    serializers = SerializerRegistry()
+
+    class Money:
+        pass
+
+    types.register("Money", Money)
+    types.register("Unused", int)
+
+    @validators.validator
+    def positive(value):
+        return value
+
+    definitions = {
+        "Invoice": {
+            "fields": {"total": {"type": "Optional[Money]", "validators": ["positive"]}}
+        }
+    }
+    fingerprints = component_fingerprints(definitions, types, validators, serializers)
+
+    assert set(fingerprints) == {"type:Money", "validator:positive"}
+
+
+INDEXED = {
+    "User": {
+        "fields": {
+            "name": {
+                "type": "str",
+                "validators": ["non_empty"],
+                "serializers": ["to_upper"],
+            },
+            "balance": {"type": "Optional[Money]"},
+        }
+    }
+}
+
+FINGERPRINT_SCRIPT = f"""
+import json
+from yaml2pydantic import serializers, types, validators
+from yaml2pydantic.core.cache import component_fingerprints
+print(json.dumps(component_fingerprints({INDEXED!r}, types, validators, serializers)))
+"""
+
+
+def test_component_fingerprints_import_indexed_components() -> None:
+    """Test that a fresh process fingerprints components it has not imported."""
+    fresh = json.loads(
+        subprocess.run(
+            [sys.executable, "-c", FINGERPRINT_SCRIPT],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+    )
+
+    assert set(fresh) == {"validator:non_empty", "serializer:to_upper", "type:Money"}
+    assert not any("NoneType" in fingerprint for fingerprint in fresh.values())
+    assert fresh == component_fingerprints(INDEXED, types, validators, serializers)
+
+
+def _versioned_fingerprints(limit: int) -> dict[str, str]:
+    """Fingerprint components whose source differs by one constant."""
+    namespace: dict = {"__name__": "components"}
+    exec(
+        f"def capped(value):\n    return value <= {limit}\n"
+        f"class Price:\n    def cents(self):\n        return {limit}\n",
+        namespace,
+    )
+    types = TypeRegistry()
+    types.register("Price", namespace["Price"])
+    validators = ValidatorRegistry()
+    validators.validator(namespace["capped"])
+    definitions = {
+        "Item": {"fields": {"price": {"type": "Price", "validators": ["capped"]}}}
+    }
+    return component_fingerprints(definitions, types, validators, SerializerRegistry())
+
+
+def test_component_fingerprints_track_constants_and_methods() -> None:
+    """Test that changing a constant of a function or method is detected."""
+    first, second = _versioned_fingerprints(0), _versioned_fingerprints(100)
+
+    assert first == _versioned_fingerprints(0)
+    assert first["validator:capped"] != second["validator:capped"]
+    assert first["type:Price"] != second["type:Price"]
+
+
+def test_loader_uses_cache(cache, schema_file) -> None:
+    """Test that a warm load reads the compiled schema from the cache."""
+    models = SchemaLoader.load_all(str(schema_file), cache=cache)
+    assert models["Person"](address={"street": "x"}).address.street == "x"
+    assert (cache.hits, cache.misses) == (0, 1)
+
+    # Forget the in-process memo, as a new process would
+    SchemaLoader.invalidate(str(schema_file))
+    models = SchemaLoader.load_all(str(schema_file), cache=cache)
+    assert models["Person"](address={"street": "y"}).address.street == "y"
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_loader_cache_invalidated_by_file_change(cache, schema_file) -> None:
+    """Test that editing the schema file produces a new entry."""
+    SchemaLoader.load_all(str(schema_file), cache=cache)
+    schema_file.write_text(yaml.dump({"Other": {"fields": {"x": {"type": "int"}}}}))
+
+    models = SchemaLoader.load_all(str(schema_file), cache=cache)
+
+    assert "Other" in models
+    assert cache.hits == 0
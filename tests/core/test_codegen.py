@@ -0,0 +1,188 @@
+"""Tests for ahead-of-time code generation."""
+
+import importlib.util
+import sys
+
+import pytest
+import yaml
+
+from yaml2pydantic.components.serializers.money import money_as_string
+from yaml2pydantic.components.serializers.string import to_lower, to_upper
+from yaml2pydantic.components.types.money import Money
+from yaml2pydantic.components.types.monthyear import MonthYear
+from yaml2pydantic.components.validators.numeric import check_positive
+from yaml2pydantic.components.validators.string import non_empty
+from yaml2pydantic.core.factory import ModelFactory
+from yaml2pydantic.core.serializers import SerializerRegistry
+from yaml2pydantic.core.type_registry import TypeRegistry
+from yaml2pydantic.core.validators import ValidatorRegistry
+
+SCHEMA = yaml.safe_load("""
+User:
+  fields:
+    name:
+      type: str
+      max_length: 10
+      validators: [non_empty]
+      serializers: [to_upper]
+    age:
+      type: int
+      validators: [check_positive]
+    email:
+      type: Optional[str]
+      default: null
+    nickname:
+      type: Optional[str]
+      default: null
+      validators: [non_empty]
+    address:
+      type: Address
+      default:
+        street: "Unknown"
+    balance:
+      type: Money
+      default:
+        amount: 0
+      serializers: [money_as_string]
+    start_date:
+      type: MonthYear
+      default: "03/2025"
+    manager:
+      type: Optional[User]
+      default: null
+    labels:
+      type: "dict[str, list[Literal['x', 'y']]] | None"
+      default: null
+    contacts:
+      type: "dict[str, Address]"
+      default: {}
+    branches:
+      type: list[Address]
+      default: []
+      validators: [non_empty]
+
+Address:
+  fields:
+    street:
+      type: str
+""")
+
+RECORDS = [
+    {"name": "alice", "age": 30, "balance": {"amount": 1050}},
+    {
+        "name": "bob",
+        "age": 5,
+        "address": {"street": "Main"},
+        "manager": {"name": "c", "age": 1},
+    },
+    {"name": "eve", "age": 2, "labels": {"k": ["x", "y"]}},
+    {"name": "ida", "age": 2, "contacts": {"home": {"street": "Elm"}}},
+    {"name": "jon", "age": 2, "branches": []},
+    {"name": "fay", "age": 2, "labels": {"k": ["z"]}},
+    {"name": "", "age": 30},
+    {"name": "dave", "age": -1},
+    {"name": "a very long name", "age": 1},
+    {"name": "gus", "age": 1, "nickname": " "},
+]
+
+
+@pytest.fixture
+def factory():
+    """Create a factory whose components are importable by dotted name."""
+    types = TypeRegistry()
+    types.register("Money", Money)
+    types.register("MonthYear", MonthYear)
+    validators = ValidatorRegistry()
+    validators.validator(check_positive)
+    validators.validator(non_empty)
+    serializers = SerializerRegistry()
+    serializers.serializer(to_upper)
+    serializers.serializer(money_as_string)
+    return ModelFactory(types, validators, serializers)
+
+
+def _import_source(path, name):
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def _outcome(model, record):
+    try:
+        instance = model(**record)
+    except ValueError as e:
+        return [(err["loc"], err["type"]) for err in e.errors()]
+    return instance.model_dump(mode="json")
+
+
+def test_emit_source_round_trip(factory, tmp_path) -> None:
+    """Test that generated models behave like the dynamic ones."""
+    source = factory.emit_source(SCHEMA)
+    path = tmp_path / "generated_models.py"
+    path.write_text(source)
+    generated = _import_source(path, "generated_models")
+
+    dynamic = factory.build_all(SCHEMA)
+
+    for name in SCHEMA:
+        assert (
+            getattr(generated, name).model_json_schema()
+            == dynamic[name].model_json_schema()
+        )
+    for record in RECORDS:
+        assert _outcome(generated.User, record) == _outcome(dynamic["User"], record)
+
+
+def test_emit_source_imports_components(factory) -> None:
+    """Test that components are imported by their dotted names."""
+    source = factory.emit_source(SCHEMA)
+
+    assert "from yaml2pydantic.components.types.money import Money" in source
+    assert "from yaml2pydantic.components.validators.string import non_empty" in source
+    assert "User.model_rebuild()" in source
+
+
+def test_emit_source_rejects_local_components(factory) -> None:
+    """Test that components defined in a function cannot be emitted."""
+
+    @factory.validators.validator
+    def local_validator(value):
+        return value
+
+    schema = {
+        "M": {"fields": {"x": {"type": "int", "validators": ["local_validator"]}}}
+    }
+    with pytest.raises(ValueError, match="Cannot import"):
+        factory.emit_source(schema)
+
+
+def test_emit_source_lowers_native_validators(factory) -> None:
+    """Test that validators with a native equivalent become constraints."""
+    source = factory.emit_source(SCHEMA)
+
+    assert "age: Annotated[int, Field(gt=0)]" in source
+    assert (
+        "name: Annotated[str, PlainSerializer(to_upper, return_type=str), "
+        "Field(pattern='\\\\S')]" in source
+    )
+    assert "check_positive" not in source
+    assert "validate_nickname_non_empty = field_validator('nickname')" in source
+
+
+def test_emit_source_composes_serializer_chains(factory) -> None:
+    """Test that chained serializers are emitted as one PlainSerializer."""
+    factory.serializers.serializer(to_lower)
+    schema = {
+        "Tag": {
+            "fields": {
+                "label": {"type": "str", "serializers": ["to_lower", "to_upper"]}
+            }
+        }
+    }
+
+    source = factory.emit_source(schema)
+
+    assert "PlainSerializer(chain(to_lower, to_upper), return_type=str)" in source
+    assert "from yaml2pydantic.core.serializers import chain" in source
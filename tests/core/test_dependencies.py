@@ -0,0 +1,82 @@
+"""Tests for the dependency analysis module."""
+
+from yaml2pydantic.core.dependencies import (
+    BuildPlan,
+    dependency_graph,
+    referenced_names,
+    strongly_connected_components,
+)
+
+
+def test_referenced_names_nested() -> None:
+    """Test that names nested in Optional[...] are found."""
+    assert referenced_names("Optional[Address]") == {"Optional", "Address"}
+    assert referenced_names("str") == {"str"}
+
+
+def test_dependency_graph_only_keeps_defined_models() -> None:
+    """Test that the graph only has edges between defined models."""
+    definitions = {
+        "User": {
+            "fields": {
+                "name": {"type": "str"},
+                "address": {"type": "Optional[Address]"},
+                "billing": {"type": "Address"},
+            }
+        },
+        "Address": {"fields": {"street": {"type": "str"}}},
+    }
+    assert dependency_graph(definitions) == {"User": ["Address"], "Address": []}
+
+
+def test_components_are_ordered_dependencies_first() -> None:
+    """Test that components come out in build order."""
+    graph = {"A": ["B"], "B": ["C"], "C": []}
+    assert strongly_connected_components(graph) == [["C"], ["B"], ["A"]]
+
+
+def test_components_group_cycles() -> None:
+    """Test that mutually recursive nodes share a component."""
+    graph = {"A": ["B"], "B": ["A", "C"], "C": [], "D": ["A"]}
+    components = strongly_connected_components(graph)
+    assert components[0] == ["C"]
+    assert sorted(components[1]) == ["A", "B"]
+    assert components[2] == ["D"]
+
+
+def test_components_deep_chain_does_not_recurse() -> None:
+    """Test that very deep graphs do not hit the recursion limit."""
+    graph = {f"M{i}": [f"M{i + 1}"] for i in range(5000)}
+    graph["M5000"] = []
+    components = strongly_connected_components(graph)
+    assert components[0] == ["M5000"]
+    assert components[-1] == ["M0"]
+
+
+def test_build_plan_detects_cycles() -> None:
+    """Test that self references and mutual references are cyclic."""
+    definitions = {
+        "Node": {"fields": {"next": {"type": "Optional[Node]"}}},
+        "Leaf": {"fields": {"value": {"type": "int"}}},
+    }
+    plan = BuildPlan.from_definitions(definitions)
+    assert plan.is_cyclic(["Node"])
+    assert not plan.is_cyclic(["Leaf"])
+
+
+def test_build_plan_levels() -> None:
+    """Test that groups only depend on groups of earlier levels."""
+    definitions = {
+        "Order": {"fields": {"customer": {"type": "Customer"}}},
+        "Customer": {"fields": {"address": {"type": "Address"}}},
+        "Address": {"fields": {"city": {"type": "str"}}},
+        "Tag": {"fields": {"label": {"type": "str"}}},
+        "A": {"fields": {"b": {"type": "Optional[B]"}, "tag": {"type": "Tag"}}},
+        "B": {"fields": {"a": {"type": "A"}}},
+    }
+    levels = BuildPlan.from_definitions(definitions).levels()
+    assert [sorted(sorted(group) for group in level) for level in levels] == [
+        [["Address"], ["Tag"]],
+        [["A", "B"], ["Customer"]],
+        [["Order"]],
+    ]
@@ -0,0 +1,171 @@
+"""Tests for schemas split across many files."""
+
+import pytest
+
+from yaml2pydantic.core.directory import (
+    SchemaDirectory,
+    is_collection,
+    scan_yaml_keys,
+)
+from yaml2pydantic.core.loader import SchemaLoader
+
+
+@pytest.fixture
+def schema_dir(tmp_path):
+    """Create a directory of schema files referring to each other."""
+    root = tmp_path / "schemas"
+    (root / "people").mkdir(parents=True)
+    (root / "people" / "person.yaml").write_text(
+        "Person:\n"
+        "  fields:\n"
+        "    name:\n"
+        "      type: str\n"
+        "    address:\n"
+        "      type: Address\n"
+    )
+    (root / "address.yaml").write_text(
+        "Address:\n  fields:\n    city:\n      type: str\n"
+    )
+    (root / "orders.json").write_text(
+        '{"Order": {"fields": {"buyer": {"type": "Person"}}}}'
+    )
+    (root / "unused.yaml").write_text("Unused:\n  fields:\n    x:\n      type: int\n")
+    return root
+
+
+def test_is_collection(schema_dir) -> None:
+    """Test that directories and glob patterns are recognised."""
+    assert is_collection(str(schema_dir))
+    assert is_collection(str(schema_dir / "*.yaml"))
+    assert not is_collection(str(schema_dir / "address.yaml"))
+
+
+def test_index_does_not_parse_yaml(schema_dir) -> None:
+    """Test that indexing YAML files reads their top-level keys only."""
+    directory = SchemaDirectory(schema_dir)
+
+    assert directory.index == {
+        "Address": (schema_dir / "address.yaml").resolve(),
+        "Order": (schema_dir / "orders.json").resolve(),
+        "Person": (schema_dir / "people" / "person.yaml").resolve(),
+        "Unused": (schema_dir / "unused.yaml").resolve(),
+    }
+    assert directory.parses == 1  # the JSON file
+
+
+def test_scan_yaml_keys() -> None:
+    """Test that only plain block-style keys are scanned without a parse."""
+    assert scan_yaml_keys(
+        b"# models\nUser:\n  fields: {}\n$include: [a.yaml]\nTag: {fields: {}}\n"
+    ) == ["User", "Tag"]
+    for data in (
+        b'User:\n  fields: {}\n"Order":\n  fields: {}\n',
+        b"{User: {fields: {}}}\n",
+        b"User: &base\n  fields: {}\n<<: *base\n",
+        b"---\nUser:\n  fields: {}\n",
+    ):
+        assert scan_yaml_keys(data) is None
+
+
+def test_index_parses_files_with_other_keys(tmp_path) -> None:
+    """Test that models under quoted keys are found in a directory."""
+    (tmp_path / "models.yaml").write_text(
+        "User:\n  fields:\n    name:\n      type: str\n"
+        '"Order":\n  fields:\n    buyer:\n      type: User\n'
+    )
+    models = SchemaLoader.load_all(str(tmp_path))
+
+    assert models["Order"].model_fields["buyer"].annotation is models["User"]
+
+
+def test_loading_a_model_reads_its_closure_only(schema_dir) -> None:
+    """Test that a lazy load parses the files the model depends on."""
+    directory = SchemaDirectory(schema_dir / "**" / "*.yaml")
+    models = SchemaLoader.load_lazy(str(schema_dir / "**" / "*.yaml"))
+
+    person = models["Person"](name="Ann", address={"city": "Rio"})
+
+    assert person.address.city == "Rio"
+    assert models.materialized == 2
+    assert models.definitions.parses == 2
+    assert directory.parses == 0
+
+
+def test_include_and_ref_pull_in_outside_files(tmp_path) -> None:
+    """Test that $include and $ref add files from outside the source."""
+    common = tmp_path / "common"
+    common.mkdir()
+    (common / "money.yaml").write_text(
+        "Price:\n  fields:\n    amount:\n      type: float\n"
+    )
+    (common / "tag.yaml").write_text("Tag:\n  fields:\n    label:\n      type: str\n")
+    app = tmp_path / "app"
+    app.mkdir()
+    (app / "item.yaml").write_text(
+        "$include: ../common/tag.yaml\n"
+        "Item:\n"
+        "  fields:\n"
+        "    price:\n"
+        "      $ref: ../common/money.yaml#/Price\n"
+        "    tags:\n"
+        "      type: list[Tag]\n"
+    )
+
+    models = SchemaLoader.load_lazy(str(app))
+    item = models["Item"](price={"amount": 2.5}, tags=[{"label": "new"}])
+
+    assert item.price.amount == 2.5
+    assert item.tags[0].label == "new"
+    assert set(models) == {"Item", "Price", "Tag"}
+
+
+def test_duplicate_models_are_rejected(schema_dir) -> None:
+    """Test that a model defined in two files is an error."""
+    (schema_dir / "again.yaml").write_text("Address:\n  fields: {}\n")
+
+    with pytest.raises(ValueError, match="Address is defined in both"):
+        _ = SchemaDirectory(schema_dir).index
+
+
+def test_refresh_rereads_changed_files_only(schema_dir) -> None:
+    """Test that the per-file cache keeps the files that did not change."""
+    directory = SchemaDirectory(schema_dir)
+    directory.definitions()
+    parses = directory.parses
+
+    (schema_dir / "address.yaml").write_text(
+        "Address:\n  fields:\n    zip:\n      type: str\n"
+    )
+    changed = directory.refresh()
+
+    assert changed == {(schema_dir / "address.yaml").resolve()}
+    assert directory.generation == 1
+    assert "zip" in directory["Address"]["fields"]
+    assert directory.parses == parses + 1
+
+
+def test_load_refreshes_directory_once(schema_dir, monkeypatch) -> None:
+    """Test that loading a changed directory scans its files once."""
+    SchemaLoader.load(str(schema_dir), "Address")
+    (schema_dir / "address.yaml").write_text(
+        "Address:\n  fields:\n    zip:\n      type: str\n"
+    )
+    refresh = SchemaDirectory.refresh
+    calls = []
+
+    def counted_refresh(self):
+        calls.append(self)
+        return refresh(self)
+
+    monkeypatch.setattr(SchemaDirectory, "refresh", counted_refresh)
+    address = SchemaLoader.load(str(schema_dir), "Address")
+
+    assert len(calls) == 1
+    assert "zip" in address.model_fields
+
+
+def test_load_all_dicts_merges_directory(schema_dir) -> None:
+    """Test that a directory source merges every file."""
+    definitions = SchemaLoader.load_all_dicts(str(schema_dir))
+
+    assert set(definitions) == {"Address", "Order", "Person", "Unused"}
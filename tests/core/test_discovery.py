@@ -0,0 +1,87 @@
+"""Tests for the lazy discovery of components."""
+
+import decimal
+import fractions
+import importlib.metadata
+import subprocess
+import sys
+
+import pytest
+
+from yaml2pydantic.core.discovery import ComponentIndex, component_index
+from yaml2pydantic.core.serializers import SerializerRegistry
+from yaml2pydantic.core.type_registry import TypeRegistry
+from yaml2pydantic.core.validators import ValidatorRegistry
+
+COLD_START = """
+import sys
+from yaml2pydantic import ModelFactory, serializers, types, validators
+
+factory = ModelFactory(types, validators, serializers)
+assert not any(m.startswith("yaml2pydantic.components.") for m in sys.modules)
+factory.build_all({"Account": {"fields": {"balance": {"type": "Money"}}}})
+assert "yaml2pydantic.components.types.money" in sys.modules
+assert "yaml2pydantic.components.types.monthyear" not in sys.modules
+assert "yaml2pydantic.components.validators.numeric" not in sys.modules
+"""
+
+
+def test_components_are_imported_on_first_use() -> None:
+    """Test that a factory imports only the components its schema uses."""
+    subprocess.run([sys.executable, "-c", COLD_START], check=True)
+
+
+def test_index_loads_targets() -> None:
+    """Test that an indexed name is imported from its module."""
+    index = ComponentIndex({"types": {"Decimal": "decimal:Decimal"}}, discover=False)
+    index.add("types", "Fraction", "fractions")
+
+    assert index.load("types", "Decimal") is decimal.Decimal
+    assert index.load("types", "Fraction") is fractions.Fraction
+    assert index.load("types", "Complex") is None
+
+
+def test_entry_points_are_read_once(monkeypatch) -> None:
+    """Test that entry points are read once, for names missing from the manifest."""
+    calls = []
+
+    def entry_points(group):
+        calls.append(group)
+        if group != "yaml2pydantic.types":
+            return []
+        return [importlib.metadata.EntryPoint("Fraction", "fractions:Fraction", group)]
+
+    monkeypatch.setattr(importlib.metadata, "entry_points", entry_points)
+    index = ComponentIndex({"types": {"Decimal": "decimal:Decimal"}})
+
+    assert index.load("types", "Decimal") is decimal.Decimal
+    assert calls == []
+    assert index.load("types", "Fraction") is fractions.Fraction
+    assert index.load("types", "Complex") is None
+    assert len(calls) == 3
+
+
+def test_registries_resolve_indexed_components() -> None:
+    """Test that registries given an index import what they do not know."""
+    from yaml2pydantic.components.types.money import Money
+
+    types = TypeRegistry(component_index)
+    assert types.resolve("list[Money]") == list[Money]
+    assert types.custom_types["Money"] is Money
+    assert types.generation == 0
+
+    validators = ValidatorRegistry(component_index)
+    assert validators.lower(["check_positive"], int) == ({"gt": 0}, [])
+
+    serializers = SerializerRegistry(component_index)
+    assert serializers.chain_options(["to_upper"]) == {"return_type": str}
+
+
+def test_registries_without_index_do_not_import() -> None:
+    """Test that registries without an index only know registered names."""
+    with pytest.raises(KeyError):
+        TypeRegistry().resolve("Money")
+    with pytest.raises(KeyError):
+        ValidatorRegistry().get("check_positive")
+    with pytest.raises(KeyError):
+        SerializerRegistry(component_index).get("to_title")
@@ -1,5 +1,8 @@
 """Tests for the schema loader module."""
 
+import threading
+import time
+
 import pytest
 from pydantic import BaseModel
 
@@ -163,6 +166,25 @@ def test_build_model_with_serializers(model_factory):
     assert dump_data["email"] == "john@example.com"
 
 
+def test_build_model_with_chained_serializers(model_factory):
+    """Test that chained serializers run in order as one call."""
+    schema = {
+        "Tag": {
+            "fields": {
+                "label": {"type": "str", "serializers": ["to_upper", "to_lower"]},
+                "code": {"type": "str", "serializers": ["to_lower", "to_upper"]},
+            }
+        }
+    }
+
+    Tag = model_factory.build_all(schema)["Tag"]
+    tag = Tag(label="MiXed", code="MiXed")
+
+    assert tag.model_dump() == {"label": "mixed", "code": "MIXED"}
+    assert tag.model_dump_json() == '{"label":"mixed","code":"MIXED"}'
+    assert not any(name.startswith("serialize_") for name in vars(Tag))
+
+
 def test_build_nested_models(model_factory):
     """Test building models with nested model references."""
     schema = {
@@ -320,3 +342,321 @@ def test_build_model_with_model_validators(model_factory):
     # Test invalid case
     with pytest.raises(ValueError, match="Invalid name"):
         model(name="invalid")
+
+
+def test_build_all_out_of_order_definitions(model_factory):
+    """Test that models are built after the models they reference."""
+    schema = {
+        "Person": {
+            "fields": {
+                "name": {"type": "str"},
+                "address": {"type": "Optional[Address]", "default": None},
+            }
+        },
+        "Address": {"fields": {"street": {"type": "str"}}},
+    }
+
+    models = model_factory.build_all(schema)
+    person = models["Person"](name="John", address={"street": "Main St"})
+
+    assert isinstance(person.address, models["Address"])
+    assert model_factory.report.passes == 1
+    assert model_factory.report.groups == 2
+    assert set(model_factory.report.timings) == {"Person", "Address"}
+
+
+def test_build_all_self_referencing_model(model_factory):
+    """Test building a model that references itself."""
+    schema = {
+        "Node": {
+            "fields": {
+                "value": {"type": "int"},
+                "next": {"type": "Optional[Node]", "default": None},
+            }
+        }
+    }
+
+    models = model_factory.build_all(schema)
+    Node = models["Node"]
+    node = Node(value=1, next={"value": 2, "next": {"value": 3}})
+
+    assert isinstance(node.next, Node)
+    assert node.next.next.value == 3
+    assert model_factory.report.cycles == [["Node"]]
+
+
+def test_build_all_mutually_recursive_models(model_factory):
+    """Test building models that reference each other."""
+    schema = {
+        "Employee": {
+            "fields": {
+                "name": {"type": "str"},
+                "team": {"type": "Optional[Team]", "default": None},
+            }
+        },
+        "Team": {
+            "fields": {
+                "lead": {"type": "Employee"},
+            }
+        },
+    }
+
+    models = model_factory.build_all(schema)
+    Employee = models["Employee"]
+    Team = models["Team"]
+    employee = Employee(name="Ann", team={"lead": {"name": "Bob"}})
+
+    assert isinstance(employee.team, Team)
+    assert isinstance(employee.team.lead, Employee)
+    assert model_factory.types.resolve("Team") is Team
+    assert model_factory.report.rebuilds == 2
+
+
+def test_build_all_with_precomputed_plan(model_factory):
+    """Test that a precomputed plan skips the dependency analysis."""
+    schema = {
+        "Address": {"fields": {"street": {"type": "str"}}},
+        "Person": {"fields": {"address": {"type": "Address"}}},
+    }
+    plan = model_factory.plan(schema)
+
+    models = model_factory.build_all(schema, plan=plan)
+
+    assert model_factory.report.passes == 0
+    assert models["Person"](address={"street": "x"}).address.street == "x"
+
+
+def test_build_model_with_generic_field_types(model_factory):
+    """Test building models whose fields use generics and literals."""
+    schema = {
+        "Tag": {"fields": {"label": {"type": "str"}}},
+        "Post": {
+            "fields": {
+                "tags": {"type": "list[Tag]", "default": []},
+                "meta": {"type": "dict[str, int | None]", "default": {}},
+                "status": {"type": "Literal['draft', 'published']"},
+            }
+        },
+    }
+
+    models = model_factory.build_all(schema)
+    post = models["Post"](
+        tags=[{"label": "a"}], meta={"views": 3, "likes": None}, status="draft"
+    )
+
+    assert isinstance(post.tags[0], models["Tag"])
+    assert post.meta == {"views": 3, "likes": None}
+    with pytest.raises(ValueError):
+        models["Post"](status="archived")
+
+
+def test_build_model_with_non_ascii_literal(model_factory):
+    """Test that non-ASCII literal values are matched as written."""
+    model = model_factory.build_model(
+        "Order", {"fields": {"k": {"type": 'Literal["café", "naïve"]'}}}
+    )
+
+    assert model(k="café").k == "café"
+    with pytest.raises(ValueError):
+        model(k="cafe")
+
+
+def test_build_lazy_builds_only_dependencies(model_factory):
+    """Test that a lazy lookup builds the model and its dependencies only."""
+    schema = {
+        "Unused": {"fields": {"value": {"type": "str"}}},
+        "Address": {"fields": {"street": {"type": "str"}}},
+        "Person": {"fields": {"address": {"type": "Optional[Address]"}}},
+        "Company": {"fields": {"owner": {"type": "Person"}}},
+    }
+
+    models = model_factory.build_lazy(schema)
+
+    assert len(models) == 4
+    assert "Unused" in models
+    assert models.materialized == 0
+
+    Person = models["Person"]
+    assert models.materialized == 2
+    assert set(model_factory.models) == {"Person", "Address"}
+    assert isinstance(Person(address={"street": "x"}).address, models["Address"])
+
+    models["Company"]
+    assert models.materialized == 3
+    assert "Unused" not in model_factory.models
+    with pytest.raises(KeyError, match="Missing"):
+        models["Missing"]
+
+
+def test_build_lazy_resolves_cycles_on_demand(model_factory):
+    """Test that a lazy lookup builds a recursive group as a whole."""
+    schema = {
+        "Employee": {
+            "fields": {
+                "name": {"type": "str"},
+                "team": {"type": "Optional[Team]", "default": None},
+            }
+        },
+        "Team": {"fields": {"lead": {"type": "Employee"}}},
+        "Other": {"fields": {"value": {"type": "int"}}},
+    }
+
+    models = model_factory.build_lazy(schema)
+    employee = models["Employee"](name="Ann", team={"lead": {"name": "Bob"}})
+
+    assert isinstance(employee.team.lead, models["Employee"])
+    assert models.materialized == 2
+    assert models.report.cycles == [["Employee", "Team"]]
+
+
+def test_build_lazy_builds_once_across_threads(model_factory):
+    """Test that concurrent lookups of one model build it once."""
+    schema = {
+        "Address": {"fields": {"city": {"type": "str"}}},
+        "Person": {"fields": {"address": {"type": "Address"}}},
+    }
+    models = model_factory.build_lazy(schema)
+    results = []
+
+    def lookup() -> None:
+        results.append(models["Person"])
+
+    threads = [threading.Thread(target=lookup) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(results) == 8
+    assert all(model is results[0] for model in results)
+    assert models.report.groups == 2
+
+
+def test_build_lazy_lookup_survives_concurrent_rebuild(model_factory):
+    """Test a lookup racing a rebuild gets a model instead of a KeyError."""
+    models = model_factory.build_lazy({"Point": {"fields": {"x": {"type": "int"}}}})
+    old = models["Point"]
+    reader = threading.get_ident()
+    dropped = threading.Event()
+    materialize = models._materialize
+
+    def slow_materialize(name):
+        # The rebuild dropped the model and is about to build it again
+        dropped.set()
+        time.sleep(0.05)
+        materialize(name)
+
+    class Built(dict):
+        def __contains__(self, name):
+            found = super().__contains__(name)
+            if threading.get_ident() == reader and not dropped.is_set():
+                # The reader saw the model built: rebuild it before the lookup
+                threading.Thread(target=models.rebuild, args=[["Point"]]).start()
+                dropped.wait()
+            return found
+
+    models._materialize = slow_materialize
+    models._built = Built(models._built)
+    new = models["Point"]
+
+    assert new is models["Point"]
+    assert new is not old
+
+
+def test_build_model_lowers_native_validators(model_factory):
+    """Test that validators with a native equivalent run in pydantic-core."""
+
+    @model_factory.validators.validator(native={"gt": 0})
+    def strictly_positive(cls, value):
+        raise AssertionError("lowered validators are not called")
+
+    schema = {
+        "Item": {
+            "fields": {
+                "count": {"type": "int", "validators": ["strictly_positive"]},
+                "limit": {"type": "int", "gt": 5, "validators": ["positive"]},
+            }
+        }
+    }
+
+    Item = model_factory.build_all(schema)["Item"]
+
+    assert Item(count=1, limit=6).count == 1
+    with pytest.raises(ValueError, match="greater than 0"):
+        Item(count=0, limit=6)
+    assert not hasattr(Item, "validate_count_strictly_positive")
+    assert hasattr(Item, "validate_limit_positive")
+
+
+def test_build_all_with_workers_matches_serial_build(
+    type_registry, validator_registry, serializer_registry
+):
+    """Test that a parallel build yields the models of a serial build."""
+    schema = {
+        f"Model{i}": {
+            "fields": {
+                "value": {"type": "int", "validators": ["positive"]},
+                "previous": {"type": f"Optional[Model{i - 3}]" if i >= 3 else "str"},
+            }
+        }
+        for i in range(30)
+    }
+    schema["Node"] = {"fields": {"children": {"type": "list[Node]"}}}
+    serial = ModelFactory(type_registry, validator_registry, serializer_registry)
+    parallel = ModelFactory(type_registry, validator_registry, serializer_registry)
+
+    expected = serial.build_all(schema)
+    models = parallel.build_all(schema, workers=4)
+
+    assert list(models) == list(expected)
+    assert list(parallel.report.timings) == list(serial.report.timings)
+    assert parallel.report.cycles == [["Node"]]
+    assert parallel.report.groups == serial.report.groups
+    instance = models["Model9"](value=1, previous={"value": 2, "previous": None})
+    assert isinstance(instance.previous, models["Model6"])
+    with pytest.raises(ValueError):
+        models["Model0"](value=-1, previous="x")
+
+
+def test_deferred_build_is_completed_by_finalize(
+    type_registry, validator_registry, serializer_registry
+):
+    """Test that deferred models are completed in one pass by finalize."""
+    schema = {
+        "Address": {"fields": {"city": {"type": "str"}}},
+        "Person": {
+            "fields": {
+                "address": {"type": "Address", "default": {"city": "Paris"}},
+                "friends": {"type": "list[Person]", "default": []},
+            }
+        },
+        "Company": {"fields": {"seat": {"type": "Address"}}},
+    }
+    factory = ModelFactory(
+        type_registry, validator_registry, serializer_registry, defer_build=True
+    )
+    models = factory.build_all(schema)
+
+    assert not models["Company"].__pydantic_complete__
+    factory.finalize()
+    assert all(model.__pydantic_complete__ for model in models.values())
+    person = models["Person"](friends=[{}])
+    assert person.friends[0].address.city == "Paris"
+    assert models["Company"](seat={"city": "Rome"}).seat.city == "Rome"
+
+
+def test_deferred_build_can_finalize_in_background(
+    type_registry, validator_registry, serializer_registry
+):
+    """Test that models can be used while they are finalized in background."""
+    schema = {f"Model{i}": {"fields": {"value": {"type": "int"}}} for i in range(20)}
+    factory = ModelFactory(
+        type_registry, validator_registry, serializer_registry, defer_build=True
+    )
+    models = factory.build_all(schema)
+
+    thread = factory.finalize(background=True)
+    assert models["Model19"](value=1).value == 1
+    thread.join()
+    assert all(model.__pydantic_complete__ for model in models.values())
+    assert factory.finalize() is None
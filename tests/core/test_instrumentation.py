@@ -0,0 +1,152 @@
+"""Tests for the instrumentation of model building."""
+
+import json
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import yaml
+
+from yaml2pydantic.core import instrumentation as instrumentation_module
+from yaml2pydantic.core.factory import ModelFactory
+from yaml2pydantic.core.instrumentation import Instrumentation, ModelTiming
+from yaml2pydantic.core.loader import SchemaLoader
+from yaml2pydantic.core.serializers import SerializerRegistry
+from yaml2pydantic.core.type_registry import TypeRegistry
+from yaml2pydantic.core.validators import ValidatorRegistry
+
+SCHEMA = {
+    "Address": {"fields": {"city": {"type": "str", "serializers": ["upper"]}}},
+    "Person": {
+        "fields": {
+            "age": {"type": "int", "validators": ["positive", "even"]},
+            "address": {"type": "Address", "default": {"city": "Paris"}},
+        },
+        "validators": ["complete"],
+    },
+    "Node": {"fields": {"children": {"type": "list[Node]", "default": []}}},
+}
+
+
+def _factory(instrumentation: Instrumentation | None) -> ModelFactory:
+    """Create a factory with a few components, lowered or not."""
+    validators = ValidatorRegistry()
+    serializers = SerializerRegistry()
+
+    @validators.validator(native={"gt": 0})
+    def positive(cls, value):
+        return value
+
+    @validators.validator
+    def even(cls, value):
+        return value
+
+    @validators.validator
+    def complete(self):
+        return self
+
+    @serializers.serializer
+    def upper(value):
+        return value.upper()
+
+    return ModelFactory(TypeRegistry(), validators, serializers, instrumentation)
+
+
+def test_build_records_phases_and_models() -> None:
+    """Test that building records a span per phase and per model."""
+    instrumentation = Instrumentation()
+    _factory(instrumentation).build_all(SCHEMA)
+
+    assert set(instrumentation.phases) == {
+        "plan",
+        "resolve",
+        "defaults",
+        "validators",
+        "serializers",
+        "create",
+        "rebuild",
+    }
+    assert set(instrumentation.models) == {"Address", "Person", "Node"}
+    assert "rebuild" in instrumentation.models["Node"].phases
+    assert "rebuild" not in instrumentation.models["Person"].phases
+
+
+def test_build_counts_components() -> None:
+    """Test that the components attached to each model are counted."""
+    instrumentation = Instrumentation()
+    _factory(instrumentation).build_all(SCHEMA)
+
+    person = instrumentation.models["Person"]
+    assert (person.fields, person.validators, person.lowered) == (2, 2, 1)
+    assert person.serializers == 0
+    assert instrumentation.models["Address"].serializers == 1
+    assert person.builds == 1
+
+
+def test_report_lists_most_expensive_models() -> None:
+    """Test that the report is sorted by time and JSON-serializable."""
+    instrumentation = Instrumentation()
+    _factory(instrumentation).build_all(SCHEMA)
+
+    report = json.loads(instrumentation.to_json(n=2))
+    assert report["models"] == 3
+    assert len(report["top"]) == 2
+    assert report["top"][0]["total"] >= report["top"][1]["total"]
+    assert report["top"][0]["name"] == instrumentation.top(1)[0].name
+    assert (
+        instrumentation.format(n=1)
+        .splitlines()[-1]
+        .startswith(report["top"][0]["name"])
+    )
+
+
+def test_spans_reach_callback_and_logging(caplog) -> None:
+    """Test that spans are forwarded to the callback and to logging."""
+    spans = []
+    instrumentation = Instrumentation(
+        callback=lambda *span: spans.append(span), log_level=logging.INFO
+    )
+    with caplog.at_level(logging.INFO, "yaml2pydantic.core.instrumentation"):
+        _factory(instrumentation).build_all({"Tag": SCHEMA["Address"]})
+
+    assert ("create", "Tag") in {(phase, model) for phase, model, _ in spans}
+    assert all(elapsed >= 0 for _, _, elapsed in spans)
+    assert any(record.message.startswith("create Tag") for record in caplog.records)
+
+
+def test_loader_times_parsing(tmp_path) -> None:
+    """Test that an instrumented load times parsing and bypasses the memo."""
+    path = tmp_path / "schema.yaml"
+    path.write_text(yaml.dump({"Tag": {"fields": {"label": {"type": "str"}}}}))
+    Tag = SchemaLoader.load(str(path), "Tag")
+
+    instrumentation = Instrumentation()
+    assert (
+        SchemaLoader.load(str(path), "Tag", instrumentation=instrumentation) is not Tag
+    )
+    assert "parse" in instrumentation.phases
+    assert "Tag" in instrumentation.models
+    assert SchemaLoader.load(str(path), "Tag") is Tag
+
+
+def test_model_timings_are_created_once_across_threads(monkeypatch) -> None:
+    """Test threads building the same model share one timing record."""
+
+    def slow_timing(*args: Any) -> ModelTiming:
+        time.sleep(0.01)
+        return ModelTiming(*args)
+
+    monkeypatch.setattr(instrumentation_module, "ModelTiming", slow_timing)
+    instrumentation = Instrumentation()
+    barrier = threading.Barrier(4)
+
+    def fetch(_: int) -> ModelTiming:
+        barrier.wait()
+        return instrumentation.model("Person")
+
+    with ThreadPoolExecutor(4) as pool:
+        timings = list(pool.map(fetch, range(4)))
+
+    assert all(timing is instrumentation.models["Person"] for timing in timings)
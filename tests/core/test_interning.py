@@ -0,0 +1,130 @@
+"""Tests for sharing identical models between factories."""
+
+import gc
+import threading
+
+from yaml2pydantic.core.factory import ModelFactory
+from yaml2pydantic.core.interning import ModelInterner
+from yaml2pydantic.core.profiling import Profiler
+from yaml2pydantic.core.serializers import SerializerRegistry
+from yaml2pydantic.core.type_registry import TypeRegistry
+from yaml2pydantic.core.validators import ValidatorRegistry
+
+SCHEMA = {
+    "Address": {"fields": {"city": {"type": "str", "min_length": 1}}},
+    "Customer": {
+        "fields": {
+            "address": {"type": "Address"},
+            "age": {"type": "int", "validators": ["adult"]},
+        }
+    },
+    "Node": {"fields": {"children": {"type": "list[Node]", "default": []}}},
+}
+
+
+def _registries() -> tuple[TypeRegistry, ValidatorRegistry, SerializerRegistry]:
+    """Create registries with an ``adult`` validator."""
+    validators = ValidatorRegistry()
+
+    @validators.validator
+    def adult(cls, value):
+        if value < 18:
+            raise ValueError("Must be an adult")
+        return value
+
+    return TypeRegistry(), validators, SerializerRegistry()
+
+
+def test_identical_definitions_share_models() -> None:
+    """Test that factories building the same definitions share the classes."""
+    interner = ModelInterner()
+    registries = _registries()
+    first = ModelFactory(*registries, interner=interner)
+    second = ModelFactory(*registries, interner=interner)
+    models = first.build_all(SCHEMA)
+    shared = second.build_all(SCHEMA)
+
+    assert shared["Address"] is models["Address"]
+    assert shared["Customer"] is models["Customer"]
+    assert second.report.shared == 2
+    assert (interner.hits, interner.misses, len(interner)) == (2, 2, 2)
+
+
+def test_cyclic_models_are_not_shared() -> None:
+    """Test that models built through forward references are never shared."""
+    interner = ModelInterner()
+    registries = _registries()
+    first = ModelFactory(*registries, interner=interner).build_all(SCHEMA)
+    second = ModelFactory(*registries, interner=interner).build_all(SCHEMA)
+
+    assert first["Node"] is not second["Node"]
+    assert second["Node"](children=[{"children": []}]).children[0].children == []
+
+
+def test_differences_prevent_sharing() -> None:
+    """Test that definitions or components differing yield distinct models."""
+    interner = ModelInterner()
+    models = ModelFactory(*_registries(), interner=interner).build_all(SCHEMA)
+
+    # Another function registered under the same name
+    other = ModelFactory(*_registries(), interner=interner).build_all(SCHEMA)
+    assert other["Address"] is models["Address"]
+    assert other["Customer"] is not models["Customer"]
+
+    changed = {"Address": {"fields": {"city": {"type": "str", "min_length": 2}}}}
+    registries = _registries()
+    assert (
+        ModelFactory(*registries, interner=interner).build_all(changed)["Address"]
+        is not models["Address"]
+    )
+    profiled = ModelFactory(*registries, profiler=Profiler(), interner=interner)
+    assert profiled.build_all(SCHEMA)["Address"] is not models["Address"]
+
+
+def test_field_order_prevents_sharing() -> None:
+    """Test that definitions listing the same fields in another order differ."""
+    interner = ModelInterner()
+    registries = _registries()
+    first = {
+        "Address": {"fields": {"street": {"type": "str"}, "city": {"type": "str"}}}
+    }
+    fields = first["Address"]["fields"]
+    second = {"Address": {"fields": dict(reversed(fields.items()))}}
+    models = ModelFactory(*registries, interner=interner).build_all(first)
+    other = ModelFactory(*registries, interner=interner).build_all(second)
+
+    assert other["Address"] is not models["Address"]
+    assert other["Address"](street="a", city="b").model_dump_json() == (
+        '{"city":"b","street":"a"}'
+    )
+
+
+def test_unused_models_are_dropped() -> None:
+    """Test that the table does not keep models alive."""
+    interner = ModelInterner()
+    models = ModelFactory(*_registries(), interner=interner).build_all(SCHEMA)
+    assert len(interner) == 2
+
+    del models
+    gc.collect()
+    assert len(interner) == 0
+
+
+def test_concurrent_factories_share_one_model() -> None:
+    """Test that factories racing to build a model end up sharing one."""
+    interner = ModelInterner()
+    registries = _registries()
+    results = []
+
+    def build() -> None:
+        factory = ModelFactory(*registries, interner=interner)
+        results.append(factory.build_all(SCHEMA)["Customer"])
+
+    threads = [threading.Thread(target=build) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(results) == 8
+    assert all(model is results[0] for model in results)
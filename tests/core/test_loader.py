@@ -1,13 +1,16 @@
 """Tests for the schema loader module."""
 
+import asyncio
 import json
 import tempfile
+import threading
+import time
 from pathlib import Path
 
 import pytest
 import yaml
 
-from yaml2pydantic.core.loader import SchemaLoader
+from yaml2pydantic.core.loader import SchemaLoader, SchemaMemo
 
 
 @pytest.fixture
@@ -98,3 +101,138 @@ class TestSchemaLoader:
         result = SchemaLoader.load(data, "schema1")
         assert hasattr(result, "__annotations__")
         assert result.__annotations__["value"] is str
+
+    def test_load_lazy_builds_on_access(self):
+        """Test that lazily loaded models are built on first access."""
+        data = {
+            "schema1": {"fields": {"value": {"type": "str"}}},
+            "schema2": {"fields": {"value": {"type": "int"}}},
+        }
+        models = SchemaLoader.load_lazy(data)
+        assert models.materialized == 0
+        assert models["schema2"].__annotations__["value"] is int
+        assert models.materialized == 1
+
+    def test_load_is_memoized(self, yaml_file):
+        """Test that repeated loads return the same model classes."""
+        first = SchemaLoader.load(str(yaml_file), "schema1")
+        assert SchemaLoader.load(str(yaml_file), "schema1") is first
+        assert SchemaLoader.load_all(str(yaml_file))["schema1"] is first
+
+        SchemaLoader.invalidate(str(yaml_file))
+        assert SchemaLoader.load(str(yaml_file), "schema1") is not first
+
+    def test_load_memo_tracks_file_changes(self, yaml_file):
+        """Test that editing a schema file rebuilds its models."""
+        first = SchemaLoader.load(str(yaml_file), "schema1")
+        yaml_file.write_text(yaml.dump({"schema1": {"fields": {"n": {"type": "int"}}}}))
+
+        second = SchemaLoader.load(str(yaml_file), "schema1")
+
+        assert second is not first
+        assert second.__annotations__["n"] is int
+
+    def test_concurrent_loads_share_one_entry(self, yaml_file, monkeypatch):
+        """Test that threads loading one schema get the same models."""
+        SchemaLoader.invalidate(str(yaml_file))
+        parse = SchemaLoader.load_all_dicts
+
+        def slow_parse(source):
+            time.sleep(0.01)
+            return parse(source)
+
+        monkeypatch.setattr(SchemaLoader, "load_all_dicts", slow_parse)
+        barrier = threading.Barrier(8)
+        results = []
+
+        def load() -> None:
+            barrier.wait()
+            results.append(SchemaLoader.load_lazy(str(yaml_file)))
+
+        threads = [threading.Thread(target=load) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(results) == 8
+        assert all(models is results[0] for models in results)
+
+    def test_aload_does_not_block_the_loop(self, yaml_file):
+        """Test that async loads run off the loop and share the memo."""
+        SchemaLoader.invalidate(str(yaml_file))
+        ticks = []
+
+        async def tick() -> None:
+            while True:
+                ticks.append(None)
+                await asyncio.sleep(0)
+
+        async def load():
+            ticker = asyncio.create_task(tick())
+            models = await SchemaLoader.aload_all(str(yaml_file))
+            model = await SchemaLoader.aload(str(yaml_file), "schema2")
+            ticker.cancel()
+            return models, model
+
+        models, model = asyncio.run(load())
+
+        assert ticks
+        assert model is models["schema2"]
+        assert SchemaLoader.load(str(yaml_file), "schema2") is model
+        with pytest.raises(KeyError):
+            asyncio.run(SchemaLoader.aload(str(yaml_file), "missing"))
+
+    def test_concurrent_aloads_share_classes(self, tmp_path, monkeypatch):
+        """Test that gathered async loads of one schema see the same classes."""
+        path = tmp_path / "schema.yaml"
+        path.write_text(
+            yaml.dump(
+                {
+                    "Address": {"fields": {"city": {"type": "str"}}},
+                    "User": {"fields": {"address": {"type": "Address"}}},
+                }
+            )
+        )
+        parse = SchemaLoader.load_all_dicts
+
+        def slow_parse(source):
+            time.sleep(0.01)
+            return parse(source)
+
+        monkeypatch.setattr(SchemaLoader, "load_all_dicts", slow_parse)
+
+        async def load():
+            return await asyncio.gather(
+                SchemaLoader.aload(str(path), "Address"),
+                SchemaLoader.aload(str(path), "User"),
+                SchemaLoader.aload_all(str(path)),
+            )
+
+        address, user, models = asyncio.run(load())
+
+        assert user.model_fields["address"].annotation is address
+        assert models["Address"] is address
+        assert models["User"] is user
+
+    def test_memo_keeps_held_locks_on_eviction(self):
+        """Test that evicting a schema being loaded keeps its lock."""
+        memo = SchemaMemo(max_entries=1)
+        models = SchemaLoader.load_lazy({"A": {"fields": {}}})
+        entered = threading.Event()
+
+        def load() -> None:
+            with memo.lock("a"):
+                entered.set()
+
+        with memo.lock("a"):
+            memo.put("a", (0,), models)
+            memo.put("b", (0,), models)
+            thread = threading.Thread(target=load)
+            thread.start()
+            assert not entered.wait(0.05)
+        thread.join()
+
+        assert entered.is_set()
+        assert len(memo) == 1
+        assert memo._locks == {}
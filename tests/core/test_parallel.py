@@ -0,0 +1,92 @@
+"""Tests for parallel validation across processes."""
+
+import asyncio
+import multiprocessing
+
+import pytest
+
+from yaml2pydantic.core.parallel import ParallelValidator, schema_key
+
+SCHEMA = {
+    "Address": {"fields": {"city": {"type": "str"}}},
+    "Person": {
+        "fields": {
+            "name": {"type": "str", "min_length": 1},
+            "age": {"type": "int", "ge": 0},
+            "address": {"type": "Optional[Address]", "default": None},
+        }
+    },
+}
+
+
+def _records(count):
+    return [
+        {"name": f"p{i}", "age": -1 if i % 7 == 0 else i, "address": {"city": "Rio"}}
+        for i in range(count)
+    ]
+
+
+def test_schema_key_is_content_based(tmp_path) -> None:
+    """Test that the key depends on the schema content only."""
+    first = tmp_path / "a.json"
+    second = tmp_path / "b.json"
+    first.write_text('{"A": {"fields": {}}}')
+    second.write_text('{"A": {"fields": {}}}')
+
+    assert schema_key(str(first)) == schema_key(str(second))
+    assert schema_key(SCHEMA) == schema_key(dict(reversed(SCHEMA.items())))
+
+
+@pytest.mark.parametrize("start_method", ["fork", "spawn"])
+def test_parallel_validation_is_ordered(start_method) -> None:
+    """Test that chunks come back in order as instances of local classes."""
+    context = multiprocessing.get_context(start_method)
+    records = _records(50)
+
+    with ParallelValidator(
+        SCHEMA, "Person", workers=2, chunk_size=6, mp_context=context
+    ) as validator:
+        result = validator.validate_all(records)
+
+    Person = validator.model
+    assert [p.name for p in result.valid] == [
+        r["name"] for r in records if r["age"] >= 0
+    ]
+    assert all(isinstance(p, Person) for p in result.valid)
+    assert all(isinstance(p.address, validator.models["Address"]) for p in result.valid)
+    assert [e.index for e in result.errors] == list(range(0, 50, 7))
+    assert result.errors[1].record == records[7]
+    assert result.valid[0] == Person(**records[1])
+
+
+def test_parallel_validation_streams_chunks() -> None:
+    """Test that results are produced chunk by chunk."""
+    with ParallelValidator(SCHEMA, "Person", workers=1, chunk_size=10) as validator:
+        sizes = [len(r.valid) + len(r.errors) for r in validator.validate(_records(25))]
+
+    assert sizes == [10, 10, 5]
+
+
+def test_parallel_validation_of_async_streams() -> None:
+    """Test that an async stream is validated in order across the workers."""
+    records = _records(25)
+
+    async def produce():
+        for record in records:
+            yield record
+
+    async def validate(validator):
+        return [result async for result in validator.avalidate(produce())]
+
+    with ParallelValidator(SCHEMA, "Person", workers=2, chunk_size=10) as validator:
+        results = asyncio.run(validate(validator))
+
+    assert [len(r.valid) + len(r.errors) for r in results] == [10, 10, 5]
+    assert [e.index for r in results for e in r.errors] == list(range(0, 25, 7))
+    assert all(isinstance(p, validator.model) for r in results for p in r.valid)
+
+
+def test_parallel_validator_rejects_bad_chunk_size() -> None:
+    """Test that the chunk size must be positive."""
+    with pytest.raises(ValueError):
+        ParallelValidator(SCHEMA, "Person", chunk_size=0)
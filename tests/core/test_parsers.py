@@ -0,0 +1,68 @@
+"""Tests for the schema parser backends."""
+
+import pytest
+import yaml
+
+from yaml2pydantic.core.loader import SchemaLoader
+from yaml2pydantic.core.parsers import (
+    YAML_LOADER,
+    ParserRegistry,
+    parse_json,
+    parse_yaml,
+    parse_yaml_python,
+    parsers,
+)
+
+DOCUMENT = {"User": {"fields": {"name": {"type": "str", "default": "x"}}}}
+
+
+def test_yaml_backends_agree() -> None:
+    """Test that the C and pure-Python YAML loaders give the same result."""
+    data = yaml.dump(DOCUMENT).encode()
+
+    assert parse_yaml(data) == parse_yaml_python(data) == DOCUMENT
+
+
+def test_yaml_prefers_libyaml() -> None:
+    """Test that the C loader is used when PyYAML provides it."""
+    assert YAML_LOADER is getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def test_default_formats() -> None:
+    """Test the backend selected for each supported format."""
+    assert parsers.get(".yaml") is parse_yaml
+    assert parsers.get(".yml") is parse_yaml
+    assert parsers.get(".json") is parse_json
+    with pytest.raises(ValueError, match="Unsupported file format"):
+        parsers.get(".txt")
+
+
+def test_custom_backend_is_used_by_loader(tmp_path) -> None:
+    """Test that the loader parses files with the selected backend."""
+    registry = ParserRegistry()
+    calls = []
+
+    def parse(data: bytes):
+        calls.append(data)
+        return parse_json(data)
+
+    registry.register("tracing", parse)
+    with pytest.raises(KeyError):
+        registry.use("missing", [".json"])
+    registry.use("tracing", [".json"])
+
+    assert registry.get(".json") is parse
+
+    parsers.register("tracing", parse)
+    parsers.use("tracing", [".json"])
+    try:
+        path = tmp_path / "schema.json"
+        path.write_text('{"Thing": {"fields": {"n": {"type": "int"}}}}')
+        assert SchemaLoader.load_all_dicts(str(path)) == {
+            "Thing": {"fields": {"n": {"type": "int"}}}
+        }
+    finally:
+        parsers.use("json", [".json"])
+        del parsers.backends["tracing"]
+
+    assert len(calls) == 1
@@ -0,0 +1,123 @@
+"""Tests for profiling of validators and serializers."""
+
+import json
+import threading
+
+import pytest
+from pydantic import ValidationError
+
+from yaml2pydantic.core.factory import ModelFactory
+from yaml2pydantic.core.profiling import Profiler
+from yaml2pydantic.core.serializers import SerializerRegistry
+from yaml2pydantic.core.type_registry import TypeRegistry
+from yaml2pydantic.core.validators import ValidatorRegistry
+
+SCHEMA = {
+    "Person": {
+        "fields": {
+            "name": {
+                "type": "str",
+                "validators": ["stripped"],
+                "serializers": ["upper", "exclaim"],
+            },
+            "age": {"type": "int", "validators": ["positive", "adult"]},
+        },
+        "validators": ["complete"],
+    }
+}
+
+
+def _factory(profiler: Profiler | None) -> ModelFactory:
+    """Create a factory with field and model validators and serializers."""
+    validators = ValidatorRegistry()
+    serializers = SerializerRegistry()
+
+    @validators.validator
+    def stripped(cls, value):
+        return value.strip()
+
+    @validators.validator(native={"gt": 0})
+    def positive(cls, value):
+        return value
+
+    @validators.validator
+    def adult(cls, value):
+        if value < 18:
+            raise ValueError("Must be an adult")
+        return value
+
+    @validators.validator
+    def complete(self):
+        return self
+
+    @serializers.serializer
+    def upper(value, _info=None):
+        return value.upper()
+
+    @serializers.serializer
+    def exclaim(value):
+        return f"{value}!"
+
+    return ModelFactory(TypeRegistry(), validators, serializers, profiler=profiler)
+
+
+def test_profiler_counts_calls_time_and_failures() -> None:
+    """Test that each attached component is profiled per model and field."""
+    profiler = Profiler()
+    Person = _factory(profiler).build_all(SCHEMA)["Person"]
+
+    person = Person(name=" ada ", age=36)
+    assert person.model_dump() == {"name": "ADA!", "age": 36}
+    with pytest.raises(ValidationError):
+        Person(name="bob", age=12)
+
+    stats = {(s.model, s.field, s.component): s for s in profiler.stats()}
+    assert set(stats) == {
+        ("Person", "name", "stripped"),
+        ("Person", "age", "adult"),
+        ("Person", None, "complete"),
+        ("Person", "name", "upper"),
+        ("Person", "name", "exclaim"),
+    }
+    assert stats["Person", "name", "stripped"].calls == 2
+    assert stats["Person", "age", "adult"].calls == 2
+    assert stats["Person", "age", "adult"].failures == 1
+    assert stats["Person", None, "complete"].calls == 1
+    assert stats["Person", "name", "upper"].calls == 1
+    assert all(s.total_time >= 0 for s in stats.values())
+
+
+def test_profiler_merges_threads_and_resets() -> None:
+    """Test that calls from several threads are merged, and can be reset."""
+    profiler = Profiler()
+    Person = _factory(profiler).build_all(SCHEMA)["Person"]
+
+    def validate() -> None:
+        for _ in range(50):
+            Person(name="ada", age=36)
+
+    threads = [threading.Thread(target=validate) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    stats = {(s.field, s.component): s for s in profiler.stats()}
+    assert stats["age", "adult"].calls == 200
+
+    dumped = json.loads(profiler.dump())
+    assert {"model", "field", "component", "calls", "mean_time"} <= dumped[0].keys()
+    assert "Person.age" in profiler.format()
+
+    profiler.reset()
+    assert profiler.stats() == []
+
+
+def test_unprofiled_factory_attaches_components_unwrapped() -> None:
+    """Test that a factory without profiler attaches the functions themselves."""
+    factory = _factory(None)
+    Person = factory.build_all(SCHEMA)["Person"]
+
+    decorators = Person.__pydantic_decorators__.field_validators
+    adult = factory.validators.get("adult")
+    assert any(d.func.__func__ is adult for d in decorators.values())
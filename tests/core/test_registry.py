@@ -68,3 +68,34 @@ def test_registry_error_handling() -> None:
 
     with pytest.raises(KeyError):
         types.resolve("nonexistent_type")
+
+
+def test_registry_generation_counts_rebinds() -> None:
+    """Test that only rebinding a name bumps a registry's generation."""
+    from typing import ForwardRef
+
+    from yaml2pydantic.core.type_registry import TypeRegistry
+    from yaml2pydantic.core.validators import ValidatorRegistry
+
+    registry = TypeRegistry()
+    registry.register("Thing", ForwardRef("Thing"), track=False)
+    registry.register("Thing", int, track=False)
+    registry.register("Thing", int)
+    assert registry.generation == 0
+    registry.register("Thing", str)
+    assert registry.generation == 1
+
+    validators_ = ValidatorRegistry()
+
+    def check(value: int) -> int:
+        return value
+
+    validators_.validator(check)
+    validators_.validator(check)
+    assert validators_.generation == 0
+
+    def check(value: int) -> int:
+        return -value
+
+    validators_.validator(check)
+    assert validators_.generation == 1
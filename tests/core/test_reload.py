@@ -0,0 +1,87 @@
+"""Tests for hot reload of schema files."""
+
+import os
+import threading
+
+import yaml
+
+from yaml2pydantic.core.loader import SchemaLoader
+
+SCHEMA = {
+    "Address": {"fields": {"city": {"type": "str"}}},
+    "Person": {"fields": {"address": {"type": "Address"}}},
+    "Tag": {"fields": {"label": {"type": "str"}}},
+}
+
+
+def _write(path, data) -> None:
+    """Write a schema and move its mtime forward, so the change is seen."""
+    path.write_text(yaml.dump(data))
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+
+def test_reload_rebuilds_changed_models_and_dependents(tmp_path) -> None:
+    """Test that a reload only rebuilds the edited model and its dependents."""
+    path = tmp_path / "schema.yaml"
+    _write(path, SCHEMA)
+    watcher = SchemaLoader.watch(str(path))
+    models = watcher.models
+    Address, Person, Tag = models["Address"], models["Person"], models["Tag"]
+
+    assert watcher.check() == []
+
+    edited = {**SCHEMA, "Address": {"fields": {"zip": {"type": "str"}}}}
+    _write(path, edited)
+
+    assert watcher.check() == ["Address", "Person"]
+    assert models["Tag"] is Tag
+    assert models["Address"] is not Address
+    assert models["Person"] is not Person
+    assert models["Person"](address={"zip": "1"}).address.zip == "1"
+
+
+def test_reload_directory_reparses_changed_files(tmp_path) -> None:
+    """Test that a directory reload reads the changed files only."""
+    _write(tmp_path / "address.yaml", {"Address": SCHEMA["Address"]})
+    _write(tmp_path / "person.yaml", {"Person": SCHEMA["Person"]})
+    _write(tmp_path / "tag.yaml", {"Tag": SCHEMA["Tag"]})
+    reloaded = []
+    watcher = SchemaLoader.watch(str(tmp_path), on_reload=reloaded.append)
+    models = watcher.models
+    Address, Person = models["Address"], models["Person"]
+    directory = models.definitions
+    parses = directory.parses
+
+    _write(
+        tmp_path / "person.yaml", {"Person": {"fields": {"home": {"type": "Address"}}}}
+    )
+    _write(tmp_path / "tag.yaml", {"Tag": {"fields": {"name": {"type": "str"}}}})
+
+    assert watcher.check() == ["Person"]
+    assert reloaded == [["Person"]]
+    # Tag was never built, so its file is not read until it is needed
+    assert directory.parses == parses + 1
+    assert models["Address"] is Address
+    assert models["Person"] is not Person
+    assert "home" in models["Person"].model_fields
+
+
+def test_reload_from_background_thread(tmp_path) -> None:
+    """Test that the background thread picks up changes."""
+    path = tmp_path / "schema.yaml"
+    _write(path, SCHEMA)
+    done = threading.Event()
+    watcher = SchemaLoader.watch(
+        str(path), interval=0.01, on_reload=lambda _: done.set()
+    )
+    watcher.models["Tag"]
+
+    watcher.start()
+    try:
+        _write(path, {**SCHEMA, "Tag": {"fields": {"name": {"type": "str"}}}})
+        assert done.wait(5)
+    finally:
+        watcher.stop()
+
+    assert "name" in watcher.models["Tag"].model_fields
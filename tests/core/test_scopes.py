@@ -0,0 +1,191 @@
+"""Tests for layered and frozen registries."""
+
+import subprocess
+import sys
+import threading
+
+import pytest
+
+import yaml2pydantic
+from yaml2pydantic.core.discovery import component_index
+from yaml2pydantic.core.factory import ModelFactory
+from yaml2pydantic.core.scopes import FrozenRegistryError
+from yaml2pydantic.core.serializers import SerializerRegistry, serializer_registry
+from yaml2pydantic.core.type_registry import TypeRegistry
+from yaml2pydantic.core.validators import ValidatorRegistry, validator_registry
+
+
+class Celsius(float):
+    pass
+
+
+class Kelvin(float):
+    pass
+
+
+def test_shared_registries_are_unified() -> None:
+    """Test that the package exposes the registries the loader uses."""
+    assert yaml2pydantic.types is yaml2pydantic.core.type_registry.types
+    assert yaml2pydantic.validators is validator_registry
+    assert yaml2pydantic.serializers is serializer_registry
+
+
+def test_child_sees_parent_and_keeps_its_own() -> None:
+    """Test that registering into a child leaves the parent untouched."""
+    base = TypeRegistry()
+    base.register("Temperature", Celsius)
+    child = base.child()
+    child.register("Reading", Kelvin)
+
+    assert child.resolve("list[Temperature]") == list[Celsius]
+    assert child.resolve("Reading") is Kelvin
+    assert base.find("Reading") is None
+    with pytest.raises(KeyError):
+        base.resolve("Reading")
+
+    child.register("Temperature", Kelvin)
+    assert child.resolve("Temperature") is Kelvin
+    assert base.resolve("Temperature") is Celsius
+    assert (child.generation, base.generation) == (1, 0)
+
+
+def test_child_cache_follows_parent_rebinds() -> None:
+    """Test that a parent rebinding a name refreshes its children."""
+    base = TypeRegistry()
+    base.register("Temperature", Celsius)
+    child = base.child()
+    assert child.resolve("Optional[Temperature]") == Celsius | None
+
+    base.register("Temperature", Kelvin)
+    assert child.generation == 1
+    assert child.resolve("Optional[Temperature]") == Kelvin | None
+
+
+def test_child_components_fall_back_on_parent() -> None:
+    """Test that validators and serializers are looked up in parents."""
+    validators = ValidatorRegistry()
+    serializers = SerializerRegistry()
+
+    @validators.validator(native={"gt": 0})
+    def positive(cls, value):
+        return value
+
+    @serializers.serializer(when_used="json")
+    def upper(value):
+        return value.upper()
+
+    child_validators = validators.child()
+    child_serializers = serializers.child()
+    assert child_validators.get("positive") is positive
+    assert child_validators.lower(["positive"], int) == ({"gt": 0}, [])
+    assert child_serializers.chain_options(["upper"]) == {"when_used": "json"}
+    assert child_serializers.plain_serializer(["upper"]).func is upper
+
+
+def test_frozen_registries_reject_registrations() -> None:
+    """Test that a frozen registry is read-only, and its children are not."""
+    types = TypeRegistry().freeze()
+    validators = ValidatorRegistry().freeze()
+    serializers = SerializerRegistry().freeze()
+
+    with pytest.raises(FrozenRegistryError):
+        types.register("Temperature", Celsius)
+    with pytest.raises(FrozenRegistryError):
+        validators.validator(lambda cls, value: value)
+    with pytest.raises(FrozenRegistryError):
+        serializers.serializer(str)
+
+    child = types.child()
+    child.register("Temperature", Celsius)
+    assert child.resolve("Temperature") is Celsius
+
+
+def test_frozen_root_imports_without_registering() -> None:
+    """Test that a frozen registry still resolves indexed components."""
+    from yaml2pydantic.components.types.money import Money
+
+    types = TypeRegistry(component_index).freeze()
+    assert types.child().resolve("Money") is Money
+    assert types.custom_types == {}
+    assert ValidatorRegistry(component_index).freeze().get("check_positive")
+
+
+FROZEN_SCRIPT = """
+from yaml2pydantic import SchemaLoader, serializers, types, validators
+from yaml2pydantic.core.scopes import FrozenRegistryError
+
+for registry in (types, validators, serializers):
+    registry.freeze()
+schema = {
+    "Account": {
+        "fields": {
+            "name": {"type": "str", "validators": ["non_empty"],
+                     "serializers": ["to_upper"]},
+            "balance": {"type": "Money", "serializers": ["money_as_string"]},
+            "since": {"type": "MonthYear"},
+            "age": {"type": "int", "validators": ["check_positive"]},
+        }
+    }
+}
+account = SchemaLoader.load(schema, "Account")(
+    name="ann", balance={"amount": 10}, since="03/2025", age=3
+)
+assert account.model_dump()["name"] == "ANN"
+assert types.custom_types == {} and validators.validators == {}
+assert serializers.serializers == {}
+try:
+    types.register("Other", int)
+except FrozenRegistryError:
+    pass
+else:
+    raise AssertionError("registered into a frozen registry")
+"""
+
+
+def test_frozen_shared_registries_import_components() -> None:
+    """Test that the frozen global registries import self-registering modules."""
+    result = subprocess.run(
+        [sys.executable, "-c", FROZEN_SCRIPT], capture_output=True, text=True
+    )
+    assert result.returncode == 0, result.stderr
+
+
+def test_factory_builds_into_its_own_scope() -> None:
+    """Test that a factory does not register its models in the given registry."""
+    types = TypeRegistry()
+    factory = ModelFactory(types, ValidatorRegistry(), SerializerRegistry())
+    factory.build_all({"Node": {"fields": {"children": {"type": "list[Node]"}}}})
+
+    assert factory.types.find("Node") is factory.models["Node"]
+    assert types.custom_types == {}
+
+
+def test_concurrent_tenants_do_not_share_models() -> None:
+    """Test that builds over a shared frozen base do not see each other."""
+    base = TypeRegistry()
+    base.register("Temperature", float)
+    base.freeze()
+    validators = ValidatorRegistry().freeze()
+    serializers = SerializerRegistry().freeze()
+    results: dict[int, type] = {}
+
+    def build(tenant: int) -> None:
+        schema = {
+            "Reading": {"fields": {f"value{tenant}": {"type": "Temperature"}}},
+            "Report": {"fields": {"reading": {"type": "Reading"}}},
+        }
+        for _ in range(20):
+            factory = ModelFactory(base, validators, serializers)
+            results[tenant] = factory.build_all(schema)["Report"]
+
+    threads = [threading.Thread(target=build, args=(i,)) for i in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(results) == 4
+    for tenant, Report in results.items():
+        reading = Report.model_fields["reading"].annotation
+        assert list(reading.model_fields) == [f"value{tenant}"]
+    assert base.custom_types == {"Temperature": float}
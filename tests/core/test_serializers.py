@@ -51,3 +51,41 @@ def test_serializer_error_handling() -> None:
     registry = SerializerRegistry()
     with pytest.raises(KeyError, match="nonexistent_serializer"):
         registry.get("nonexistent_serializer")
+
+
+def test_plain_serializer_composes_chain_once() -> None:
+    """Test that a chain of serializers becomes one shared PlainSerializer."""
+    registry = SerializerRegistry()
+
+    @registry.serializer
+    def strip(value: str) -> str:
+        return value.strip()
+
+    @registry.serializer(return_type=str)
+    def shout(value: str) -> str:
+        return value.upper() + "!"
+
+    serializer = registry.plain_serializer(["strip", "shout"])
+
+    assert serializer.func(" hi ") == "HI!"
+    assert serializer.return_type is str
+    assert serializer.when_used == "always"
+    assert registry.plain_serializer(["strip", "shout"]) is serializer
+    assert registry.plain_serializer(["strip"]).func is strip
+
+
+def test_plain_serializer_rejects_mixed_modes() -> None:
+    """Test that serializers applying in different modes cannot be chained."""
+    registry = SerializerRegistry()
+
+    @registry.serializer(when_used="json")
+    def to_text(value: int) -> str:
+        return str(value)
+
+    @registry.serializer
+    def identity(value: str) -> str:
+        return value
+
+    assert registry.plain_serializer(["to_text"]).when_used == "json"
+    with pytest.raises(ValueError, match="different modes"):
+        registry.plain_serializer(["to_text", "identity"])
@@ -0,0 +1,73 @@
+"""Tests for the type expression parser."""
+
+import pytest
+
+from yaml2pydantic.core.type_expressions import (
+    Constant,
+    Name,
+    Subscript,
+    UnionOf,
+    names,
+    parse_type,
+)
+
+
+def test_parse_name() -> None:
+    """Test parsing a plain type name."""
+    assert parse_type("str") == Name("str")
+    assert parse_type("  Address ") == Name("Address")
+
+
+def test_parse_nested_generics() -> None:
+    """Test parsing subscripted generics."""
+    assert parse_type("dict[str, list[Address]]") == Subscript(
+        "dict", (Name("str"), Subscript("list", (Name("Address"),)))
+    )
+
+
+def test_parse_union_operator() -> None:
+    """Test parsing unions written with |."""
+    assert parse_type("int | str | None") == UnionOf(
+        (Name("int"), Name("str"), Constant(None))
+    )
+    assert parse_type("list[int | None]") == Subscript(
+        "list", (UnionOf((Name("int"), Constant(None))),)
+    )
+
+
+def test_parse_literal_values() -> None:
+    """Test parsing the literal values of Literal[...]."""
+    assert parse_type("Literal['a', \"b\", 1, -2.5, True]") == Subscript(
+        "Literal",
+        (Constant("a"), Constant("b"), Constant(1), Constant(-2.5), Constant(True)),
+    )
+
+
+def test_parse_non_ascii_and_escaped_literals() -> None:
+    """Test that string literals keep non-ASCII text and decode escapes."""
+    assert parse_type('Literal["café", "a\\"b", \'\\n\']') == Subscript(
+        "Literal", (Constant("café"), Constant('a"b'), Constant("\n"))
+    )
+
+
+def test_parse_trailing_comma() -> None:
+    """Test that a trailing comma in a subscript is accepted."""
+    assert parse_type("tuple[int, str,]") == parse_type("tuple[int, str]")
+
+
+@pytest.mark.parametrize(
+    "source", ["", "list[", "list[int", "int |", "dict[str int]", "int]", "a$b"]
+)
+def test_parse_invalid_expressions(source) -> None:
+    """Test that malformed expressions are rejected."""
+    with pytest.raises(ValueError, match="Invalid type expression"):
+        parse_type(source)
+
+
+def test_names_skip_literal_values() -> None:
+    """Test that literal values are not reported as names."""
+    assert names(parse_type("Optional[Literal['User']] | Address")) == {
+        "Optional",
+        "Literal",
+        "Address",
+    }
@@ -1,4 +1,5 @@
 from datetime import datetime
+from typing import Any, Literal
 
 import pytest
 
@@ -67,3 +68,90 @@ def test_optional_type_error_handling() -> None:
     registry = TypeRegistry()
     with pytest.raises(KeyError, match="nonexistent_type"):
         registry.resolve("Optional[nonexistent_type]")
+
+
+def test_generic_type_resolution() -> None:
+    """Test resolution of builtin generics, unions and literals."""
+    registry = TypeRegistry()
+
+    class Address:
+        pass
+
+    registry.register("Address", Address)
+
+    assert registry.resolve("list[int]") == list[int]
+    assert registry.resolve("dict[str, list[Address]]") == dict[str, list[Address]]
+    assert registry.resolve("int | str | None") == int | str | None
+    assert registry.resolve("Union[int, str]") == int | str
+    assert registry.resolve("List[str]") == list[str]
+    assert registry.resolve("Literal['a', 1]") == Literal["a", 1]
+    assert registry.resolve("Optional[list[Address]]") == list[Address] | None
+
+
+def test_type_resolution_is_cached() -> None:
+    """Test that repeated resolutions are served from the cache."""
+    registry = TypeRegistry()
+    registry.register("Address", int)
+
+    first = registry.resolve("Optional[Address]")
+    assert "Optional[Address]" in registry._cache
+    assert registry.resolve("Optional[Address]") is first
+
+
+def test_register_invalidates_dependent_expressions() -> None:
+    """Test that re-registering a name refreshes the expressions using it."""
+    registry = TypeRegistry()
+    registry.register("Address", int)
+    assert registry.resolve("list[Address]") == list[int]
+    assert registry.resolve("Optional[str]") == str | None
+
+    registry.register("Address", str)
+
+    assert "list[Address]" not in registry._cache
+    assert "Optional[str]" in registry._cache
+    assert registry.resolve("list[Address]") == list[str]
+
+
+def test_resolution_racing_a_registration_is_not_cached() -> None:
+    """Test an expression resolved while its name is rebound is not cached."""
+    registry = TypeRegistry()
+    registry.register("Address", int)
+    convert = registry._convert
+
+    def rebinding_convert(expression: Any) -> Any:
+        resolved = convert(expression)
+        registry.register("Address", str)
+        return resolved
+
+    registry._convert = rebinding_convert  # type: ignore[method-assign]
+    assert registry.resolve("list[Address]") == list[int]
+    registry._convert = convert  # type: ignore[method-assign]
+
+    assert "list[Address]" not in registry._cache
+    assert registry.resolve("list[Address]") == list[str]
+
+
+def test_type_cache_is_bounded() -> None:
+    """Test that the resolution cache evicts the least recently used entries."""
+    registry = TypeRegistry()
+    registry.CACHE_SIZE = 2
+    registry.resolve("list[int]")
+    registry.resolve("list[str]")
+    registry.resolve("list[int]")
+    registry.resolve("list[float]")
+
+    assert list(registry._cache) == ["list[int]", "list[float]"]
+    assert registry._dependents == {
+        "list": {"list[int]", "list[float]"},
+        "int": {"list[int]"},
+        "float": {"list[float]"},
+    }
+
+
+def test_invalid_literal_usage() -> None:
+    """Test that literal values outside Literal[...] are rejected."""
+    registry = TypeRegistry()
+    with pytest.raises(ValueError):
+        registry.resolve("list['a']")
+    with pytest.raises(ValueError):
+        registry.resolve("Literal[int]")
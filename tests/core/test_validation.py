@@ -0,0 +1,278 @@
+"""Tests for bulk record validation."""
+
+import asyncio
+import gc
+import json
+import weakref
+
+import pytest
+
+from yaml2pydantic.core.factory import ModelFactory
+from yaml2pydantic.core.loader import SchemaLoader
+from yaml2pydantic.core.serializers import SerializerRegistry
+from yaml2pydantic.core.type_registry import TypeRegistry
+from yaml2pydantic.core.validation import (
+    avalidate_stream,
+    batched,
+    gc_paused,
+    json_list_adapter,
+    list_adapter,
+    tolerant_list_adapter,
+    validate_batch,
+    validate_json_lines,
+    validate_many,
+)
+from yaml2pydantic.core.validators import ValidatorRegistry
+
+SCHEMA = {
+    "Address": {"fields": {"city": {"type": "str"}}},
+    "Person": {
+        "fields": {
+            "name": {"type": "str", "min_length": 1},
+            "age": {"type": "int", "ge": 0},
+            "address": {"type": "Optional[Address]", "default": None},
+        }
+    },
+}
+
+RECORDS = [
+    {"name": "Ann", "age": 30},
+    {"name": "", "age": 30},
+    {"name": "Bob", "age": 40, "address": {"city": "Rio"}},
+    {"name": "Cid", "age": -1, "address": {}},
+    {"name": "Dan", "age": 50},
+]
+
+
+@pytest.fixture
+def person():
+    """Load the Person model."""
+    return SchemaLoader.load(SCHEMA, "Person")
+
+
+def test_batched_splits_records() -> None:
+    """Test that records are split into bounded batches."""
+    assert list(batched(range(5), 2)) == [[0, 1], [2, 3], [4]]
+    with pytest.raises(ValueError):
+        list(batched([], 0))
+
+
+def test_list_adapter_is_cached(person) -> None:
+    """Test that the adapter is built once per model."""
+    assert list_adapter(person) is list_adapter(person)
+
+
+def test_list_adapters_do_not_keep_models_alive() -> None:
+    """Test that a model is collected with its cached adapters."""
+    factory = ModelFactory(TypeRegistry(), ValidatorRegistry(), SerializerRegistry())
+    model = factory.build_all({"Point": {"fields": {"x": {"type": "int"}}}})["Point"]
+    list_adapter(model)
+    tolerant_list_adapter(model)
+    json_list_adapter(model)
+    assert list_adapter(model) is list_adapter(model)
+
+    reference = weakref.ref(model)
+    del factory, model
+    gc.collect()
+    assert reference() is None
+
+
+@pytest.mark.parametrize("batch_size", [1, 2, 1000])
+def test_validate_many_collects_per_row_errors(person, batch_size) -> None:
+    """Test that invalid rows are reported without stopping validation."""
+    result = validate_many(person, RECORDS, batch_size=batch_size)
+
+    assert [p.name for p in result.valid] == ["Ann", "Bob", "Dan"]
+    assert all(isinstance(p, person) for p in result.valid)
+    assert [e.index for e in result.errors] == [1, 3]
+    assert [d["loc"] for d in result.errors[0].errors] == [("name",)]
+    assert sorted(d["loc"] for d in result.errors[1].errors) == [
+        ("address", "city"),
+        ("age",),
+    ]
+
+
+def test_validate_many_matches_per_row_validation(person) -> None:
+    """Test that batched results equal validating each row on its own."""
+    result = validate_many(person, RECORDS, batch_size=2)
+
+    expected = []
+    for record in RECORDS:
+        try:
+            expected.append(person(**record))
+        except ValueError:
+            pass
+    assert result.valid == expected
+
+
+def test_validate_many_from_factory_by_name() -> None:
+    """Test the factory entry point, which accepts model names."""
+    factory = ModelFactory(TypeRegistry(), ValidatorRegistry(), SerializerRegistry())
+    factory.build_all(SCHEMA)
+
+    result = factory.validate_many("Person", iter(RECORDS))
+
+    assert len(result.valid) == 3
+    assert len(result.errors) == 2
+
+
+def test_validate_batch_tolerant_matches_plain(person) -> None:
+    """Test that the tolerant adapter reports the same outcome."""
+    plain = validate_batch(person, RECORDS, offset=10)
+    tolerant = validate_batch(person, RECORDS, offset=10, tolerant=True)
+
+    assert plain.valid == tolerant.valid
+    assert [e.index for e in plain.errors] == [11, 13]
+    assert plain.errors == tolerant.errors
+
+
+def test_gc_paused_restores_collector_state() -> None:
+    """Test that pausing the collector leaves it as it was."""
+    assert gc.isenabled()
+    with gc_paused():
+        assert not gc.isenabled()
+        with gc_paused():
+            assert not gc.isenabled()
+        assert not gc.isenabled()
+    assert gc.isenabled()
+
+    with gc_paused(enabled=False):
+        assert gc.isenabled()
+
+
+@pytest.mark.parametrize("batch_size", [1, 2, 1000])
+def test_validate_json_lines(person, batch_size) -> None:
+    """Test streaming validation of raw JSON lines."""
+    lines = [json.dumps(record) + "\n" for record in RECORDS]
+    lines.insert(2, "\n")
+    lines.append("{broken\n")
+
+    results = list(validate_json_lines(person, iter(lines), batch_size))
+
+    valid = [p for result in results for p in result.valid]
+    errors = [e for result in results for e in result.errors]
+    assert [p.name for p in valid] == ["Ann", "Bob", "Dan"]
+    assert [e.index for e in errors] == [1, 4, 6]
+    assert errors[0].record == lines[1].encode()
+    assert errors[-1].errors[0]["type"] == "json_invalid"
+    assert len(results) == -(-6 // batch_size)
+
+
+@pytest.mark.parametrize(
+    "lines",
+    [
+        ['{"name": "Ann", "age": 1}, {"name": "Bob", "age": 2}'],
+        ['{"name": "Cid"', '"age": 3}'],
+    ],
+)
+def test_validate_json_lines_keeps_line_boundaries(person, lines) -> None:
+    """Test that documents are never merged or split across lines."""
+    lines = [*lines, '{"name": "Dan", "age": 4}']
+    results = list(validate_json_lines(person, lines))
+
+    assert [p.name for p in results[0].valid] == ["Dan"]
+    assert [e.index for e in results[0].errors] == list(range(len(lines) - 1))
+
+
+def test_validate_json_lines_is_lazy(person) -> None:
+    """Test that lines are consumed one batch at a time."""
+    consumed = []
+
+    def lines():
+        for i in range(10):
+            consumed.append(i)
+            yield f'{{"name": "p{i}", "age": {i}}}'
+
+    results = validate_json_lines(person, lines(), batch_size=4)
+    first = next(results)
+
+    assert len(first.valid) == 4
+    assert consumed == [0, 1, 2, 3]
+
+
+async def _produce(records, consumed=None):
+    """Yield records asynchronously, noting how many were taken."""
+    for record in records:
+        if consumed is not None:
+            consumed.append(record)
+        yield record
+
+
+def _collect(stream):
+    async def collect():
+        return [result async for result in stream]
+
+    return asyncio.run(collect())
+
+
+@pytest.mark.parametrize(("batch_size", "concurrency"), [(1, 1), (2, 2), (2, 8)])
+def test_avalidate_stream_matches_validate_many(
+    person, batch_size, concurrency
+) -> None:
+    """Test that async results come back in order with stream positions."""
+    results = _collect(
+        avalidate_stream(
+            person, _produce(RECORDS), batch_size=batch_size, concurrency=concurrency
+        )
+    )
+    expected = validate_many(person, RECORDS)
+
+    sizes = [len(r.valid) + len(r.errors) for r in results]
+    assert sizes[0] == batch_size
+    assert sum(sizes) == len(RECORDS)
+    assert [p for r in results for p in r.valid] == expected.valid
+    assert [e.index for r in results for e in r.errors] == [1, 3]
+
+
+def test_avalidate_stream_validates_json(person) -> None:
+    """Test that raw JSON documents are validated from their text."""
+    lines = [json.dumps(record) for record in RECORDS[:3]] + [b"{bad"]
+    results = _collect(avalidate_stream(person, _produce(lines), json=True))
+
+    assert [p.name for p in results[0].valid] == ["Ann", "Bob"]
+    assert [(e.index, e.record) for e in results[0].errors] == [
+        (1, lines[1].encode()),
+        (3, b"{bad"),
+    ]
+
+
+def test_avalidate_stream_applies_backpressure(person) -> None:
+    """Test that no record is taken while the in-flight limit is reached."""
+    consumed = []
+    records = RECORDS * 10
+
+    async def first_result():
+        stream = avalidate_stream(
+            person, _produce(records, consumed), batch_size=2, concurrency=3
+        )
+        result = await anext(stream)
+        await stream.aclose()
+        return result
+
+    result = asyncio.run(first_result())
+
+    assert len(result.valid) + len(result.errors) == 2
+    assert len(consumed) == 6
+
+
+def test_avalidate_stream_rejects_bad_arguments(person) -> None:
+    """Test that the batch size and the concurrency must be positive."""
+    with pytest.raises(ValueError):
+        _collect(avalidate_stream(person, _produce(RECORDS), batch_size=0))
+    with pytest.raises(ValueError):
+        _collect(avalidate_stream(person, _produce(RECORDS), concurrency=0))
+
+
+def test_avalidate_stream_leaves_the_collector_running(person) -> None:
+    """Test that the threaded async path does not pause the collector."""
+    states = []
+
+    async def produce():
+        for record in RECORDS:
+            states.append(gc.isenabled())
+            yield record
+
+    _collect(avalidate_stream(person, produce(), batch_size=1, concurrency=4))
+
+    assert all(states)
+    assert gc.isenabled()
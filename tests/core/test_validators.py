@@ -69,3 +69,40 @@ def test_multiple_validators() -> None:
     assert registry.get("is_positive")(-5) is False
     assert registry.get("is_even")(4) is True
     assert registry.get("is_even")(5) is False
+
+
+def test_lower_splits_native_and_python_validators() -> None:
+    """Test that validators with a native equivalent are lowered."""
+    registry = ValidatorRegistry()
+
+    @registry.validator(native={"gt": 0})
+    def positive(cls, value):
+        return value
+
+    @registry.validator(native=lambda t: {"min_length": 1} if t is str else None)
+    def filled(value):
+        return value
+
+    @registry.validator
+    def custom(value):
+        return value
+
+    assert registry.lower(["positive", "custom"], int) == ({"gt": 0}, ["custom"])
+    assert registry.lower(["filled"], str) == ({"min_length": 1}, [])
+    assert registry.lower(["filled"], int) == ({}, ["filled"])
+    # The field's own constraint wins, so the validator stays in Python
+    assert registry.lower(["positive"], int, {"gt": 5}) == ({}, ["positive"])
+
+
+def test_native_equivalent_follows_the_function() -> None:
+    """Test that another registry lowers a function declared elsewhere."""
+    first = ValidatorRegistry()
+    second = ValidatorRegistry()
+
+    @first.validator(native={"gt": 0})
+    def positive(cls, value):
+        return value
+
+    second.validator(positive)
+
+    assert second.lower(["positive"], int) == ({"gt": 0}, [])
@@ -0,0 +1,48 @@
+from benchmarks.suite import HIGHER_IS_BETTER, Scenario, compare, run_scenario
+from benchmarks.synthetic import make_records, make_schema, model_name
+from yaml2pydantic import ModelFactory, serializers, types, validators
+
+
+def test_synthetic_records_match_schema() -> None:
+    """Test generated payloads are valid against the generated schema."""
+    schema = make_schema(width=12, depth=3, trees=2)
+    assert len(schema) == 6
+
+    models = ModelFactory(types, validators, serializers).build_all(schema)
+    root = models[model_name(0, 0)]
+    for record in make_records(width=12, depth=3, count=5):
+        instance = root.model_validate(record)
+        assert instance.child.child.field0 == record["child"]["child"]["field0"]
+
+
+def test_run_scenario_reports_every_metric() -> None:
+    """Test a scenario measures each metric the baseline is compared on."""
+    results = run_scenario(Scenario(width=3, depth=2, trees=1, records=5), repeat=1)
+    assert results.keys() == HIGHER_IS_BETTER.keys()
+    assert all(value > 0 for value in results.values())
+
+
+def test_compare_flags_regressions_only() -> None:
+    """Test regressions are flagged in the direction of each metric."""
+    baseline = {"narrow": {"compile_ms": 100.0, "validate_per_s": 1000.0}}
+
+    assert (
+        compare({"narrow": {"compile_ms": 50.0, "validate_per_s": 2000.0}}, baseline)
+        == []
+    )
+    assert (
+        compare({"narrow": {"compile_ms": 120.0, "validate_per_s": 900.0}}, baseline)
+        == []
+    )
+
+    regressions = compare(
+        {
+            "narrow": {"compile_ms": 200.0, "validate_per_s": 500.0},
+            "new": {"peak_mb": 1.0},
+        },
+        baseline,
+    )
+    assert [r.split(":")[0] for r in regressions] == [
+        "narrow.compile_ms",
+        "narrow.validate_per_s",
+    ]
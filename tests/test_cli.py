@@ -0,0 +1,117 @@
+"""Tests for the command line interface."""
+
+import importlib.util
+import io
+import json
+import sys
+
+import pytest
+import yaml
+
+from yaml2pydantic.cli import main
+
+SCHEMA = {
+    "Point": {
+        "fields": {
+            "x": {"type": "int"},
+            "y": {"type": "int", "default": 0},
+        }
+    }
+}
+
+
+@pytest.fixture
+def schema(tmp_path):
+    """Write the test schema to a YAML file."""
+    path = tmp_path / "schema.yaml"
+    path.write_text(yaml.dump(SCHEMA))
+    return path
+
+
+def test_compile(schema, tmp_path, capsys) -> None:
+    """Test the compile command."""
+    output = tmp_path / "points.py"
+
+    assert main(["compile", str(schema), "-o", str(output)]) == 0
+    spec = importlib.util.spec_from_file_location("points", output)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    assert module.Point(x="3").x == 3
+
+    assert main(["compile", str(schema)]) == 0
+    assert "class Point(BaseModel):" in capsys.readouterr().out
+
+
+def test_validate(schema, tmp_path) -> None:
+    """Test that valid and invalid rows go to separate sinks."""
+    data = tmp_path / "points.ndjson"
+    data.write_text('{"x": 1}\n\n{"x": "a"}\n{"x": 2, "y": 3}\nnot json\n')
+    valid = tmp_path / "valid.ndjson"
+    invalid = tmp_path / "invalid.ndjson"
+
+    code = main(
+        [
+            "validate",
+            "--schema",
+            str(schema),
+            "--model",
+            "Point",
+            str(data),
+            "--valid-out",
+            str(valid),
+            "--invalid-out",
+            str(invalid),
+            "--batch-size",
+            "2",
+        ]
+    )
+
+    assert code == 1
+    assert [json.loads(line) for line in valid.read_text().splitlines()] == [
+        {"x": 1, "y": 0},
+        {"x": 2, "y": 3},
+    ]
+    errors = [json.loads(line) for line in invalid.read_text().splitlines()]
+    assert [e["line"] for e in errors] == [3, 5]
+    assert errors[0]["record"] == '{"x": "a"}'
+    assert errors[0]["errors"][0]["loc"] == ["x"]
+    assert errors[1]["errors"][0]["type"] == "json_invalid"
+
+
+def test_validate_all_valid_from_stdin(schema, monkeypatch, capsys) -> None:
+    """Test validating rows read from stdin."""
+    stdin = io.TextIOWrapper(io.BytesIO(b'{"x": 1}\n{"x": 2}\n'))
+    monkeypatch.setattr(sys, "stdin", stdin)
+
+    assert main(["validate", "-s", str(schema), "-m", "Point"]) == 0
+    assert capsys.readouterr().out.splitlines() == ['{"x":1,"y":0}', '{"x":2,"y":0}']
+
+
+def test_validate_unknown_model(schema, tmp_path, capsys) -> None:
+    """Test an unknown model is reported without a traceback."""
+    data = tmp_path / "points.ndjson"
+    data.write_text('{"x": 1}\n')
+
+    assert main(["validate", "-s", str(schema), "-m", "Line", str(data)]) == 2
+    error = capsys.readouterr().err
+    assert error.splitlines() == [
+        f"yaml2pydantic: error: {schema}: unknown name 'Line'"
+    ]
+
+
+@pytest.mark.parametrize("missing", ["input", "schema"])
+def test_validate_missing_file(schema, tmp_path, capsys, missing) -> None:
+    """Test a missing input or schema file is reported without a traceback."""
+    data = tmp_path / "points.ndjson"
+    data.write_text('{"x": 1}\n')
+    absent = tmp_path / "absent.yaml"
+    if missing == "input":
+        data = absent
+    else:
+        schema = absent
+
+    assert main(["validate", "-s", str(schema), "-m", "Point", str(data)]) == 2
+    error = capsys.readouterr().err
+    assert error.splitlines() == [
+        f"yaml2pydantic: error: {absent}: No such file or directory"
+    ]
@@ -5,6 +5,7 @@ import yaml
 
 from yaml2pydantic import serializers, types, validators
 from yaml2pydantic.components.types.money import Money
+from yaml2pydantic.components.types.monthyear import MonthYear
 from yaml2pydantic.core.factory import ModelFactory
 
 
@@ -75,7 +76,7 @@ def test_model_creation() -> None:
     assert user1.email == "alice@example.com"
     assert user1.birthday == datetime(1993, 4, 1, 0, 0, 0)
     assert user1.balance.amount == 100
-    assert user1.start_date == "04/2025"
+    assert user1.start_date == MonthYear("04/2025")
     assert user1.address.street == "Unknown"
     assert user1.address.city == "Unknown"
     assert user1.address.zip == "00000"
@@ -104,7 +105,7 @@ def test_model_creation_with_dict() -> None:
     assert user2.email == "alice@example.com"
     assert user2.birthday == datetime(1993, 4, 1, 0, 0, 0)
     assert user2.balance.amount == 100
-    assert user2.start_date == "04/2025"
+    assert user2.start_date == MonthYear("04/2025")
 
 
 def test_model_validation() -> None:
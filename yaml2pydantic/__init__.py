@@ -2,11 +2,12 @@ __version__ = "0.1.0"
 
 from .core.factory import ModelFactory as ModelFactory
 from .core.loader import SchemaLoader as SchemaLoader
+from .core.registry import FrozenRegistryError as FrozenRegistryError
 from .core.registry import SerializerRegistry as SerializerRegistry
 from .core.registry import TypeRegistry as TypeRegistry
 from .core.registry import ValidatorRegistry as ValidatorRegistry
 
-# Create registry instances
-types = TypeRegistry()
-serializers = SerializerRegistry()
-validators = ValidatorRegistry()
+# The shared registries, also used by SchemaLoader and the CLI
+from .core.serializers import serializer_registry as serializers  # noqa: F401
+from .core.type_registry import types as types
+from .core.validators import validator_registry as validators  # noqa: F401
@@ -0,0 +1,7 @@
+"""Allow running the command line interface with ``python -m yaml2pydantic``."""
+
+import sys
+
+from yaml2pydantic.cli import main
+
+sys.exit(main())
@@ -0,0 +1,217 @@
+"""Command line interface for yaml2pydantic.
+
+Available commands:
+- ``compile``: generate a static Python module from a schema
+- ``validate``: validate a stream of JSON lines against a model
+"""
+
+import argparse
+import importlib
+import json
+import sys
+from collections.abc import Sequence
+from contextlib import ExitStack
+from pathlib import Path
+from typing import IO
+
+from yaml2pydantic.core.factory import ModelFactory
+from yaml2pydantic.core.loader import SchemaLoader
+from yaml2pydantic.core.serializers import serializer_registry
+from yaml2pydantic.core.type_registry import types
+from yaml2pydantic.core.validation import (
+    DEFAULT_BATCH_SIZE,
+    RecordError,
+    validate_json_lines,
+)
+from yaml2pydantic.core.validators import validator_registry
+
+
+def _import_components(component_modules: Sequence[str]) -> None:
+    """Import the user's modules, registering their components globally."""
+    for module in component_modules:
+        importlib.import_module(module)
+
+
+def _factory(component_modules: Sequence[str]) -> ModelFactory:
+    """Create a factory after importing the user's component modules."""
+    _import_components(component_modules)
+    return ModelFactory(types, validator_registry, serializer_registry)
+
+
+def _fail(message: str) -> int:
+    """Report an error that stops a command before it can run.
+
+    Args:
+    ----
+        message: A one-line description of the error
+
+    Returns:
+    -------
+        The process exit code for usage errors
+
+    """
+    sys.stderr.write(f"yaml2pydantic: error: {message}\n")
+    return 2
+
+
+def compile_command(args: argparse.Namespace) -> int:
+    """Write the static module for a schema.
+
+    Args:
+    ----
+        args: The parsed command line arguments
+
+    Returns:
+    -------
+        The process exit code
+
+    """
+    definitions = SchemaLoader.load_all_dicts(args.schema)
+    source = _factory(args.component).emit_source(definitions)
+    if args.output is None:
+        sys.stdout.write(source)
+    else:
+        Path(args.output).write_text(source)
+    return 0
+
+
+def _open_sink(stack: ExitStack, path: str | None, default: IO[str]) -> IO[str]:
+    """Open an output file, or use the default stream when none is given."""
+    if path is None or path == "-":
+        return default
+    return stack.enter_context(open(path, "w"))
+
+
+def _error_line(error: RecordError) -> str:
+    """Describe an invalid line as a JSON document."""
+    record = error.record
+    if isinstance(record, bytes):
+        record = record.decode(errors="replace").rstrip("\r\n")
+    errors = [
+        {"loc": list(detail["loc"]), "msg": detail["msg"], "type": detail["type"]}
+        for detail in error.errors
+    ]
+    return json.dumps({"line": error.index + 1, "errors": errors, "record": record})
+
+
+def validate_command(args: argparse.Namespace) -> int:
+    """Validate JSON lines, writing valid and invalid rows to separate sinks.
+
+    Args:
+    ----
+        args: The parsed command line arguments
+
+    Returns:
+    -------
+        0 if every row was valid, 1 if some were not, 2 if the schema,
+        model or files could not be used
+
+    """
+    _import_components(args.component)
+    try:
+        model = SchemaLoader.load(args.schema, args.model)
+    except KeyError as e:
+        return _fail(f"{args.schema}: unknown name {e.args[0]!r}")
+    except OSError as e:
+        return _fail(f"{args.schema}: {e.strerror or e}")
+
+    invalid = 0
+    with ExitStack() as stack:
+        try:
+            if args.input is None or args.input == "-":
+                source: IO[bytes] = sys.stdin.buffer
+            else:
+                source = stack.enter_context(open(args.input, "rb"))
+            valid_sink = _open_sink(stack, args.valid_out, sys.stdout)
+            invalid_sink = _open_sink(stack, args.invalid_out, sys.stderr)
+        except OSError as e:
+            return _fail(f"{e.filename}: {e.strerror or e}")
+
+        # The command is a single-threaded batch job: pausing the
+        # collector cannot stall anything else
+        results = validate_json_lines(model, source, args.batch_size, pause_gc=True)
+        for result in results:
+            for instance in result.valid:
+                valid_sink.write(instance.model_dump_json())
+                valid_sink.write("\n")
+            for error in result.errors:
+                invalid_sink.write(_error_line(error))
+                invalid_sink.write("\n")
+            invalid += len(result.errors)
+
+    return 1 if invalid else 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser for the command line interface.
+
+    Returns
+    -------
+        The argument parser
+
+    """
+    parser = argparse.ArgumentParser(
+        prog="yaml2pydantic", description="Convert YAML schemas to Pydantic models"
+    )
+    parser.add_argument(
+        "-c",
+        "--component",
+        action="append",
+        default=[],
+        metavar="MODULE",
+        help="import a module that registers custom components (repeatable)",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    compile_parser = commands.add_parser(
+        "compile", help="generate a static Python module from a schema"
+    )
+    compile_parser.add_argument("schema", help="YAML or JSON schema file")
+    compile_parser.add_argument(
+        "-o", "--output", help="file to write the module to (default: stdout)"
+    )
+    compile_parser.set_defaults(handler=compile_command)
+
+    validate_parser = commands.add_parser(
+        "validate", help="validate a stream of JSON lines against a model"
+    )
+    validate_parser.add_argument(
+        "input", nargs="?", help="JSON lines file (default: stdin)"
+    )
+    validate_parser.add_argument(
+        "-s", "--schema", required=True, help="YAML or JSON schema file"
+    )
+    validate_parser.add_argument(
+        "-m", "--model", required=True, help="name of the model to validate against"
+    )
+    validate_parser.add_argument(
+        "--valid-out", help="file for the valid rows (default: stdout)"
+    )
+    validate_parser.add_argument(
+        "--invalid-out", help="file for the invalid rows (default: stderr)"
+    )
+    validate_parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=DEFAULT_BATCH_SIZE,
+        help="rows validated per batch",
+    )
+    validate_parser.set_defaults(handler=validate_command)
+
+    return parser
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Run the command line interface.
+
+    Args:
+    ----
+        argv: The command line arguments, without the program name
+
+    Returns:
+    -------
+        The process exit code
+
+    """
+    args = build_parser().parse_args(argv)
+    return int(args.handler(args))
@@ -1,10 +1,22 @@
-import importlib
-from pathlib import Path
+"""Built-in schema components.
 
-MODULES = ["validators", "types", "serializers"]
+The modules of this package are imported when a schema first uses one of
+their components, not when the package is imported. ``MANIFEST`` maps the
+name of each component to the ``module:attribute`` defining it, per kind.
+"""
 
-for module in MODULES:
-    module_path = Path(__file__).parent / module
-    for file in module_path.glob("*.py"):
-        if file.stem != "__init__":
-            importlib.import_module(f"yaml2pydantic.components.{module}.{file.stem}")
+MANIFEST = {
+    "types": {
+        "Money": "yaml2pydantic.components.types.money:Money",
+        "MonthYear": "yaml2pydantic.components.types.monthyear:MonthYear",
+    },
+    "validators": {
+        "check_positive": "yaml2pydantic.components.validators.numeric:check_positive",
+        "non_empty": "yaml2pydantic.components.validators.string:non_empty",
+    },
+    "serializers": {
+        "money_as_string": "yaml2pydantic.components.serializers.money:money_as_string",
+        "to_lower": "yaml2pydantic.components.serializers.string:to_lower",
+        "to_upper": "yaml2pydantic.components.serializers.string:to_upper",
+    },
+}
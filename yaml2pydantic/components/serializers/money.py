@@ -4,7 +4,7 @@ from yaml2pydantic import serializers
 from yaml2pydantic.components.types.money import Money
 
 
-@serializers.serializer
+@serializers.serializer(return_type=str)
 def money_as_string(value: Money, _info: Any | None = None, **kwargs: Any) -> str:
     """Format a Money instance as a human-readable string.
 
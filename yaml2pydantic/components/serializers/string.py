@@ -5,7 +5,7 @@ from typing import Any
 from yaml2pydantic.core.serializers import serializer_registry
 
 
-@serializer_registry.serializer
+@serializer_registry.serializer(return_type=str)
 def to_upper(value: str, _info: Any | None = None, **kwargs: Any) -> str:
     """Convert a string to uppercase.
 
@@ -18,7 +18,7 @@ def to_upper(value: str, _info: Any | None = None, **kwargs: Any) -> str:
     return value.upper()
 
 
-@serializer_registry.serializer
+@serializer_registry.serializer(return_type=str)
 def to_lower(value: str, _info: Any | None = None, **kwargs: Any) -> str:
     """Convert a string to lowercase.
 
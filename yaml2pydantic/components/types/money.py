@@ -1,33 +1,149 @@
-"""Money type for handling currency values with cents precision."""
+"""Money type for handling currency values with cents precision.
 
-from pydantic import BaseModel, field_validator
+Money values are slotted dataclasses rather than Pydantic models:
+- Instances carry no per-instance ``__dict__`` or model bookkeeping
+- Inside a model, amounts and ``{"amount", "currency"}`` mappings are parsed,
+  and instances built and serialized, by pydantic-core
+- ``model_validate`` and ``model_dump`` are kept so code written against the
+  former ``BaseModel`` keeps working
+"""
 
+from dataclasses import dataclass
+from typing import Any, ClassVar
 
-class Money(BaseModel):
+from pydantic import GetCoreSchemaHandler, TypeAdapter
+from pydantic_core import core_schema
+
+DEFAULT_CURRENCY = "R$"
+
+
+def to_cents(value: float) -> int:
+    """Convert an amount in units to cents, rounding to the nearest cent.
+
+    Args:
+    ----
+        value: The amount in units
+
+    Returns:
+    -------
+        The amount in cents
+
+    """
+    return round(value * 100)
+
+
+@dataclass(slots=True)
+class Money:
     """A type for handling money values with cents precision.
 
     This class represents a monetary value with:
-    - amount: The value in cents (int)
+    - amount: The value in cents (int); floats are read as units
     - currency: The currency symbol (defaults to "R$")
+
+    In a model, a field of this type accepts a ``Money``, an amount or a
+    mapping with ``amount`` and an optional ``currency``.
     """
 
-    amount: int | float
-    currency: str = "R$"
+    amount: int
+    currency: str = DEFAULT_CURRENCY
+
+    _adapter: ClassVar[TypeAdapter["Money"] | None] = None
+
+    def __post_init__(self) -> None:
+        """Check the values and convert float amounts to cents.
+
+        Raises
+        ------
+            ValueError: If the amount is not a number or the currency not a string
+
+        """
+        if isinstance(self.amount, float):
+            self.amount = to_cents(self.amount)
+        elif not isinstance(self.amount, int) or isinstance(self.amount, bool):
+            raise ValueError(f"Invalid money amount: {self.amount!r}")
+        if not isinstance(self.currency, str):
+            raise ValueError(f"Invalid currency: {self.currency!r}")
+
+    def model_dump(self) -> dict[str, Any]:
+        """Get the Money as a dictionary.
+
+        Returns
+        -------
+            A dictionary with the amount and the currency
+
+        """
+        return {"amount": self.amount, "currency": self.currency}
+
+    @classmethod
+    def model_validate(cls, value: Any) -> "Money":
+        """Validate a value the way a model field of this type does.
+
+        Args:
+        ----
+            value: A Money, an amount or a mapping with an amount and a currency
+
+        Returns:
+        -------
+            The validated Money
+
+        Raises:
+        ------
+            ValidationError: If the value is not a valid money value
+
+        """
+        if cls._adapter is None:
+            cls._adapter = TypeAdapter(cls)
+        return cls._adapter.validate_python(value)
 
-    @field_validator("amount", mode="before")
     @classmethod
-    def convert_float_to_cents(cls, v: int | float) -> int:
-        """Convert float values to cents by multiplying by 100 and rounding.
+    def __get_pydantic_core_schema__(
+        cls, _source_type: Any, _handler: GetCoreSchemaHandler
+    ) -> core_schema.CoreSchema:
+        """Get the Pydantic core schema for this type.
+
+        Mappings and instances are handled by a dataclass schema, so they are
+        checked and built without calling ``__init__``. Bare amounts, tried
+        second, are passed to the constructor.
 
         Args:
         ----
-            v: The value to convert (int or float)
+            _source_type: The source type (unused)
+            _handler: The schema handler
 
         Returns:
         -------
-            The value in cents as an integer
+            A core schema for Money values
 
         """
-        if isinstance(v, float):
-            return round(v * 100)
-        return v
+        amount = core_schema.union_schema(
+            [core_schema.int_schema(), core_schema.float_schema()]
+        )
+        cents = core_schema.union_schema(
+            [
+                core_schema.int_schema(),
+                core_schema.no_info_after_validator_function(
+                    to_cents, core_schema.float_schema()
+                ),
+            ]
+        )
+        fields = core_schema.dataclass_args_schema(
+            cls.__name__,
+            [
+                core_schema.dataclass_field("amount", cents),
+                core_schema.dataclass_field(
+                    "currency",
+                    core_schema.with_default_schema(
+                        core_schema.str_schema(), default=DEFAULT_CURRENCY
+                    ),
+                ),
+            ],
+        )
+        return core_schema.union_schema(
+            [
+                core_schema.dataclass_schema(
+                    cls, fields, ["amount", "currency"], slots=True
+                ),
+                core_schema.no_info_after_validator_function(cls, amount),
+            ],
+            mode="left_to_right",
+        )
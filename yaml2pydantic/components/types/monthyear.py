@@ -1,6 +1,15 @@
-"""MonthYear type for handling month and year values."""
+"""MonthYear type for handling month and year values.
 
-from datetime import datetime
+A MonthYear is stored as a single month index, ``year * 12 + month - 1``:
+- Instances are immutable, hashable and ordered chronologically
+- ``MM/YYYY`` strings are parsed without ``strptime``, which is only used
+  for the other spellings it accepts, such as ``4/2025``
+- Instances between ``INTERN_FIRST_YEAR`` and ``INTERN_LAST_YEAR`` are
+  interned, so the same month is the same object, and the strings they
+  were parsed from are remembered
+"""
+
+from datetime import date, datetime
 from typing import Any
 
 from pydantic import GetCoreSchemaHandler, GetJsonSchemaHandler
@@ -8,38 +17,146 @@ from pydantic_core import core_schema
 
 from yaml2pydantic import types
 
+INTERN_FIRST_YEAR = 1900
+INTERN_LAST_YEAR = 2199
+
+_INTERN_FIRST = INTERN_FIRST_YEAR * 12
+_INTERN_LAST = INTERN_LAST_YEAR * 12 + 11
+_FIRST_INDEX = 12  # January of year 1
+_LAST_INDEX = 9999 * 12 + 11
+
+_interned: dict[int, "MonthYear"] = {}
+# Interned instances by their MM/YYYY string
+_interned_text: dict[str, "MonthYear"] = {}
+
+
+def _parse_index(value: str) -> int:
+    """Get the month index of a ``MM/YYYY`` string.
+
+    Args:
+    ----
+        value: The string to parse
+
+    Returns:
+    -------
+        The month index
+
+    Raises:
+    ------
+        ValueError: If the string is not a valid month and year
+
+    """
+    if (
+        len(value) == 7
+        and value[2] == "/"
+        and value.isascii()
+        and value[:2].isdigit()
+        and value[3:].isdigit()
+    ):
+        month = int(value[:2])
+        year = int(value[3:])
+    else:
+        try:
+            parsed = datetime.strptime(value, "%m/%Y")
+        except ValueError as e:
+            raise ValueError(f"Invalid month/year format: {value}") from e
+        month, year = parsed.month, parsed.year
+    if not 1 <= month <= 12 or year < 1:
+        raise ValueError(f"Invalid month/year format: {value}")
+    return year * 12 + month - 1
+
 
 class MonthYear:
     """A type for handling month and year values.
 
-    This class represents a month and year combination, always setting
-    the day to 1 to ensure consistent representation.
+    This class represents a month and year combination. ``value`` gives it
+    as a datetime on the first day of the month.
+
+    Attributes
+    ----------
+        index: The month index, ``year * 12 + month - 1``
+
     """
 
-    def __init__(self, value: None | datetime | str | Any):
-        """Initialize a MonthYear instance.
+    __slots__ = ("index",)
+
+    index: int
+
+    def __new__(cls, value: datetime | date | str | Any | None) -> "MonthYear":
+        """Get the MonthYear of a value.
 
         Args:
         ----
-            value: A datetime object or string in MM/YYYY format representing the month
-            and year
+            value: A datetime or date, or a string in MM/YYYY format,
+            representing the month and year
+
+        Returns:
+        -------
+            The MonthYear, interned for common years
 
         Raises:
         ------
             ValueError: If the input format is invalid
+
         """
         if value is None:
             raise ValueError("MonthYear cannot be None")
         if isinstance(value, str):
-            try:
-                parsed_date = datetime.strptime(value, "%m/%Y")
-            except ValueError as e:
-                raise ValueError(f"Invalid month/year format: {value}") from e
-            self.value = parsed_date
-        elif isinstance(value, datetime):
-            self.value = value.replace(day=1)
-        else:
-            raise ValueError(f"Invalid month/year format: {value}")
+            return cls._from_str(value)
+        if isinstance(value, date):
+            return cls.from_index(value.year * 12 + value.month - 1)
+        raise ValueError(f"Invalid month/year format: {value}")
+
+    @classmethod
+    def from_index(cls, index: int) -> "MonthYear":
+        """Get the MonthYear of a month index.
+
+        Args:
+        ----
+            index: The month index, ``year * 12 + month - 1``
+
+        Returns:
+        -------
+            The MonthYear, interned for common years
+
+        Raises:
+        ------
+            ValueError: If the index is outside years 1 to 9999
+
+        """
+        instance = _interned.get(index)
+        if instance is not None and type(instance) is cls:
+            return instance
+        if not _FIRST_INDEX <= index <= _LAST_INDEX:
+            raise ValueError(f"Invalid month index: {index}")
+        instance = object.__new__(cls)
+        object.__setattr__(instance, "index", index)
+        if cls is MonthYear and _INTERN_FIRST <= index <= _INTERN_LAST:
+            instance = _interned.setdefault(index, instance)
+        return instance
+
+    @property
+    def year(self) -> int:
+        """The year."""
+        return self.index // 12
+
+    @property
+    def month(self) -> int:
+        """The month, from 1 to 12."""
+        return self.index % 12 + 1
+
+    @property
+    def value(self) -> datetime:
+        """The first day of the month, as a datetime."""
+        return datetime(self.year, self.month, 1)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Reject changes: MonthYear instances are immutable and shared."""
+        raise AttributeError("MonthYear instances are immutable")
+
+    def __reduce__(self) -> tuple[Any, tuple[int]]:
+        """Pickle and copy through the month index."""
+        return type(self).from_index, (self.index,)
 
     def __str__(self) -> str:
         """Convert the MonthYear to a string in MM/YYYY format.
@@ -49,7 +166,7 @@ class MonthYear:
             A string in the format "MM/YYYY"
 
         """
-        return self.value.strftime("%m/%Y")
+        return f"{self.month:02d}/{self.year:04d}"
 
     def __repr__(self) -> str:
         """Get the string representation of the MonthYear.
@@ -73,7 +190,72 @@ class MonthYear:
             True if both are MonthYear instances with the same value
 
         """
-        return isinstance(other, MonthYear) and self.value == other.value
+        if not isinstance(other, MonthYear):
+            return NotImplemented
+        return self.index == other.index
+
+    def __hash__(self) -> int:
+        """Hash the MonthYear by its month index."""
+        return hash(self.index)
+
+    def __lt__(self, other: Any) -> bool:
+        """Check whether the MonthYear is before another one."""
+        if not isinstance(other, MonthYear):
+            return NotImplemented
+        return self.index < other.index
+
+    def __le__(self, other: Any) -> bool:
+        """Check whether the MonthYear is not after another one."""
+        if not isinstance(other, MonthYear):
+            return NotImplemented
+        return self.index <= other.index
+
+    def __gt__(self, other: Any) -> bool:
+        """Check whether the MonthYear is after another one."""
+        if not isinstance(other, MonthYear):
+            return NotImplemented
+        return self.index > other.index
+
+    def __ge__(self, other: Any) -> bool:
+        """Check whether the MonthYear is not before another one."""
+        if not isinstance(other, MonthYear):
+            return NotImplemented
+        return self.index >= other.index
+
+    @classmethod
+    def _from_str(cls, value: str) -> "MonthYear":
+        """Get the MonthYear of a string, looking interned strings up first."""
+        if cls is MonthYear:
+            instance = _interned_text.get(value)
+            if instance is not None:
+                return instance
+        instance = cls.from_index(_parse_index(value))
+        if instance is _interned.get(instance.index) and len(value) == 7:
+            _interned_text[value] = instance
+        return instance
+
+    @classmethod
+    def _validate_python(cls, value: Any) -> "MonthYear":
+        """Validate a MonthYear instance or a string in MM/YYYY format.
+
+        Args:
+        ----
+            value: The value to validate
+
+        Returns:
+        -------
+            The MonthYear
+
+        Raises:
+        ------
+            ValueError: If the value is neither a MonthYear nor a valid string
+
+        """
+        if isinstance(value, cls):
+            return value
+        if isinstance(value, str):
+            return cls._from_str(value)
+        raise ValueError(f"Input should be a {cls.__name__} or a MM/YYYY string")
 
     @classmethod
     def __get_pydantic_core_schema__(
@@ -88,17 +270,18 @@ class MonthYear:
 
         Returns:
         -------
-            A core schema for string validation
+            A core schema converting MM/YYYY strings to MonthYear
 
         """
-        return core_schema.union_schema(
-            [
-                core_schema.is_instance_schema(cls),
-                core_schema.str_schema(),
-            ],
-            serialization=core_schema.plain_serializer_function_ser_schema(
-                lambda v: v.value.strftime("%m/%Y") if isinstance(v, MonthYear) else v
+        return core_schema.json_or_python_schema(
+            json_schema=core_schema.no_info_after_validator_function(
+                cls._from_str, core_schema.str_schema()
+            ),
+            # One validator rather than a union, so bad input gets one error
+            python_schema=core_schema.no_info_plain_validator_function(
+                cls._validate_python
             ),
+            serialization=core_schema.to_string_ser_schema(when_used="always"),
         )
 
     @classmethod
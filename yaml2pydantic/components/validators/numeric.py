@@ -5,7 +5,14 @@ from typing import Any
 from yaml2pydantic import validators
 
 
-@validators.validator
+def _positive_constraints(field_type: Any) -> dict[str, Any] | None:
+    """Lower ``check_positive`` to ``gt=0`` on plain numeric fields."""
+    if field_type in (int, float):
+        return {"gt": 0}
+    return None
+
+
+@validators.validator(native=_positive_constraints)
 def check_positive(cls: Any, v: int) -> int:
     """Validate that a number is positive.
 
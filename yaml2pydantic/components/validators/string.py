@@ -1,11 +1,26 @@
 """String validators for YAML2Pydantic models."""
 
-from typing import Any
+from typing import Any, get_origin
 
 from yaml2pydantic.core.validators import validator_registry
 
+_COLLECTIONS = (list, dict, set, frozenset)
 
-@validator_registry.validator
+
+def _non_empty_constraints(field_type: Any) -> dict[str, Any] | None:
+    """Lower ``non_empty`` on strings and collections that cannot be None.
+
+    A string must contain a non-whitespace character, which is what
+    ``strip()`` checks, and a collection must have at least one item.
+    """
+    if field_type is str:
+        return {"pattern": r"\S"}
+    if field_type in _COLLECTIONS or get_origin(field_type) in _COLLECTIONS:
+        return {"min_length": 1}
+    return None
+
+
+@validator_registry.validator(native=_non_empty_constraints)
 def non_empty(value: Any) -> Any:
     """Validate that a value is not empty.
 
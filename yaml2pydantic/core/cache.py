@@ -0,0 +1,310 @@
+"""Persistent on-disk cache of compiled schemas.
+
+This module stores the pre-digested form of a schema so that warm starts
+can skip parsing and dependency analysis:
+- Entries are keyed by a hash of the schema source
+- Each entry records the components it uses, so changed components
+  invalidate it
+- Entries are plain JSON, so reading a shared directory never runs code
+- Files are written atomically, so many processes can share a directory
+- The directory is bounded in size, evicting least recently used entries
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+from types import CodeType
+from typing import Any
+
+from yaml2pydantic import __version__
+from yaml2pydantic.core.dependencies import BuildPlan, referenced_names
+from yaml2pydantic.core.serializers import SerializerRegistry
+from yaml2pydantic.core.type_expressions import SPECIAL_FORMS
+from yaml2pydantic.core.type_registry import TypeRegistry
+from yaml2pydantic.core.validators import ValidatorRegistry
+
+logger = logging.getLogger(__name__)
+
+CACHE_FORMAT = 2
+_SUFFIX = ".y2p"
+
+
+@dataclass
+class CacheEntry:
+    """A compiled schema stored in the cache.
+
+    Attributes
+    ----------
+        definitions: The parsed model definitions
+        plan: The build plan for the definitions
+        components: Fingerprints of the components the definitions use
+
+    """
+
+    definitions: dict[str, Any]
+    plan: BuildPlan
+    components: dict[str, str]
+
+
+def source_key(data: bytes, suffix: str = "") -> str:
+    """Compute the cache key for a schema source.
+
+    Args:
+    ----
+        data: The raw content of the schema source
+        suffix: The file suffix, since it selects the parser
+
+    Returns:
+    -------
+        A hex digest identifying the source
+
+    """
+    digest = hashlib.sha256()
+    digest.update(f"{CACHE_FORMAT}:{__version__}:{suffix}:".encode())
+    digest.update(data)
+    return digest.hexdigest()
+
+
+def dict_key(source: dict[str, Any]) -> str:
+    """Compute the cache key for a schema given as a dictionary.
+
+    Args:
+    ----
+        source: The schema definitions
+
+    Returns:
+    -------
+        A hex digest identifying the definitions
+
+    """
+    data = json.dumps(source, sort_keys=True, default=repr).encode()
+    return source_key(data, ".dict")
+
+
+def _hash_code(digest: Any, code: CodeType) -> None:
+    """Feed the bytecode, constants and names of a code object to a digest."""
+    digest.update(code.co_code)
+    digest.update(repr(code.co_names).encode())
+    for const in code.co_consts:
+        if isinstance(const, CodeType):
+            _hash_code(digest, const)
+        else:
+            digest.update(repr(const).encode())
+
+
+def _fingerprint(component: Any) -> str:
+    """Describe a component so that a change to it changes the description.
+
+    Functions are described by their code, and classes by the code of the
+    functions they define.
+    """
+    name = (
+        f"{getattr(component, '__module__', '?')}."
+        f"{getattr(component, '__qualname__', type(component).__qualname__)}"
+    )
+    codes: list[CodeType] = []
+    if isinstance(component, type):
+        for attribute in vars(component).values():
+            function = getattr(attribute, "__func__", attribute)
+            if isinstance(getattr(function, "__code__", None), CodeType):
+                codes.append(function.__code__)
+    elif isinstance(getattr(component, "__code__", None), CodeType):
+        codes.append(component.__code__)
+    if codes:
+        digest = hashlib.sha256()
+        for code in codes:
+            _hash_code(digest, code)
+        name += ":" + digest.hexdigest()[:16]
+    return name
+
+
+def component_fingerprints(
+    definitions: dict[str, Any],
+    types: TypeRegistry,
+    validators: ValidatorRegistry,
+    serializers: SerializerRegistry,
+) -> dict[str, str]:
+    """Fingerprint every registered component a set of definitions uses.
+
+    Components are looked up like the factory looks them up, so indexed
+    components are imported first. Models defined in the schema itself and
+    built-in types are not included, since they cannot change without
+    changing the source.
+
+    Args:
+    ----
+        definitions: Dictionary of model definitions
+        types: Registry used to resolve custom types
+        validators: Registry of field and model validators
+        serializers: Registry of field serializers
+
+    Returns:
+    -------
+        Mapping of ``kind:name`` to the component fingerprint
+
+    Raises:
+    ------
+        KeyError: If a type, validator or serializer is not found
+
+    """
+    builtin = types.BUILTIN_TYPES.keys() | types.GENERIC_TYPES.keys() | SPECIAL_FORMS
+    fingerprints: dict[str, str] = {}
+    component: Any
+    for definition in definitions.values():
+        for validator_name in definition.get("validators", []):
+            component = validators.get(validator_name)
+            fingerprints[f"validator:{validator_name}"] = _fingerprint(component)
+        for props in definition.get("fields", {}).values():
+            for type_name in referenced_names(props.get("type", "")):
+                if type_name in definitions or type_name in builtin:
+                    continue
+                component = types.resolve(type_name)
+                fingerprints[f"type:{type_name}"] = _fingerprint(component)
+            for validator_name in props.get("validators", []):
+                component = validators.get(validator_name)
+                fingerprints[f"validator:{validator_name}"] = _fingerprint(component)
+            for serializer_name in props.get("serializers", []):
+                component = serializers.get(serializer_name)
+                fingerprints[f"serializer:{serializer_name}"] = _fingerprint(component)
+    return fingerprints
+
+
+class SchemaCache:
+    """Directory of compiled schemas shared between processes.
+
+    Every entry is a single JSON file named after its key. Writes go to a
+    temporary file that is atomically renamed into place, so readers never
+    observe a partial entry. Corrupt or outdated entries are treated as
+    misses, and definitions that JSON cannot represent exactly are not
+    stored.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        max_entries: int = 256,
+        max_bytes: int = 64 * 1024 * 1024,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+        ----
+            directory: Directory holding the cache entries
+            max_entries: Maximum number of entries to keep
+            max_bytes: Maximum total size of the entries
+
+        """
+        self.directory = Path(directory)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}{_SUFFIX}"
+
+    def get(self, key: str) -> CacheEntry | None:
+        """Read an entry from the cache.
+
+        Args:
+        ----
+            key: The key of the entry
+
+        Returns:
+        -------
+            The entry, or None if it is missing or unreadable
+
+        """
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                data = json.load(f)
+            fmt, stored_key = data["format"], data["key"]
+            entry = CacheEntry(
+                definitions=data["definitions"],
+                plan=BuildPlan(**data["plan"]),
+                components=data["components"],
+            )
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except Exception:
+            logger.warning("Ignoring unreadable schema cache entry %s", path)
+            self.misses += 1
+            return None
+
+        if fmt != CACHE_FORMAT or stored_key != key:
+            self.misses += 1
+            return None
+
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        self.hits += 1
+        return entry
+
+    def put(self, key: str, entry: CacheEntry) -> None:
+        """Store an entry in the cache and evict old entries if needed.
+
+        Args:
+        ----
+            key: The key of the entry
+            entry: The compiled schema to store
+
+        """
+        data = {
+            "format": CACHE_FORMAT,
+            "key": key,
+            "definitions": entry.definitions,
+            "plan": {
+                "groups": entry.plan.groups,
+                "dependencies": entry.plan.dependencies,
+            },
+            "components": entry.components,
+        }
+        try:
+            encoded = json.dumps(data).encode()
+            exact = json.loads(encoded) == data
+        except (TypeError, ValueError):
+            exact = False
+        if not exact:
+            logger.debug("Not caching schema %s: it is not plain JSON data", key)
+            return
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(encoded)
+            os.replace(tmp, self._path(key))
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+        self.evict()
+
+    def evict(self) -> None:
+        """Remove the least recently used entries beyond the size bounds."""
+        entries = []
+        for path in self.directory.glob(f"*{_SUFFIX}"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        entries.sort(reverse=True)
+
+        total = 0
+        for count, (_, size, path) in enumerate(entries, start=1):
+            total += size
+            if count > self.max_entries or total > self.max_bytes:
+                path.unlink(missing_ok=True)
+
+    def clear(self) -> None:
+        """Remove every entry from the cache."""
+        for path in self.directory.glob(f"*{_SUFFIX}"):
+            path.unlink(missing_ok=True)
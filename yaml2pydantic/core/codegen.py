@@ -0,0 +1,305 @@
+"""Ahead-of-time code generation for schema definitions.
+
+This module renders model definitions as a static Python module, so the
+models can be imported (and bytecode-cached) instead of being built by the
+factory at runtime. Custom types, validators and serializers are imported
+from the modules that define them.
+"""
+
+import importlib
+import typing
+from typing import Any
+
+from yaml2pydantic.core.dependencies import BuildPlan
+from yaml2pydantic.core.serializers import SerializerRegistry, chain
+from yaml2pydantic.core.type_expressions import (
+    Constant,
+    Name,
+    TypeExpression,
+    UnionOf,
+    parse_type,
+)
+from yaml2pydantic.core.type_registry import TypeRegistry
+from yaml2pydantic.core.validators import ValidatorRegistry
+
+_TYPING_NAMES = {"Optional", "Union", "Literal"}
+_LITERALS = (type(None), bool, int, float, str)
+_RESERVED = {
+    "annotations",
+    "BaseModel",
+    "Field",
+    "PlainSerializer",
+    "field_validator",
+    "model_validator",
+}
+
+HEADER = '''"""Models generated by yaml2pydantic. Do not edit."""
+
+from __future__ import annotations
+'''
+
+
+def _check_literal(value: Any) -> None:
+    """Make sure a value can be written out with ``repr``."""
+    if isinstance(value, list | tuple):
+        for item in value:
+            _check_literal(item)
+    elif isinstance(value, dict):
+        for key, item in value.items():
+            _check_literal(key)
+            _check_literal(item)
+    elif not isinstance(value, _LITERALS):
+        raise ValueError(f"Cannot emit value of type {type(value).__name__}: {value!r}")
+
+
+class SourceEmitter:
+    """Render model definitions as the source of a Python module."""
+
+    def __init__(
+        self,
+        types: TypeRegistry,
+        validators: ValidatorRegistry,
+        serializers: SerializerRegistry,
+    ) -> None:
+        """Initialize the emitter.
+
+        Args:
+        ----
+            types: Registry used to resolve custom types
+            validators: Registry of field and model validators
+            serializers: Registry of field serializers
+
+        """
+        self.types = types
+        self.validators = validators
+        self.serializers = serializers
+        self._imports: dict[tuple[str, str], str] = {}
+        self._names: set[str] = set()
+        self._scope = types
+
+    def _import(self, obj: Any) -> str:
+        """Get the local name of an object, importing it if needed.
+
+        Raises
+        ------
+            ValueError: If the object cannot be imported by its dotted name
+
+        """
+        module: str | None = getattr(obj, "__module__", None)
+        qualname: str | None = getattr(obj, "__qualname__", None)
+        if module == "builtins" and qualname:
+            return qualname
+        if not module or not qualname or "." in qualname:
+            raise ValueError(f"Cannot import {obj!r} by its dotted name")
+
+        key = (module, qualname)
+        if key not in self._imports:
+            try:
+                found = getattr(importlib.import_module(module), qualname)
+            except (ImportError, AttributeError):
+                found = None
+            if found is not obj:
+                raise ValueError(f"Cannot import {obj!r} as {module}.{qualname}")
+
+            alias = qualname
+            suffix = 2
+            while alias in self._names:
+                alias = f"{qualname}_{suffix}"
+                suffix += 1
+            self._names.add(alias)
+            self._imports[key] = alias
+        return self._imports[key]
+
+    def _render_type(self, type_str: str, definitions: dict[str, Any]) -> str:
+        """Render a schema type expression as a Python annotation."""
+        return self._render_expression(parse_type(type_str), definitions)
+
+    def _render_expression(
+        self, expression: TypeExpression, definitions: dict[str, Any]
+    ) -> str:
+        """Render a parsed type expression as a Python annotation."""
+        if isinstance(expression, Constant):
+            return repr(expression.value)
+        if isinstance(expression, UnionOf):
+            return " | ".join(
+                self._render_expression(option, definitions)
+                for option in expression.options
+            )
+        if isinstance(expression, Name):
+            if expression.name in definitions:
+                return expression.name
+            return self._import(self.types.resolve(expression.name))
+
+        if expression.name in _TYPING_NAMES:
+            origin = self._import(getattr(typing, expression.name))
+        else:
+            origin = self._import(self.types.resolve(expression.name))
+        args = ", ".join(
+            self._render_expression(arg, definitions) for arg in expression.args
+        )
+        return f"{origin}[{args}]"
+
+    def _render_serializer(self, names: list[str]) -> str:
+        """Render the ``PlainSerializer`` of a field's chain of serializers."""
+        functions = [self._import(self.serializers.get(name)) for name in names]
+        function = functions[0]
+        if len(functions) > 1:
+            function = f"{self._import(chain)}({', '.join(functions)})"
+        args = [function]
+        for key, value in self.serializers.chain_options(names).items():
+            args.append(
+                f"{key}={self._import(value)}"
+                if key == "return_type"
+                else f"{key}={value!r}"
+            )
+        return f"PlainSerializer({', '.join(args)})"
+
+    def _resolve(self, type_str: str) -> Any:
+        """Resolve a field type like the factory, or None if it is unknown.
+
+        Schema models resolve to placeholder classes, so generic types over
+        them keep their origin, which is what validators are lowered by.
+        """
+        try:
+            return self._scope.resolve(type_str)
+        except KeyError:
+            return None
+
+    def _render_default(
+        self, type_str: str, value: Any, definitions: dict[str, Any], pending: set[str]
+    ) -> str:
+        """Render a default value, validating model defaults like the factory."""
+        _check_literal(value)
+        if not isinstance(value, dict):
+            return repr(value)
+
+        if type_str in definitions:
+            if type_str in pending:
+                return repr(value)
+            return f"{type_str}.model_validate({value!r})"
+        field_type = self._resolve(type_str)
+        if field_type is not None and hasattr(field_type, "model_validate"):
+            return f"{self._import(field_type)}.model_validate({value!r})"
+        return repr(value)
+
+    def _render_model(
+        self,
+        name: str,
+        definition: dict[str, Any],
+        definitions: dict[str, Any],
+        pending: set[str],
+    ) -> list[str]:
+        """Render the class statement for one model.
+
+        Models in ``pending`` are not complete yet when this class is created,
+        so dictionary defaults of those types are left unvalidated.
+        """
+        lines = [f"class {name}(BaseModel):"]
+        fields_def = definition.get("fields", {})
+
+        python_validators: dict[str, list[str]] = {}
+        for field_name, props in fields_def.items():
+            annotation = self._render_type(props["type"], definitions)
+            metadata = []
+            if props.get("serializers"):
+                metadata.append(self._render_serializer(props["serializers"]))
+            constraints, python_validators[field_name] = self.validators.lower(
+                props.get("validators", []), self._resolve(props["type"]), props
+            )
+            if constraints:
+                for value in constraints.values():
+                    _check_literal(value)
+                native = ", ".join(f"{k}={v!r}" for k, v in constraints.items())
+                metadata.append(f"Field({native})")
+            if metadata:
+                annotated = self._import(typing.Annotated)
+                annotation = f"{annotated}[{', '.join([annotation, *metadata])}]"
+            args = []
+            if "default" in props:
+                default = self._render_default(
+                    props["type"], props["default"], definitions, pending
+                )
+                args.append(f"default={default}")
+            else:
+                args.append("...")
+            for key, value in props.items():
+                if key in ["type", "default", "validators", "serializers"]:
+                    continue
+                _check_literal(value)
+                args.append(f"{key}={value!r}")
+            lines.append(f"    {field_name}: {annotation} = Field({', '.join(args)})")
+
+        for field_name, validator_names in python_validators.items():
+            for validator_name in validator_names:
+                fn = self._import(self.validators.get(validator_name))
+                lines.append(
+                    f"    validate_{field_name}_{validator_name} = "
+                    f"field_validator({field_name!r})({fn})"
+                )
+
+        for validator_name in definition.get("validators", []):
+            fn = self._import(self.validators.get(validator_name))
+            lines.append(
+                f"    model_validate_{validator_name} = "
+                f'model_validator(mode="after")({fn})'
+            )
+
+        if len(lines) == 1:
+            lines.append("    pass")
+        return lines
+
+    def emit(self, definitions: dict[str, Any], plan: BuildPlan | None = None) -> str:
+        """Render a set of definitions as the source of a Python module.
+
+        Args:
+        ----
+            definitions: Dictionary of model definitions
+            plan: A previously computed build plan for the definitions
+
+        Returns:
+        -------
+            The source code of the module
+
+        Raises:
+        ------
+            ValueError: If a component or default value cannot be emitted
+
+        """
+        if plan is None:
+            plan = BuildPlan.from_definitions(definitions)
+        self._imports = {}
+        self._names = set(definitions) | _RESERVED
+        self._scope = self.types.child()
+        for name in definitions:
+            self._scope.register(name, type(name, (), {}), track=False)
+
+        body: list[str] = []
+        for group in plan.groups:
+            cyclic = plan.is_cyclic(group)
+            pending = set(group) if cyclic else set()
+            for name in group:
+                body.extend(["", ""])
+                body.extend(
+                    self._render_model(name, definitions[name], definitions, pending)
+                )
+            if cyclic:
+                body.append("")
+                body.extend(f"{name}.model_rebuild()" for name in group)
+
+        imports = [
+            "from pydantic import (",
+            "    BaseModel,",
+            "    Field,",
+            "    PlainSerializer,",
+            "    field_validator,",
+            "    model_validator,",
+            ")",
+        ]
+        if self._imports:
+            imports.append("")
+        for (module, qualname), alias in sorted(self._imports.items()):
+            suffix = f" as {alias}" if alias != qualname else ""
+            imports.append(f"from {module} import {qualname}{suffix}")
+
+        all_names = ", ".join(repr(name) for name in definitions)
+        return "\n".join([HEADER, *imports, *body, "", f"__all__ = [{all_names}]", ""])
@@ -0,0 +1,231 @@
+"""Dependency analysis for schema definitions.
+
+This module computes the order in which models must be built:
+- Extracting the model names referenced by a field type expression
+- Building the model dependency graph once, or one model at a time
+- Grouping mutually recursive models into strongly connected components
+"""
+
+from collections.abc import Container
+from dataclasses import dataclass, field
+from typing import Any
+
+from yaml2pydantic.core.type_expressions import names, parse_type
+
+
+def referenced_names(type_str: str) -> set[str]:
+    """Get every identifier referenced by a type expression.
+
+    Nested expressions such as ``Optional[Address]`` yield both the wrapper
+    and the inner names, so callers can intersect the result with the names
+    they care about. Values inside ``Literal[...]`` are not names.
+
+    Args:
+    ----
+        type_str: The type expression from the schema
+
+    Returns:
+    -------
+        The set of identifiers found in the expression
+
+    """
+    return names(parse_type(type_str))
+
+
+def model_dependencies(definition: dict[str, Any], known: Container[str]) -> list[str]:
+    """Get the models a single definition references.
+
+    Args:
+    ----
+        definition: The model definition
+        known: The names of every defined model
+
+    Returns:
+    -------
+        The referenced model names, in field order and without duplicates
+
+    """
+    dependencies: dict[str, None] = {}
+    for field_def in definition.get("fields", {}).values():
+        type_str = field_def.get("type")
+        if not type_str:
+            continue
+        for ref in sorted(referenced_names(type_str)):
+            if ref in known:
+                dependencies[ref] = None
+    return list(dependencies)
+
+
+def dependency_graph(definitions: dict[str, Any]) -> dict[str, list[str]]:
+    """Build the dependency graph between model definitions.
+
+    Args:
+    ----
+        definitions: Dictionary of model definitions
+
+    Returns:
+    -------
+        Mapping of model name to the names of the models it references, in
+        field order and without duplicates
+
+    """
+    return {
+        name: model_dependencies(definition, definitions)
+        for name, definition in definitions.items()
+    }
+
+
+def strongly_connected_components(graph: dict[str, list[str]]) -> list[list[str]]:
+    """Group the graph into strongly connected components.
+
+    This is an iterative version of Tarjan's algorithm, so very deep schemas
+    do not hit the recursion limit. Components are returned dependencies
+    first, which is the order in which they can be built.
+
+    Args:
+    ----
+        graph: Mapping of node to the nodes it depends on
+
+    Returns:
+    -------
+        List of components, each a list of node names
+
+    """
+    index: dict[str, int] = {}
+    lowlink: dict[str, int] = {}
+    stack: list[str] = []
+    on_stack: set[str] = set()
+    components: list[list[str]] = []
+
+    for root in graph:
+        if root in index:
+            continue
+        work: list[tuple[str, int]] = [(root, 0)]
+        while work:
+            node, position = work.pop()
+            if position == 0:
+                index[node] = lowlink[node] = len(index)
+                stack.append(node)
+                on_stack.add(node)
+            neighbours = graph[node]
+            for i in range(position, len(neighbours)):
+                neighbour = neighbours[i]
+                if neighbour not in index:
+                    work.append((node, i + 1))
+                    work.append((neighbour, 0))
+                    break
+                if neighbour in on_stack:
+                    lowlink[node] = min(lowlink[node], index[neighbour])
+            else:
+                if lowlink[node] == index[node]:
+                    component: list[str] = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == node:
+                            break
+                    component.reverse()
+                    components.append(component)
+                if work:
+                    parent = work[-1][0]
+                    lowlink[parent] = min(lowlink[parent], lowlink[node])
+
+    return components
+
+
+@dataclass
+class BuildPlan:
+    """The order in which a set of model definitions must be built.
+
+    Attributes
+    ----------
+        groups: Strongly connected components, dependencies first
+        dependencies: Mapping of model name to the models it references
+
+    """
+
+    groups: list[list[str]]
+    dependencies: dict[str, list[str]]
+
+    @classmethod
+    def from_definitions(cls, definitions: dict[str, Any]) -> "BuildPlan":
+        """Analyse a set of definitions and compute their build order.
+
+        Args:
+        ----
+            definitions: Dictionary of model definitions
+
+        Returns:
+        -------
+            The build plan for the definitions
+
+        """
+        graph = dependency_graph(definitions)
+        return cls(groups=strongly_connected_components(graph), dependencies=graph)
+
+    def is_cyclic(self, group: list[str]) -> bool:
+        """Check whether a group needs forward references to be built.
+
+        Args:
+        ----
+            group: One of the plan's groups
+
+        Returns:
+        -------
+            True if the group has several members or references itself
+
+        """
+        return len(group) > 1 or group[0] in self.dependencies[group[0]]
+
+    def levels(self) -> list[list[list[str]]]:
+        """Split the plan's groups into dependency levels.
+
+        The groups of a level only reference groups of earlier levels (or
+        types defined outside the plan), so they can be built in any order,
+        or concurrently.
+
+        Returns
+        -------
+            The groups of each level, in plan order within each level
+
+        """
+        level_of: dict[str, int] = {}
+        levels: list[list[list[str]]] = []
+        for group in self.groups:
+            level = 0
+            for name in group:
+                for dependency in self.dependencies.get(name, []):
+                    if dependency in level_of:
+                        level = max(level, level_of[dependency] + 1)
+            for name in group:
+                level_of[name] = level
+            if level == len(levels):
+                levels.append([])
+            levels[level].append(group)
+        return levels
+
+
+@dataclass
+class BuildReport:
+    """Statistics collected while building a set of models.
+
+    Attributes
+    ----------
+        passes: Number of passes over the definitions
+        groups: Number of groups built
+        cycles: Groups that were built through forward references
+        rebuilds: Number of ``model_rebuild`` calls
+        shared: Number of models reused from a ``ModelInterner``
+        timings: Seconds spent building each model
+        total_time: Seconds spent in ``build_all``
+
+    """
+
+    passes: int = 0
+    groups: int = 0
+    cycles: list[list[str]] = field(default_factory=list)
+    rebuilds: int = 0
+    shared: int = 0
+    timings: dict[str, float] = field(default_factory=dict)
+    total_time: float = 0.0
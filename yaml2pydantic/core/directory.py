@@ -0,0 +1,290 @@
+"""Schemas split across many files.
+
+A directory (or a glob pattern) of schema files is presented as a single
+mapping of model names to definitions, reading as little as possible:
+- An index from model name to defining file is built from the top-level
+  keys of each file, which for block-style YAML does not need a full parse;
+  files with any other top-level syntax are parsed
+- A file is parsed the first time one of its models is looked up, and the
+  parsed file is cached until its modification time or size changes
+- Models are referenced across files by name. A file can also pull in
+  files from outside the directory with a top-level ``$include`` list, or
+  with ``$ref: "path/to/file.yaml#Model"`` on a field, which sets the
+  field's type to ``Model`` unless the field gives one
+"""
+
+import glob
+import re
+from collections.abc import Iterator, Mapping
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from yaml2pydantic.core.parsers import parsers
+
+INCLUDE_KEY = "$include"
+REF_KEY = "$ref"
+
+# Lines starting at column zero, other than comments
+_TOP_LEVEL_LINE = re.compile(rb"^[^\s#].*$", re.MULTILINE)
+# A plain top-level key of a block-style YAML mapping, or the include list
+_YAML_KEY = re.compile(rb"(?:([A-Za-z_][A-Za-z0-9_]*)|\$include)[ \t]*:(?=\s|$)")
+
+
+def scan_yaml_keys(data: bytes) -> list[str] | None:
+    """Find the top-level keys of a YAML file without parsing it.
+
+    Args:
+    ----
+        data: The content of the file
+
+    Returns:
+    -------
+        The model names, or None if a top-level line is not a plain key, such
+        as a quoted key, a flow mapping, a merge key or a document marker
+
+    """
+    names = []
+    for line in _TOP_LEVEL_LINE.findall(data):
+        match = _YAML_KEY.match(line)
+        if match is None:
+            return None
+        if match.group(1) is not None:
+            names.append(match.group(1).decode())
+    return names
+
+
+def is_collection(source: str) -> bool:
+    """Check whether a schema source names a directory or a glob pattern.
+
+    Args:
+    ----
+        source: A schema source path
+
+    Returns:
+    -------
+        True if the source is a directory or contains glob characters
+
+    """
+    return Path(source).is_dir() or any(char in source for char in "*?[")
+
+
+@dataclass
+class SchemaFile:
+    """The parsed content of one schema file.
+
+    Attributes
+    ----------
+        path: The resolved path of the file
+        definitions: The model definitions of the file
+        includes: Resolved paths of the files it includes or references
+
+    """
+
+    path: Path
+    definitions: dict[str, Any]
+    includes: list[Path] = field(default_factory=list)
+
+
+class SchemaDirectory(Mapping[str, dict[str, Any]]):
+    """Model definitions spread across the files of a directory.
+
+    Attributes
+    ----------
+        source: The directory or glob pattern
+        generation: Bumped whenever ``refresh`` finds a changed file
+        parses: Number of files parsed so far
+
+    """
+
+    def __init__(self, source: str | Path) -> None:
+        """Discover the schema files without reading them.
+
+        Args:
+        ----
+            source: A directory, searched recursively, or a glob pattern
+
+        """
+        self.source = str(source)
+        self.generation = 0
+        self.parses = 0
+        self._included: set[Path] = set()
+        self._files: dict[Path, SchemaFile] = {}
+        self._names: dict[Path, list[str]] = {}
+        self._index: dict[str, Path] | None = None
+        self._stats = self._stat_files()
+
+    @property
+    def files(self) -> list[Path]:
+        """The schema files known so far, including the included ones."""
+        return list(self._stats)
+
+    def _discover(self) -> list[Path]:
+        """List the schema files matched by the source."""
+        root = Path(self.source)
+        if root.is_dir():
+            candidates = root.rglob("*")
+        else:
+            candidates = (Path(p) for p in glob.glob(self.source, recursive=True))
+        return sorted(
+            p.resolve()
+            for p in candidates
+            if p.suffix in parsers.formats and p.is_file()
+        )
+
+    def _stat_files(self) -> dict[Path, tuple[int, int]]:
+        """Get the modification time and size of every known file."""
+        stats: dict[Path, tuple[int, int]] = {}
+        for path in [*self._discover(), *sorted(self._included)]:
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            stats[path] = (stat.st_mtime_ns, stat.st_size)
+        return stats
+
+    def refresh(self) -> set[Path]:
+        """Check the files for changes and forget what changed.
+
+        Returns:
+        -------
+            The files that were added, modified or removed
+
+        """
+        stats = self._stat_files()
+        changed = {
+            path
+            for path in stats.keys() | self._stats.keys()
+            if stats.get(path) != self._stats.get(path)
+        }
+        for path in changed:
+            self._files.pop(path, None)
+            self._names.pop(path, None)
+        self._included &= stats.keys()
+        self._stats = stats
+        if changed:
+            self.generation += 1
+            self._index = None
+        return changed
+
+    def _add(self, path: Path) -> None:
+        """Make an included file part of the directory."""
+        if path in self._stats:
+            return
+        stat = path.stat()
+        self._included.add(path)
+        self._stats[path] = (stat.st_mtime_ns, stat.st_size)
+        if self._index is not None:
+            self._index_file(self._index, path)
+
+    def load_file(self, path: Path) -> SchemaFile:
+        """Parse a schema file, going through the per-file cache.
+
+        Args:
+        ----
+            path: The resolved path of the file
+
+        Returns:
+        -------
+            The parsed file
+
+        """
+        cached = self._files.get(path)
+        if cached is not None:
+            return cached
+
+        content = parsers.get(path.suffix)(path.read_bytes()) or {}
+        self.parses += 1
+        includes = content.pop(INCLUDE_KEY, [])
+        if isinstance(includes, str):
+            includes = [includes]
+        schema_file = SchemaFile(
+            path, content, [(path.parent / p).resolve() for p in includes]
+        )
+        for definition in content.values():
+            for field_def in definition.get("fields", {}).values():
+                ref = field_def.pop(REF_KEY, None)
+                if ref is None:
+                    continue
+                target, _, name = ref.partition("#")
+                field_def.setdefault("type", name.lstrip("/"))
+                if target:
+                    schema_file.includes.append((path.parent / target).resolve())
+
+        self._files[path] = schema_file
+        self._names[path] = list(content)
+        for include in schema_file.includes:
+            self._add(include)
+        return schema_file
+
+    def _scan(self, path: Path) -> list[str]:
+        """Get the names of the models a file defines, parsing it if needed."""
+        if path not in self._names:
+            names: list[str] | None = None
+            if path.suffix in (".yaml", ".yml"):
+                names = scan_yaml_keys(path.read_bytes())
+            if not names:
+                names = list(self.load_file(path).definitions)
+            self._names[path] = names
+        return self._names[path]
+
+    def _index_file(self, index: dict[str, Path], path: Path) -> None:
+        """Add the models of one file to the index."""
+        for name in self._scan(path):
+            if index.setdefault(name, path) != path:
+                raise ValueError(
+                    f"Model {name} is defined in both {index[name]} and {path}"
+                )
+
+    @property
+    def index(self) -> dict[str, Path]:
+        """Mapping of model name to the file defining it.
+
+        Raises
+        ------
+            ValueError: If two files define the same model
+
+        """
+        if self._index is None:
+            index: dict[str, Path] = {}
+            indexed: set[Path] = set()
+            # Parsing a file while scanning it can include more files
+            while pending := [p for p in self._stats if p not in indexed]:
+                for path in pending:
+                    self._index_file(index, path)
+                    indexed.add(path)
+            self._index = index
+        return self._index
+
+    def definitions(self) -> dict[str, Any]:
+        """Parse every file and merge their definitions.
+
+        Returns
+        -------
+            Dictionary of every model definition, in file order
+
+        """
+        loaded: set[Path] = set()
+        while pending := [p for p in self._stats if p not in loaded]:
+            for path in pending:
+                self.load_file(path)
+                loaded.add(path)
+        return {name: self[name] for name in self.index}
+
+    def __getitem__(self, name: str) -> dict[str, Any]:
+        """Get the definition of a model, parsing its file if needed."""
+        schema_file = self.load_file(self.index[name])
+        definition: dict[str, Any] = schema_file.definitions[name]
+        return definition
+
+    def __contains__(self, name: object) -> bool:
+        """Check whether a model is defined, without parsing any file."""
+        return name in self.index
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the names of the indexed models."""
+        return iter(list(self.index))
+
+    def __len__(self) -> int:
+        """Get the number of indexed models."""
+        return len(self.index)
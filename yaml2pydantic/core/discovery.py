@@ -0,0 +1,118 @@
+"""Index of the components that registries import on first use.
+
+Components are not imported up front. A ``ComponentIndex`` maps each
+component name to the ``module:attribute`` defining it, and a registry
+given the index imports a component when a name it does not know is first
+looked up. The index is built from:
+- The manifest of the built-in components, in ``yaml2pydantic.components``
+- The ``yaml2pydantic.types``, ``yaml2pydantic.validators`` and
+  ``yaml2pydantic.serializers`` entry point groups of installed packages,
+  read once and only when a name is not in the manifest
+"""
+
+import importlib
+from collections.abc import Mapping
+from typing import Any
+
+from yaml2pydantic.components import MANIFEST
+
+KINDS = ("types", "validators", "serializers")
+ENTRY_POINT_GROUP = "yaml2pydantic.{kind}"
+
+
+class ComponentIndex:
+    """Mapping of component names to the modules defining them.
+
+    Attributes
+    ----------
+        targets: The ``module:attribute`` of each component, per kind
+
+    """
+
+    def __init__(
+        self,
+        manifest: Mapping[str, Mapping[str, str]] | None = None,
+        discover: bool = True,
+    ) -> None:
+        """Initialize an index.
+
+        Args:
+        ----
+            manifest: The ``module:attribute`` of each component, per kind
+            discover: Whether to look up the names missing from the
+                manifest in the entry points of installed packages
+
+        """
+        manifest = manifest or {}
+        self.targets: dict[str, dict[str, str]] = {
+            kind: dict(manifest.get(kind, {})) for kind in KINDS
+        }
+        self._discovered = not discover
+
+    def add(self, kind: str, name: str, target: str) -> None:
+        """Add a component to the index.
+
+        Args:
+        ----
+            kind: One of ``types``, ``validators`` or ``serializers``
+            name: The name the component is referenced by in schemas
+            target: The ``module:attribute`` defining it
+
+        """
+        self.targets[kind][name] = target
+
+    def target(self, kind: str, name: str) -> str | None:
+        """Get the ``module:attribute`` defining a component.
+
+        Args:
+        ----
+            kind: One of ``types``, ``validators`` or ``serializers``
+            name: The name of the component
+
+        Returns:
+        -------
+            The target of the component, or None if it is not indexed
+
+        """
+        targets = self.targets[kind]
+        if name not in targets and not self._discovered:
+            self._discover()
+        return targets.get(name)
+
+    def load(self, kind: str, name: str) -> Any | None:
+        """Import a component.
+
+        Args:
+        ----
+            kind: One of ``types``, ``validators`` or ``serializers``
+            name: The name of the component
+
+        Returns:
+        -------
+            The component, or None if it is not indexed
+
+        Raises:
+        ------
+            ImportError: If the module defining the component fails to import
+            AttributeError: If the module does not define the component
+
+        """
+        target = self.target(kind, name)
+        if target is None:
+            return None
+        module_name, _, attribute = target.partition(":")
+        return getattr(importlib.import_module(module_name), attribute or name)
+
+    def _discover(self) -> None:
+        """Add the components declared as entry points by installed packages."""
+        # Imported here, as reading package metadata is slow to import
+        from importlib.metadata import entry_points
+
+        self._discovered = True
+        for kind in KINDS:
+            group = ENTRY_POINT_GROUP.format(kind=kind)
+            for entry_point in entry_points(group=group):
+                self.targets[kind].setdefault(entry_point.name, entry_point.value)
+
+
+component_index = ComponentIndex(MANIFEST)
@@ -1,19 +1,36 @@
-import importlib
 import logging
-from collections.abc import Callable
-from pathlib import Path
-from typing import Any
+import threading
+import time
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import AbstractContextManager, nullcontext
+from typing import Annotated, Any, ForwardRef
 
 from pydantic import (
     BaseModel,
+    ConfigDict,
     Field,
-    field_serializer,
     field_validator,
     model_validator,
 )
 
+from yaml2pydantic.core.codegen import SourceEmitter
+from yaml2pydantic.core.dependencies import (
+    BuildPlan,
+    BuildReport,
+    model_dependencies,
+    strongly_connected_components,
+)
+from yaml2pydantic.core.instrumentation import Instrumentation
+from yaml2pydantic.core.interning import ModelInterner, model_fingerprint
+from yaml2pydantic.core.profiling import Profiler
 from yaml2pydantic.core.serializers import SerializerRegistry
 from yaml2pydantic.core.type_registry import TypeRegistry
+from yaml2pydantic.core.validation import (
+    DEFAULT_BATCH_SIZE,
+    ValidationResult,
+    validate_many,
+)
 from yaml2pydantic.core.validators import ValidatorRegistry
 
 logger = logging.getLogger(__name__)
@@ -28,51 +45,69 @@ class ModelFactory:
     - Field validation
     - Model validation
     - Custom serialization
+
+    The models it builds are registered in a child of the given type
+    registry, which is left untouched, so factories can build concurrently
+    over the same registries.
     """
 
     types: TypeRegistry
     validators: ValidatorRegistry
     serializers: SerializerRegistry
     models: dict[str, type[BaseModel]]
+    report: BuildReport
+    instrumentation: Instrumentation | None
+    profiler: Profiler | None
+    interner: ModelInterner | None
+    defer_build: bool
 
     def __init__(
         self,
         types: TypeRegistry,
         validators: ValidatorRegistry,
         serializers: SerializerRegistry,
+        instrumentation: Instrumentation | None = None,
+        profiler: Profiler | None = None,
+        interner: ModelInterner | None = None,
+        defer_build: bool = False,
     ):
         """Initialize the ModelFactory.
 
         Args:
         ----
-            types: Registry of available types (built-in and custom)
+            types: Registry of available types (built-in and custom), which
+                the factory registers its models in a child of
             validators: Registry of field and model validators
             serializers: Registry of field serializers
+            instrumentation: Optional collector of the time spent in each
+                phase of building each model
+            profiler: Optional collector of the calls of the validators and
+                serializers attached to the models
+            interner: Optional table of models shared with other factories,
+                reused instead of building identical models again
+            defer_build: Whether to create the models without building
+                their core schema, which is then built by ``finalize`` or on
+                first use
 
         """
-        self.types = types
+        self.types = types.child()
         self.validators = validators
         self.serializers = serializers
         self.models: dict[str, type[BaseModel]] = {}
-        self._load_components()
-
-    def _load_components(self) -> None:
-        """Load all schema components from the components directory.
-
-        This includes types, validators, and serializers.
-        """
-        from yaml2pydantic.core import registry  # noqa: F401
-
-        component_path = Path(__file__).parent.parent / "components"
-        modules = ["types", "validators", "serializers"]
-
-        for module in modules:
-            module_path = component_path / module
-            for file in module_path.glob("*.py"):
-                if file.stem != "__init__":
-                    importlib.import_module(
-                        f"yaml2pydantic.components.{module}.{file.stem}"
-                    )
+        self.report = BuildReport()
+        self.instrumentation = instrumentation
+        self.profiler = profiler
+        self.interner = interner
+        self.defer_build = defer_build
+        self._deferred: list[type[BaseModel]] = []
+
+    def _span(
+        self, phase: str, model: str | None = None
+    ) -> AbstractContextManager[None]:
+        """Time a phase of the build, if the factory is instrumented."""
+        if self.instrumentation is None:
+            return nullcontext()
+        return self.instrumentation.span(phase, model)
 
     def _get_field_args(self, props: dict[str, Any]) -> dict[str, Any]:
         """Extract field arguments from field properties.
@@ -117,12 +152,9 @@ class ModelFactory:
             Updated field_args dictionary
         """
         if "default" in field_args and isinstance(field_args["default"], dict):
+            # Resolved model types are always built: models are built after
+            # the models their definition references
             if field_type is not None and hasattr(field_type, "model_validate"):
-                # Ensure the model is built before using it
-                if field_type not in self.models.values():
-                    # This branch should never execute in practice because we check
-                    # first
-                    self.build_model(props["type"], definition)  # pragma: no cover
                 field_args["default"] = field_type.model_validate(field_args["default"])
 
         return field_args
@@ -152,53 +184,79 @@ class ModelFactory:
             namespace[field_name] = Field(..., **field_args)
 
     def _add_serializers(
-        self, field_name: str, props: dict[str, Any], namespace: dict[str, Any]
+        self,
+        field_name: str,
+        props: dict[str, Any],
+        annotations: dict[str, Any],
+        model: str,
     ) -> None:
-        """Add serializers for a field to the model namespace.
+        """Attach the serializers of a field to its annotation.
+
+        The field's serializers are composed into a single ``PlainSerializer``
+        shared by every field with the same chain.
 
         Args:
         ----
             field_name: The name of the field
             props: The field properties from the schema
-            namespace: The namespace dictionary for the model
+            annotations: The annotations dictionary for the model
+            model: The name of the model
         """
         serializer_names = props.get("serializers", [])
-        for serializer_name in serializer_names:
-            serializer_fn = self.serializers.get(serializer_name)
-
-            # Create a serializer method
-            def create_serializer(
-                fn: Callable[[Any], Any],
-            ) -> Callable[[Any], Any]:
-                @field_serializer(field_name)
-                def serializer(v: Any) -> Any:
-                    return fn(v)
+        if serializer_names:
+            wrap = None
+            if self.profiler is not None:
+                profiler = self.profiler
 
-                return serializer
+                def wrap(name: str, function: Callable) -> Callable:
+                    return profiler.wrap(function, model, field_name, name)
 
-            namespace[f"serialize_{field_name}_{serializer_name}"] = create_serializer(
-                serializer_fn
-            )
+            annotations[field_name] = Annotated[
+                annotations[field_name],
+                self.serializers.plain_serializer(serializer_names, wrap),
+            ]
 
     def _add_field_validators(
-        self, field_name: str, props: dict[str, Any], namespace: dict[str, Any]
+        self,
+        field_name: str,
+        props: dict[str, Any],
+        namespace: dict[str, Any],
+        annotations: dict[str, Any],
+        model: str,
     ) -> None:
         """Add field validators to the model namespace.
 
+        Validators with a native equivalent for the field's type are lowered
+        to constraints in ``Annotated`` metadata, so pydantic-core enforces
+        them without calling into Python. The others become field validators.
+
         Args:
         ----
             field_name: The name of the field
             props: The field properties from the schema
             namespace: The namespace dictionary for the model
+            annotations: The annotations dictionary for the model
+            model: The name of the model
         """
-        for validator_name in props.get("validators", []):
+        constraints, remaining = self.validators.lower(
+            props.get("validators", []), self.types.resolve(props["type"]), props
+        )
+        if constraints:
+            annotations[field_name] = Annotated[
+                annotations[field_name], Field(**constraints)
+            ]
+        for validator_name in remaining:
             validator_fn = self.validators.get(validator_name)
+            if self.profiler is not None:
+                validator_fn = self.profiler.wrap(
+                    validator_fn, model, field_name, validator_name
+                )
             namespace[f"validate_{field_name}_{validator_name}"] = field_validator(
                 field_name
             )(validator_fn)
 
     def _add_model_validators(
-        self, definition: dict[str, Any], namespace: dict[str, Any]
+        self, definition: dict[str, Any], namespace: dict[str, Any], model: str
     ) -> None:
         """Add model validators to the model namespace.
 
@@ -206,9 +264,14 @@ class ModelFactory:
         ----
             definition: The model definition from the schema
             namespace: The namespace dictionary for the model
+            model: The name of the model
         """
         for validator_name in definition.get("validators", []):
             validator_fn = self.validators.get(validator_name)
+            if self.profiler is not None:
+                validator_fn = self.profiler.wrap(
+                    validator_fn, model, None, validator_name
+                )
             namespace[f"model_validate_{validator_name}"] = model_validator(
                 mode="after"
             )(validator_fn)
@@ -235,13 +298,15 @@ class ModelFactory:
 
         # Process all field definitions
         for field_name, props in fields_def.items():
-            field_type = self.types.resolve(props["type"])
+            with self._span("resolve", name):
+                field_type = self.types.resolve(props["type"])
             field_args = self._get_field_args(props)
 
             # Process default values
-            field_args = self._process_field_default(
-                field_type, field_args, props, definition
-            )
+            with self._span("defaults", name):
+                field_args = self._process_field_default(
+                    field_type, field_args, props, definition
+                )
 
             # Add field to namespace and annotations
             self._add_field_to_model(
@@ -249,62 +314,520 @@ class ModelFactory:
             )
 
             # Add serializers for this field
-            self._add_serializers(field_name, props, namespace)
+            with self._span("serializers", name):
+                self._add_serializers(field_name, props, annotations, name)
 
-        # Add validators
-        for field_name, props in fields_def.items():
-            self._add_field_validators(field_name, props, namespace)
+        with self._span("validators", name):
+            # Add validators
+            for field_name, props in fields_def.items():
+                self._add_field_validators(
+                    field_name, props, namespace, annotations, name
+                )
 
-        # Add model validators
-        self._add_model_validators(definition, namespace)
+            # Add model validators
+            self._add_model_validators(definition, namespace, name)
 
         # Create the model class
         namespace["__annotations__"] = annotations
-        ModelClass = type(name, (BaseModel,), namespace)
+        if self.defer_build:
+            namespace["model_config"] = ConfigDict(defer_build=True)
+        with self._span("create", name):
+            ModelClass = type(name, (BaseModel,), namespace)
         self.models[name] = ModelClass
+        if self.defer_build:
+            self._deferred.append(ModelClass)
+        if self.instrumentation is not None:
+            self._count_components(self.instrumentation, name, definition, namespace)
         return ModelClass
 
-    def build_all(self, definitions: dict[str, Any]) -> dict[str, type[BaseModel]]:
+    @staticmethod
+    def _count_components(
+        instrumentation: Instrumentation,
+        name: str,
+        definition: dict[str, Any],
+        namespace: dict[str, Any],
+    ) -> None:
+        """Record the number of components attached to a model just built."""
+        fields_def = definition.get("fields", {})
+        listed = sum(len(props.get("validators", [])) for props in fields_def.values())
+        python = sum(1 for key in namespace if key.startswith("validate_"))
+        timing = instrumentation.model(name)
+        timing.builds += 1
+        timing.fields = len(fields_def)
+        timing.validators = python + len(definition.get("validators", []))
+        timing.lowered = listed - python
+        timing.serializers = sum(
+            len(props.get("serializers", [])) for props in fields_def.values()
+        )
+
+    def plan(self, definitions: dict[str, Any]) -> BuildPlan:
+        """Compute the order in which a set of definitions must be built.
+
+        Args:
+        ----
+            definitions: Dictionary of model definitions
+
+        Returns:
+        -------
+            The build plan for the definitions
+
+        """
+        return BuildPlan.from_definitions(definitions)
+
+    def _build_group(
+        self,
+        group: list[str],
+        definitions: Mapping[str, Any],
+        cyclic: bool,
+        report: BuildReport,
+    ) -> None:
+        """Build one strongly connected group of models.
+
+        Models that reference each other (or themselves) are built against
+        forward references, then rebuilt once every member of the group exists.
+        Dictionary defaults that point back into the group are kept as plain
+        dictionaries, since the referenced model is not complete yet.
+
+        Args:
+        ----
+            group: Names of the models in the group
+            definitions: Dictionary of model definitions
+            cyclic: Whether the group needs forward references
+            report: The report to record timings in
+        """
+        if cyclic:
+            report.cycles.append(group)
+            for name in group:
+                if name not in self.models:
+                    self.types.register(name, ForwardRef(name), track=False)  # type: ignore[arg-type]
+
+        share = not cyclic and self.interner is not None and self.profiler is None
+        for name in group:
+            start = time.perf_counter()
+            if share:
+                model = self._build_shared(name, definitions[name], report)
+            else:
+                model = self.build_model(name, definitions[name])
+            if not cyclic:
+                self.types.register(name, model, track=False)
+            report.timings[name] = time.perf_counter() - start
+
+        if cyclic:
+            namespace = {name: self.models[name] for name in group}
+            for name, model in namespace.items():
+                self.types.register(name, model, track=False)
+            for name in group:
+                with self._span("rebuild", name):
+                    self.models[name].model_rebuild(
+                        force=True, _types_namespace=namespace
+                    )
+                report.rebuilds += 1
+
+    def _build_shared(
+        self, name: str, definition: dict[str, Any], report: BuildReport
+    ) -> type[BaseModel]:
+        """Build a model, unless an identical model is shared already.
+
+        Args:
+        ----
+            name: Name of the model
+            definition: Model definition from the schema
+            report: The report to count shared models in
+
+        Returns:
+        -------
+            The model shared by every factory building the same definition
+
+        """
+        assert self.interner is not None
+        key = model_fingerprint(
+            name, definition, self.types, self.validators, self.serializers
+        )
+        model = self.interner.get(key)
+        if model is None:
+            built = self.build_model(name, definition)
+            model = self.interner.add(key, built)
+            if model is built:
+                return model
+        report.shared += 1
+        self.models[name] = model
+        return model
+
+    def _build_levels(
+        self,
+        definitions: dict[str, Any],
+        plan: BuildPlan,
+        report: BuildReport,
+        workers: int,
+    ) -> None:
+        """Build the groups of each dependency level concurrently.
+
+        Each group records into a report of its own. The reports are merged,
+        and the models ordered, in plan order once every level is built, so
+        the result does not depend on which thread finished first.
+
+        Args:
+        ----
+            definitions: Dictionary of model definitions
+            plan: The build plan for the definitions
+            report: The report to record the build in
+            workers: Number of threads building groups
+        """
+        reports = {tuple(group): BuildReport() for group in plan.groups}
+        with ThreadPoolExecutor(workers, "yaml2pydantic-build") as pool:
+            for level in plan.levels():
+                futures = [
+                    pool.submit(
+                        self._build_group,
+                        group,
+                        definitions,
+                        plan.is_cyclic(group),
+                        reports[tuple(group)],
+                    )
+                    for group in level
+                ]
+                for future in futures:
+                    future.result()
+        for group in plan.groups:
+            group_report = reports[tuple(group)]
+            report.cycles.extend(group_report.cycles)
+            report.rebuilds += group_report.rebuilds
+            report.shared += group_report.shared
+            report.timings.update(group_report.timings)
+            report.groups += 1
+            for name in group:
+                self.models[name] = self.models.pop(name)
+
+    def build_all(
+        self,
+        definitions: dict[str, Any],
+        plan: BuildPlan | None = None,
+        workers: int = 1,
+    ) -> dict[str, type[BaseModel]]:
         """Build all models from a schema definition dictionary.
 
-        This method handles forward references by:
-        1. Pre-registering dummy models
-        2. Building and replacing them with real models
+        The dependency graph is analysed once and models are built in
+        topological order. Models that reference each other are built
+        together through forward references and ``model_rebuild``.
+        Statistics about the build are stored in ``self.report``.
+
+        With several workers, the models of each dependency level are built
+        concurrently on a thread pool. The models and the report are the
+        same as those of a serial build.
 
         Args:
         ----
             definitions: Dictionary of model definitions
+            plan: A previously computed build plan for the definitions
+            workers: Number of threads building independent models
 
         Returns:
         -------
             Dictionary mapping model names to their Pydantic model classes
 
         """
-        # Step 1: Pre-register dummy models in the registry for forward references
-        for name in definitions:
-            # Register dummy model so types.resolve() can find it
-            self.types.register(name, object)  # Use `object` or a placeholder type
-
-        # Step 2: Build models in dependency order
-        built_models: set[str] = set()
-        while len(built_models) < len(definitions):
-            for name, definition in definitions.items():
-                if name in built_models:
-                    continue
-
-                # Check if all dependencies are built
-                dependencies = set()
-                for field_def in definition.get("fields", {}).values():
-                    field_type = field_def.get("type", "")
-                    if field_type in definitions and field_type != name:
-                        dependencies.add(field_type)
-
-                if all(dep in built_models for dep in dependencies):
-                    model = self.build_model(name, definition)
-                    self.models[name] = model
-                    self.types.register(
-                        name, model
-                    )  # Replace placeholder with real model
-                    built_models.add(name)
+        start = time.perf_counter()
+        report = BuildReport()
+        if plan is None:
+            with self._span("plan"):
+                plan = self.plan(definitions)
+            report.passes = 1
+
+        if workers > 1:
+            self._build_levels(definitions, plan, report, workers)
+        else:
+            for group in plan.groups:
+                self._build_group(group, definitions, plan.is_cyclic(group), report)
+                report.groups += 1
 
+        report.total_time = time.perf_counter() - start
+        self.report = report
         return self.models
+
+    def finalize(self, background: bool = False) -> threading.Thread | None:
+        """Build the core schema of every model created with ``defer_build``.
+
+        Models are completed in the order they were created, dependencies
+        first, so each nested model's schema is built once and reused by
+        the models referencing it. Models already completed by their first
+        use are skipped.
+
+        Args:
+        ----
+            background: Whether to return at once and build the schemas in
+                a daemon thread. Models used meanwhile build their own
+                schema on first use.
+
+        Returns:
+        -------
+            The background thread, or None when finalizing in place
+
+        """
+        pending, self._deferred = self._deferred, []
+
+        def complete() -> None:
+            for model in pending:
+                with self._span("finalize", model.__name__):
+                    model.model_rebuild()
+
+        if not background:
+            complete()
+            return None
+        thread = threading.Thread(
+            target=complete, name="yaml2pydantic-finalize", daemon=True
+        )
+        thread.start()
+        return thread
+
+    def build_lazy(
+        self, definitions: Mapping[str, Any], plan: BuildPlan | None = None
+    ) -> "LazyModels":
+        """Get the models of a set of definitions without building them yet.
+
+        Each model is built on first access, together with the models it
+        references, so large schemas only pay for the models that are used.
+
+        Args:
+        ----
+            definitions: Dictionary of model definitions
+            plan: A previously computed build plan for the definitions
+
+        Returns:
+        -------
+            A mapping of model names to models, built on demand
+
+        """
+        return LazyModels(self, definitions, plan)
+
+    def emit_source(
+        self, definitions: dict[str, Any], plan: BuildPlan | None = None
+    ) -> str:
+        """Render a set of definitions as an importable Python module.
+
+        The generated module defines the same models ``build_all`` would
+        build, as static classes that import their custom types, validators
+        and serializers by dotted name.
+
+        Args:
+        ----
+            definitions: Dictionary of model definitions
+            plan: A previously computed build plan for the definitions
+
+        Returns:
+        -------
+            The source code of the module
+
+        Raises:
+        ------
+            ValueError: If a component or default value cannot be emitted
+
+        """
+        emitter = SourceEmitter(self.types, self.validators, self.serializers)
+        return emitter.emit(definitions, plan)
+
+    def validate_many(
+        self,
+        model: str | type[BaseModel],
+        records: Iterable[Any],
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> ValidationResult:
+        """Validate many records against one of the built models.
+
+        Records are validated in batches through a cached ``TypeAdapter``, and
+        invalid records are reported per row instead of raising.
+
+        Args:
+        ----
+            model: The model, or the name of a model built by this factory
+            records: The records to validate
+            batch_size: Number of records validated per call into pydantic-core
+
+        Returns:
+        -------
+            The valid instances and per-record errors, in input order
+
+        """
+        if isinstance(model, str):
+            model = self.models[model]
+        return validate_many(model, records, batch_size)
+
+
+class LazyModels(Mapping[str, type[BaseModel]]):
+    """Models of a set of definitions, each built on first access.
+
+    Looking up a model builds it and its transitive dependencies only, with
+    mutually recursive models built together through forward references.
+    Iterating or checking membership never builds anything. Lookups from
+    several threads build each model once.
+
+    Attributes
+    ----------
+        factory: The factory the models are built with
+        definitions: Dictionary of model definitions
+        report: Statistics of the builds triggered so far
+
+    """
+
+    def __init__(
+        self,
+        factory: ModelFactory,
+        definitions: Mapping[str, Any],
+        plan: BuildPlan | None = None,
+    ) -> None:
+        """Initialize the mapping without building any model.
+
+        Args:
+        ----
+            factory: The factory the models are built with
+            definitions: Mapping of model names to definitions, such as a
+                dictionary or a schema directory
+            plan: A previously computed build plan, whose dependency graph is
+                reused instead of analysing each definition again
+
+        """
+        self.factory = factory
+        self.definitions = definitions
+        self.report = BuildReport()
+        self._dependencies: dict[str, list[str]] = (
+            dict(plan.dependencies) if plan is not None else {}
+        )
+        self._built: dict[str, Any] = {}
+        self._lock = threading.RLock()
+
+    @property
+    def materialized(self) -> int:
+        """Number of models built through this mapping so far."""
+        return len(self._built)
+
+    def materialize(self) -> dict[str, type[BaseModel]]:
+        """Build every model that is not built yet.
+
+        Returns:
+        -------
+            Dictionary mapping model names to their Pydantic model classes
+
+        """
+        return {name: self[name] for name in self.definitions}
+
+    def changed(self, names: Iterable[str] | None = None) -> set[str]:
+        """Find the built models whose definition changed since they were built.
+
+        Args:
+        ----
+            names: The models to check, or None to check every built model
+
+        Returns:
+        -------
+            The names of the models whose definition changed or was removed
+
+        """
+        candidates = self._built if names is None else set(names) & self._built.keys()
+        return {
+            name
+            for name in candidates
+            if name not in self.definitions
+            or self.definitions[name] != self._built[name]
+        }
+
+    def rebuild(self, names: Iterable[str]) -> list[str]:
+        """Rebuild changed models and the built models that depend on them.
+
+        Every other model keeps its class. Affected models that were never
+        built, or that are no longer defined, are only forgotten.
+
+        Args:
+        ----
+            names: The models whose definition changed
+
+        Returns:
+        -------
+            The names of the rebuilt models
+
+        """
+        with self._lock:
+            return self._rebuild(names)
+
+    def _rebuild(self, names: Iterable[str]) -> list[str]:
+        """Rebuild changed models while holding the lock."""
+        dependents: dict[str, list[str]] = {}
+        for name in self._built:
+            for dependency in self._dependencies[name]:
+                dependents.setdefault(dependency, []).append(name)
+
+        stale: set[str] = set()
+        pending = list(names)
+        while pending:
+            name = pending.pop()
+            if name not in stale:
+                stale.add(name)
+                pending.extend(dependents.get(name, ()))
+
+        rebuilt = sorted(name for name in stale if name in self._built)
+        for name in stale:
+            self.factory.models.pop(name, None)
+            self._built.pop(name, None)
+            self._dependencies.pop(name, None)
+        rebuilt = [name for name in rebuilt if name in self.definitions]
+        for name in rebuilt:
+            self[name]
+        return rebuilt
+
+    def __getitem__(self, name: str) -> type[BaseModel]:
+        """Get a model, building it and its dependencies if needed."""
+        if name not in self.definitions:
+            raise KeyError(name)
+        if name in self._built:
+            # A single lookup: a rebuild may drop the model at any time
+            model = self.factory.models.get(name)
+            if model is not None:
+                return model
+        with self._lock:
+            if name not in self.factory.models:
+                self._materialize(name)
+            return self.factory.models[name]
+
+    def __contains__(self, name: object) -> bool:
+        """Check whether a model is defined, without building it."""
+        return name in self.definitions
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the names of the defined models."""
+        return iter(self.definitions)
+
+    def __len__(self) -> int:
+        """Get the number of defined models."""
+        return len(self.definitions)
+
+    def _dependencies_of(self, name: str) -> list[str]:
+        """Get the models a definition references, analysing it once."""
+        if name not in self._dependencies:
+            self._dependencies[name] = model_dependencies(
+                self.definitions[name], self.definitions
+            )
+        return self._dependencies[name]
+
+    def _materialize(self, name: str) -> None:
+        """Build a model and every model it needs that is not built yet."""
+        start = time.perf_counter()
+        models = self.factory.models
+        graph: dict[str, list[str]] = {}
+        with self.factory._span("plan"):
+            pending = [name]
+            while pending:
+                current = pending.pop()
+                if current in graph or current in models:
+                    continue
+                graph[current] = self._dependencies_of(current)
+                pending.extend(graph[current])
+            for node, dependencies in graph.items():
+                graph[node] = [d for d in dependencies if d in graph]
+
+            plan = BuildPlan(strongly_connected_components(graph), graph)
+        for group in plan.groups:
+            self.factory._build_group(
+                group, self.definitions, plan.is_cyclic(group), self.report
+            )
+            self.report.groups += 1
+            for member in group:
+                self._built[member] = self.definitions[member]
+        self.report.total_time += time.perf_counter() - start
@@ -0,0 +1,225 @@
+"""Opt-in timing of schema loading and model building.
+
+An ``Instrumentation`` passed to ``ModelFactory`` or ``SchemaLoader`` times
+each phase of the work as a span:
+- ``parse``: reading and parsing a schema file
+- ``plan``: analysing the dependencies between models
+- ``resolve``: resolving the type expression of each field
+- ``defaults``: validating dictionary defaults against their model type
+- ``validators`` and ``serializers``: attaching components to the fields
+- ``create``: creating the Pydantic class, which builds its core schema
+- ``rebuild``: completing models that reference each other
+- ``finalize``: building the core schema of models created with
+  ``defer_build``
+
+Spans are aggregated per phase and per model, can be forwarded to a
+callback or to ``logging``, and are summarized by ``report``. Nothing is
+timed unless an instrumentation is given.
+"""
+
+import json
+import logging
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+PHASES = (
+    "parse",
+    "plan",
+    "resolve",
+    "defaults",
+    "validators",
+    "serializers",
+    "create",
+    "rebuild",
+    "finalize",
+)
+
+SpanCallback = Callable[[str, str | None, float], Any]
+
+
+@dataclass
+class ModelTiming:
+    """Time spent on one model, and the components attached to it.
+
+    Attributes
+    ----------
+        name: The name of the model
+        phases: Seconds spent in each phase
+        fields: Number of fields
+        validators: Number of validators called from Python
+        lowered: Number of validators enforced as native constraints
+        serializers: Number of serializers attached to its fields
+        builds: Number of times the model was built
+
+    """
+
+    name: str
+    phases: dict[str, float] = field(default_factory=dict)
+    fields: int = 0
+    validators: int = 0
+    lowered: int = 0
+    serializers: int = 0
+    builds: int = 0
+
+    @property
+    def total(self) -> float:
+        """Seconds spent on the model in every phase."""
+        return sum(self.phases.values())
+
+
+class Instrumentation:
+    """Collector of the spans of loading and building models.
+
+    Attributes
+    ----------
+        phases: Seconds spent in each phase, over every model
+        models: Timings of each model built
+        callback: Called with the phase, the model (or None) and the
+            duration in seconds of every span
+        log_level: Level at which each span is logged, or None
+
+    """
+
+    def __init__(
+        self, callback: SpanCallback | None = None, log_level: int | None = None
+    ) -> None:
+        """Initialize an empty collector.
+
+        Args:
+        ----
+            callback: Called with the phase, the model (or None) and the
+                duration in seconds of every span
+            log_level: Level at which to log each span, or None not to log
+
+        """
+        self.callback = callback
+        self.log_level = log_level
+        self.phases: dict[str, float] = {}
+        self.models: dict[str, ModelTiming] = {}
+        # Models of a level can be built by several threads at once
+        self._lock = threading.Lock()
+
+    def model(self, name: str) -> ModelTiming:
+        """Get the timings of a model, creating them on first use."""
+        with self._lock:
+            return self._model(name)
+
+    def _model(self, name: str) -> ModelTiming:
+        """Get the timings of a model, with the lock held."""
+        timing = self.models.get(name)
+        if timing is None:
+            timing = self.models[name] = ModelTiming(name)
+        return timing
+
+    def record(self, phase: str, model: str | None, elapsed: float) -> None:
+        """Record a span.
+
+        Args:
+        ----
+            phase: The phase the span belongs to
+            model: The model the span worked on, or None
+            elapsed: The duration of the span, in seconds
+
+        """
+        with self._lock:
+            self.phases[phase] = self.phases.get(phase, 0.0) + elapsed
+            if model is not None:
+                phases = self._model(model).phases
+                phases[phase] = phases.get(phase, 0.0) + elapsed
+        if self.callback is not None:
+            self.callback(phase, model, elapsed)
+        if self.log_level is not None:
+            logger.log(
+                self.log_level, "%s %s: %.3f ms", phase, model or "-", elapsed * 1000
+            )
+
+    @contextmanager
+    def span(self, phase: str, model: str | None = None) -> Iterator[None]:
+        """Time the body of a ``with`` statement as a span.
+
+        Args:
+        ----
+            phase: The phase the span belongs to
+            model: The model the span works on, or None
+
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(phase, model, time.perf_counter() - start)
+
+    def top(self, n: int = 10) -> list[ModelTiming]:
+        """Get the models that took the most time to build.
+
+        Args:
+        ----
+            n: Number of models to return
+
+        Returns:
+        -------
+            The ``n`` most expensive models, most expensive first
+
+        """
+        return sorted(self.models.values(), key=lambda m: m.total, reverse=True)[:n]
+
+    def report(self, n: int = 10) -> dict[str, Any]:
+        """Summarize the spans recorded so far.
+
+        Args:
+        ----
+            n: Number of models to list
+
+        Returns:
+        -------
+            A JSON-serializable report with the time of each phase, the
+            number of models built and the ``n`` most expensive models
+
+        """
+        return {
+            "total": sum(self.phases.values()),
+            "phases": {phase: self.phases[phase] for phase in sorted(self.phases)},
+            "models": len(self.models),
+            "top": [
+                {**asdict(timing), "total": timing.total} for timing in self.top(n)
+            ],
+        }
+
+    def to_json(self, n: int = 10) -> str:
+        """Get ``report`` as a JSON document."""
+        return json.dumps(self.report(n), indent=2)
+
+    def format(self, n: int = 10) -> str:
+        """Get ``report`` as a human-readable table.
+
+        Args:
+        ----
+            n: Number of models to list
+
+        Returns:
+        -------
+            The time of each phase, then the ``n`` most expensive models
+
+        """
+        lines = [f"{'phase':<11} {'ms':>8}"]
+        for phase in PHASES:
+            if phase in self.phases:
+                lines.append(f"{phase:<11} {self.phases[phase] * 1000:8.2f}")
+        lines.append("")
+        lines.append(
+            f"{'model':<30} {'ms':>8}  {'fields':>6}  {'validators':>10}"
+            f"  {'native':>6}  {'serializers':>11}"
+        )
+        for timing in self.top(n):
+            lines.append(
+                f"{timing.name:<30} {timing.total * 1000:8.2f}  {timing.fields:6d}"
+                f"  {timing.validators:10d}  {timing.lowered:6d}"
+                f"  {timing.serializers:11d}"
+            )
+        return "\n".join(lines)
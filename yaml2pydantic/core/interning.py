@@ -0,0 +1,145 @@
+"""Sharing of structurally identical models between factories.
+
+Services compiling many similar schemas, such as one per tenant, build the
+same models over and over. A ``ModelInterner`` given to several factories
+lets them share one class per distinct model. A model's fingerprint covers:
+- Its name and its definition: fields in order, types, constraints,
+  defaults and the names of its validators and serializers
+- The identity of every custom type, nested model, validator and
+  serializer the definition refers to
+
+Nested models are interned first, so models referring to shared models
+share in turn. Classes are held weakly: a class is dropped from the table
+once no factory uses it. Models built through forward references (mutually
+recursive groups) and models built with a profiler are never shared.
+"""
+
+import hashlib
+import json
+import threading
+import weakref
+from typing import Any
+
+from pydantic import BaseModel
+
+from yaml2pydantic.core.dependencies import referenced_names
+from yaml2pydantic.core.serializers import SerializerRegistry
+from yaml2pydantic.core.type_expressions import SPECIAL_FORMS
+from yaml2pydantic.core.type_registry import TypeRegistry
+from yaml2pydantic.core.validators import ValidatorRegistry
+
+
+def model_fingerprint(
+    name: str,
+    definition: dict[str, Any],
+    types: TypeRegistry,
+    validators: ValidatorRegistry,
+    serializers: SerializerRegistry,
+) -> str:
+    """Fingerprint a model definition together with what it refers to.
+
+    Args:
+    ----
+        name: The name of the model
+        definition: The definition of the model
+        types: Registry the field types are resolved with
+        validators: Registry of field and model validators
+        serializers: Registry of field serializers
+
+    Returns:
+    -------
+        A key equal for two definitions only if they build identical models
+
+    Raises:
+    ------
+        KeyError: If a type, validator or serializer is not found
+
+    """
+    referenced: list[tuple[str, str, int]] = []
+    for validator_name in definition.get("validators", []):
+        referenced.append(
+            ("validator", validator_name, id(validators.get(validator_name)))
+        )
+    for props in definition.get("fields", {}).values():
+        for type_name in sorted(referenced_names(props["type"]) - SPECIAL_FORMS):
+            referenced.append(("type", type_name, id(types.resolve(type_name))))
+        for validator_name in props.get("validators", []):
+            referenced.append(
+                ("validator", validator_name, id(validators.get(validator_name)))
+            )
+        for serializer_name in props.get("serializers", []):
+            referenced.append(
+                ("serializer", serializer_name, id(serializers.get(serializer_name)))
+            )
+    # Field order is part of the model: it sets the order of the JSON output
+    fields = list(definition.get("fields", {}).items())
+    rest = {key: value for key, value in definition.items() if key != "fields"}
+    data = json.dumps([name, fields, rest, referenced], sort_keys=True, default=repr)
+    return hashlib.blake2b(data.encode(), digest_size=16).hexdigest()
+
+
+class ModelInterner:
+    """Thread-safe table of the models shared between factories.
+
+    Attributes
+    ----------
+        hits: Number of models taken from the table
+        misses: Number of models added to the table
+
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty table."""
+        self._models: weakref.WeakValueDictionary[str, type[BaseModel]] = (
+            weakref.WeakValueDictionary()
+        )
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        """Get the number of models currently shared."""
+        return len(self._models)
+
+    def get(self, key: str) -> type[BaseModel] | None:
+        """Get the model shared under a fingerprint.
+
+        Args:
+        ----
+            key: The fingerprint of the model
+
+        Returns:
+        -------
+            The shared model, or None if there is none
+
+        """
+        with self._lock:
+            model = self._models.get(key)
+            if model is not None:
+                self.hits += 1
+            return model
+
+    def add(self, key: str, model: type[BaseModel]) -> type[BaseModel]:
+        """Share a model under a fingerprint.
+
+        When another thread shared a model under the same fingerprint first,
+        that model is kept and returned instead.
+
+        Args:
+        ----
+            key: The fingerprint of the model
+            model: The model just built
+
+        Returns:
+        -------
+            The model shared under the fingerprint
+
+        """
+        with self._lock:
+            shared = self._models.get(key)
+            if shared is not None:
+                self.hits += 1
+                return shared
+            self._models[key] = model
+            self.misses += 1
+            return model
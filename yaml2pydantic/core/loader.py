@@ -4,20 +4,196 @@ This module provides functionality to load schema definitions from:
 - YAML files
 - JSON files
 - Python dictionaries
+- Directories or glob patterns of YAML/JSON files
+
+Loaded schemas are memoized for the life of the process, so repeated loads
+return the same model classes without parsing or building anything again.
+The ``aload`` variants run the file reads and the compilation in an
+executor, so they can be awaited without blocking an event loop.
 """
 
-import json
+import asyncio
+import functools
+import threading
+from collections import OrderedDict
+from collections.abc import (
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    Iterable,
+    Iterator,
+)
+from concurrent.futures import Executor
+from contextlib import AbstractContextManager, contextmanager, nullcontext
 from pathlib import Path
 from typing import Any
 
-import yaml
 from pydantic import BaseModel
 
-from yaml2pydantic.core.factory import ModelFactory
+from yaml2pydantic.core.cache import (
+    CacheEntry,
+    SchemaCache,
+    component_fingerprints,
+    dict_key,
+    source_key,
+)
+from yaml2pydantic.core.directory import SchemaDirectory, is_collection
+from yaml2pydantic.core.factory import LazyModels, ModelFactory
+from yaml2pydantic.core.instrumentation import Instrumentation
+from yaml2pydantic.core.parsers import parsers
+from yaml2pydantic.core.reload import SchemaWatcher
 from yaml2pydantic.core.serializers import serializer_registry
 from yaml2pydantic.core.type_registry import types
+from yaml2pydantic.core.validation import (
+    DEFAULT_BATCH_SIZE,
+    DEFAULT_CONCURRENCY,
+    ValidationResult,
+    avalidate_stream,
+    validate_many,
+)
 from yaml2pydantic.core.validators import validator_registry
 
+MEMO_SIZE = 64
+
+
+class SchemaMemo:
+    """Process-wide memo of the models loaded from each schema.
+
+    Entries are keyed on the resolved path of a file, or on the content of a
+    dictionary. Each entry remembers the version it was built for, made of
+    the file's modification time and size and the generation of every
+    registry, and is rebuilt when loaded with another version. The least
+    recently used entries are evicted past ``max_entries``. Loads of one
+    schema hold its ``lock``, so concurrent loads build a single entry.
+    """
+
+    def __init__(self, max_entries: int = MEMO_SIZE) -> None:
+        """Initialize an empty memo.
+
+        Args:
+        ----
+            max_entries: Maximum number of schemas kept
+
+        """
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, tuple[tuple[int, ...], LazyModels]] = (
+            OrderedDict()
+        )
+        self._locks: dict[str, threading.Lock] = {}
+        # Number of loads holding or waiting for each lock
+        self._users: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def lock(self, identity: str) -> Iterator[None]:
+        """Hold the lock serializing the loads of one schema.
+
+        The lock is kept while the schema is memoized or a load uses it, so
+        evicting the schema never hands a second load a different lock.
+
+        Args:
+        ----
+            identity: The key of the schema source
+
+        """
+        with self._lock:
+            lock = self._locks.setdefault(identity, threading.Lock())
+            self._users[identity] = self._users.get(identity, 0) + 1
+        try:
+            with lock:
+                yield
+        finally:
+            with self._lock:
+                self._users[identity] -= 1
+                if not self._users[identity]:
+                    del self._users[identity]
+                    if identity not in self._entries:
+                        del self._locks[identity]
+
+    @staticmethod
+    def identity(source: str | dict[str, Any]) -> str:
+        """Get the key of a schema source in the memo.
+
+        Args:
+        ----
+            source: Either a file path (str) or a dictionary containing the schema
+
+        Returns:
+        -------
+            The resolved path of a file, or a digest of a dictionary
+
+        """
+        if isinstance(source, dict):
+            return dict_key(source)
+        return str(Path(source).resolve())
+
+    def get(self, identity: str, version: tuple[int, ...]) -> LazyModels | None:
+        """Get the models loaded for a schema, if they are still current.
+
+        Args:
+        ----
+            identity: The key of the schema source
+            version: The current version of the source and registries
+
+        Returns:
+        -------
+            The memoized models, or None
+
+        """
+        with self._lock:
+            entry = self._entries.get(identity)
+            if entry is None or entry[0] != version:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(identity)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, identity: str, version: tuple[int, ...], models: LazyModels) -> None:
+        """Remember the models loaded for a schema.
+
+        Args:
+        ----
+            identity: The key of the schema source
+            version: The version of the source and registries they were built for
+            models: The loaded models
+
+        """
+        with self._lock:
+            self._entries[identity] = (version, models)
+            self._entries.move_to_end(identity)
+            while len(self._entries) > self.max_entries:
+                evicted, _ = self._entries.popitem(last=False)
+                if evicted not in self._users:
+                    self._locks.pop(evicted, None)
+
+    def invalidate(self, source: str | dict[str, Any] | None = None) -> None:
+        """Forget the models loaded for one schema, or for every schema.
+
+        Args:
+        ----
+            source: The schema source to forget, or None to forget everything
+
+        """
+        with self._lock:
+            if source is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(self.identity(source), None)
+
+    def __len__(self) -> int:
+        """Get the number of memoized schemas."""
+        return len(self._entries)
+
+
+schema_memo = SchemaMemo()
+
+# Schema directories seen so far, keyed like the memo, keeping their per-file
+# parse caches across loads
+schema_directories: dict[str, SchemaDirectory] = {}
+
 
 class SchemaLoader:
     """Loader for schema definitions from various file formats and data structures."""
@@ -39,30 +215,294 @@ class SchemaLoader:
             ValueError: If the file format is not supported
 
         """
-        source_dict: dict[str, Any] = {}
         if isinstance(source, dict):
             return source
+        if is_collection(source):
+            return SchemaLoader.directory(source).definitions()
 
         path = Path(source)
-        if path.suffix in [".yaml", ".yml"]:
-            with open(path) as f:
-                source_dict = yaml.safe_load(f)
-                return source_dict
-        elif path.suffix == ".json":
-            with open(path) as f:
-                source_dict = json.load(f)
-                return source_dict
+        SchemaLoader._check_format(path)
+        with open(path, "rb") as f:
+            return SchemaLoader._parse(path, f.read())
+
+    @staticmethod
+    def directory(source: str) -> SchemaDirectory:
+        """Get the schema files of a directory or glob pattern.
+
+        The same instance is returned for the same source, refreshed so that
+        only the files that changed since the last call are read again.
+
+        Args:
+        ----
+            source: A directory, searched recursively, or a glob pattern
+
+        Returns:
+        -------
+            The files of the source, as a mapping of model names to definitions
+
+        """
+        identity = schema_memo.identity(source)
+        directory = schema_directories.get(identity)
+        if directory is None:
+            directory = schema_directories[identity] = SchemaDirectory(source)
+        else:
+            directory.refresh()
+        return directory
+
+    @staticmethod
+    def _check_format(path: Path) -> None:
+        """Reject file formats that cannot be parsed."""
+        if path.suffix not in parsers.formats:
+            raise ValueError(f"Unsupported file format: {path}")
+
+    @staticmethod
+    def _parse(path: Path, data: bytes) -> dict[str, Any]:
+        """Parse the raw content of a schema file."""
+        source_dict: dict[str, Any] = parsers.get(path.suffix)(data)
+        return source_dict
+
+    @staticmethod
+    def _load_cached(
+        source: str | dict[str, Any], factory: ModelFactory, cache: SchemaCache
+    ) -> CacheEntry:
+        """Load the compiled form of a schema, going through the cache.
+
+        Args:
+        ----
+            source: Either a file path (str) or a dictionary containing the schema
+            factory: The factory whose registries the schema is compiled against
+            cache: The cache to read from and write to
+
+        Returns:
+        -------
+            The definitions and their build plan
+
+        """
+        if isinstance(source, dict):
+            key = dict_key(source)
+        else:
+            path = Path(source)
+            SchemaLoader._check_format(path)
+            with open(path, "rb") as f:
+                data = f.read()
+            key = source_key(data, path.suffix)
+
+        entry = cache.get(key)
+        if entry is not None:
+            current = component_fingerprints(
+                entry.definitions,
+                factory.types,
+                factory.validators,
+                factory.serializers,
+            )
+            if current == entry.components:
+                return entry
+
+        if isinstance(source, dict):
+            definitions = source
         else:
-            raise ValueError(f"Unsupported file format: {source}")
+            definitions = SchemaLoader._parse(path, data)
+        entry = CacheEntry(
+            definitions=definitions,
+            plan=factory.plan(definitions),
+            components=component_fingerprints(
+                definitions, factory.types, factory.validators, factory.serializers
+            ),
+        )
+        cache.put(key, entry)
+        return entry
 
     @staticmethod
-    def load_all(source: str | dict[str, Any]) -> dict[str, type[BaseModel]]:
+    def _span(
+        instrumentation: Instrumentation | None, phase: str
+    ) -> AbstractContextManager[None]:
+        """Time a phase of a load, if the load is instrumented."""
+        if instrumentation is None:
+            return nullcontext()
+        return instrumentation.span(phase)
+
+    @staticmethod
+    def _version(
+        source: str | dict[str, Any], directory: SchemaDirectory | None
+    ) -> tuple[int, ...]:
+        """Get the version of a source and of the registries it is built with."""
+        version: tuple[int, ...] = (
+            types.generation,
+            validator_registry.generation,
+            serializer_registry.generation,
+        )
+        if directory is not None:
+            return (directory.generation, *version)
+        if isinstance(source, dict):
+            return version
+        path = Path(source)
+        SchemaLoader._check_format(path)
+        stat = path.stat()
+        return (stat.st_mtime_ns, stat.st_size, *version)
+
+    @staticmethod
+    def load_all(
+        source: str | dict[str, Any],
+        cache: SchemaCache | None = None,
+        instrumentation: Instrumentation | None = None,
+    ) -> dict[str, type[BaseModel]]:
         """Load a schema definition from a file or dictionary.
 
+        Args:
+        ----
+            source: Either a file path (str) or a dictionary containing the schema
+            cache: Optional on-disk cache of compiled schemas
+            instrumentation: Optional collector of the time spent parsing the
+                schema and building each model
+
+        Returns:
+        -------
+            A Pydantic model
+
+        Raises:
+        ------
+            ValueError: If the file format is not supported
+
+        """
+        return SchemaLoader.load_lazy(source, cache, instrumentation).materialize()
+
+    @staticmethod
+    async def aload_all(
+        source: str | dict[str, Any],
+        cache: SchemaCache | None = None,
+        instrumentation: Instrumentation | None = None,
+        executor: Executor | None = None,
+    ) -> dict[str, type[BaseModel]]:
+        """Load a schema definition without blocking the event loop.
+
+        Reading the files and building the models run in the executor, so
+        other tasks keep running meanwhile. The result is memoized like the
+        result of ``load_all``, so concurrent loads of one schema, from any
+        thread, return the same classes.
+
+        Args:
+        ----
+            source: Either a file path (str) or a dictionary containing the schema
+            cache: Optional on-disk cache of compiled schemas
+            instrumentation: Optional collector of the time spent parsing the
+                schema and building each model
+            executor: The executor to load in, or None for the loop's default
+
+        Returns:
+        -------
+            Dictionary mapping model names to their Pydantic model classes
+
+        Raises:
+        ------
+            ValueError: If the file format is not supported
+
+        """
+        loop = asyncio.get_running_loop()
+        load = functools.partial(SchemaLoader.load_all, source, cache, instrumentation)
+        return await loop.run_in_executor(executor, load)
+
+    @staticmethod
+    def load_lazy(
+        source: str | dict[str, Any],
+        cache: SchemaCache | None = None,
+        instrumentation: Instrumentation | None = None,
+    ) -> LazyModels:
+        """Load a schema definition without building its models yet.
+
+        Each model is built on first access, together with the models it
+        references. ``materialized`` on the result counts the models built.
+        The result is memoized: loading the same source again returns the
+        same mapping until the source or a registry changes. An instrumented
+        load always parses and builds again, so that it has work to time, and
+        leaves the memoized models in place.
+
+        Args:
+        ----
+            source: Either a file path (str) or a dictionary containing the schema
+            cache: Optional on-disk cache of compiled schemas
+            instrumentation: Optional collector of the time spent parsing the
+                schema and building each model
+
+        Returns:
+        -------
+            A mapping of model names to models, built on demand
+
+        Raises:
+        ------
+            ValueError: If the file format is not supported
+
+        """
+        # Refreshed once, so the version describes the files that are built
+        directory = (
+            SchemaLoader.directory(source)
+            if isinstance(source, str) and is_collection(source)
+            else None
+        )
+        if instrumentation is not None:
+            return SchemaLoader._build_lazy(source, directory, cache, instrumentation)
+        version = SchemaLoader._version(source, directory)
+        identity = schema_memo.identity(source)
+        with schema_memo.lock(identity):
+            models = schema_memo.get(identity, version)
+            if models is None:
+                models = SchemaLoader._build_lazy(source, directory, cache, None)
+                schema_memo.put(identity, version, models)
+        return models
+
+    @staticmethod
+    def _build_lazy(
+        source: str | dict[str, Any],
+        directory: SchemaDirectory | None,
+        cache: SchemaCache | None,
+        instrumentation: Instrumentation | None,
+    ) -> LazyModels:
+        """Parse a schema and create the mapping building its models."""
+        factory = ModelFactory(
+            types, validator_registry, serializer_registry, instrumentation
+        )
+        if directory is not None:
+            if cache is not None:
+                raise ValueError("The schema cache does not support directories")
+            return factory.build_lazy(directory)
+        if cache is not None:
+            with SchemaLoader._span(instrumentation, "parse"):
+                entry = SchemaLoader._load_cached(source, factory, cache)
+            return factory.build_lazy(entry.definitions, plan=entry.plan)
+        with SchemaLoader._span(instrumentation, "parse"):
+            schemas: dict[str, Any] = SchemaLoader.load_all_dicts(source)
+        return factory.build_lazy(schemas)
+
+    @staticmethod
+    def invalidate(source: str | dict[str, Any] | None = None) -> None:
+        """Forget the memoized models of one schema, or of every schema.
+
+        Args:
+        ----
+            source: The schema source to forget, or None to forget everything
+
+        """
+        schema_memo.invalidate(source)
+        if source is None:
+            schema_directories.clear()
+        elif isinstance(source, str):
+            schema_directories.pop(schema_memo.identity(source), None)
+
+    @staticmethod
+    def load(
+        source: str | dict[str, Any],
+        name: str,
+        cache: SchemaCache | None = None,
+        instrumentation: Instrumentation | None = None,
+    ) -> type[BaseModel]:
+        """Load one model, building only the models it depends on.
+
         Args:
         ----
             source: Either a file path (str) or a dictionary containing the schema
             name: The name of the schema to load
+            cache: Optional on-disk cache of compiled schemas
+            instrumentation: Optional collector of the time spent parsing the
+                schema and building each model
 
         Returns:
         -------
@@ -71,20 +511,29 @@ class SchemaLoader:
         Raises:
         ------
             ValueError: If the file format is not supported
+            KeyError: If the schema does not define the model
 
         """
-        schemas: dict[str, Any] = SchemaLoader.load_all_dicts(source)
-        factory = ModelFactory(types, validator_registry, serializer_registry)
-        return factory.build_all(schemas)
+        return SchemaLoader.load_lazy(source, cache, instrumentation)[name]
 
     @staticmethod
-    def load(source: str | dict[str, Any], name: str) -> type[BaseModel]:
-        """Load all schema definitions from a file or dictionary.
+    async def aload(
+        source: str | dict[str, Any],
+        name: str,
+        cache: SchemaCache | None = None,
+        instrumentation: Instrumentation | None = None,
+        executor: Executor | None = None,
+    ) -> type[BaseModel]:
+        """Load one model without blocking the event loop.
 
         Args:
         ----
             source: Either a file path (str) or a dictionary containing the schema
             name: The name of the schema to load
+            cache: Optional on-disk cache of compiled schemas
+            instrumentation: Optional collector of the time spent parsing the
+                schema and building each model
+            executor: The executor to load in, or None for the loop's default
 
         Returns:
         -------
@@ -93,7 +542,83 @@ class SchemaLoader:
         Raises:
         ------
             ValueError: If the file format is not supported
+            KeyError: If the schema does not define the model
+
+        """
+        loop = asyncio.get_running_loop()
+        load = functools.partial(
+            SchemaLoader.load, source, name, cache, instrumentation
+        )
+        return await loop.run_in_executor(executor, load)
+
+    @staticmethod
+    def watch(
+        source: str,
+        interval: float = 1.0,
+        on_reload: Callable[[list[str]], Any] | None = None,
+    ) -> SchemaWatcher:
+        """Load a schema file or directory and keep its models up to date.
+
+        The watcher is not started: call ``start`` on it to poll from a
+        background thread, or ``check`` to poll from an existing loop.
+        Models it loads are separate from the ones ``load`` returns.
+
+        Args:
+        ----
+            source: The schema file, directory or glob pattern
+            interval: Seconds between two polls of the background thread
+            on_reload: Called with the names of the models rebuilt by a reload
+
+        Returns:
+        -------
+            The watcher, whose ``models`` are built on first access
+
+        """
+        factory = ModelFactory(types, validator_registry, serializer_registry)
+        return SchemaWatcher(source, factory, interval, on_reload)
+
+    @staticmethod
+    def validate_many(
+        model: type[BaseModel],
+        records: Iterable[Any],
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> ValidationResult:
+        """Validate many records against a loaded model.
+
+        Args:
+        ----
+            model: A model returned by ``load`` or ``load_all``
+            records: The records to validate
+            batch_size: Number of records validated per call into pydantic-core
+
+        Returns:
+        -------
+            The valid instances and per-record errors, in input order
+
+        """
+        return validate_many(model, records, batch_size)
+
+    @staticmethod
+    def avalidate_stream(
+        model: type[BaseModel],
+        records: AsyncIterable[Any],
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        executor: Executor | None = None,
+    ) -> AsyncIterator[ValidationResult]:
+        """Validate an asynchronous stream of records against a loaded model.
+
+        Args:
+        ----
+            model: A model returned by ``load`` or ``aload``
+            records: The records to validate, for example from a queue consumer
+            batch_size: Number of records validated per call into pydantic-core
+            concurrency: Maximum number of batches validated at the same time
+            executor: A thread pool, or None for the loop's default executor
+
+        Returns:
+        -------
+            An asynchronous iterator over the results of each batch
 
         """
-        models: dict[str, type[BaseModel]] = SchemaLoader.load_all(source)
-        return models[name]
+        return avalidate_stream(model, records, batch_size, concurrency, executor)
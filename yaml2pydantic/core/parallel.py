@@ -0,0 +1,249 @@
+"""Parallel validation of records across worker processes.
+
+Dynamically built models cannot be pickled, so the models themselves never
+cross a process boundary:
+- Each worker receives the schema source and builds the models once, in
+  its initializer, against the same component modules as the parent
+- Record chunks are validated in the workers, with at most a few chunks in
+  flight so arbitrarily long inputs are streamed, from an iterable or from
+  an asynchronous stream consumed on an event loop
+- Validated instances are sent back by schema key and model name, and are
+  rebuilt in the parent as instances of the parent's own classes
+"""
+
+import asyncio
+import importlib
+import os
+from collections import deque
+from collections.abc import AsyncIterable, AsyncIterator, Iterable, Iterator, Sequence
+from concurrent.futures import Future, ProcessPoolExecutor
+from multiprocessing.context import BaseContext
+from pathlib import Path
+from types import TracebackType
+from typing import Any
+
+from pydantic import BaseModel
+
+from yaml2pydantic.core.cache import dict_key, source_key
+from yaml2pydantic.core.loader import SchemaLoader
+from yaml2pydantic.core.validation import (
+    DEFAULT_BATCH_SIZE,
+    ValidationResult,
+    batched,
+    gc_paused,
+    validate_batch,
+)
+
+# Models of every schema this process validates for, by schema key
+_MODELS: dict[str, dict[str, type[BaseModel]]] = {}
+_WORKER_MODEL: type[BaseModel] | None = None
+
+
+def schema_key(source: str | dict[str, Any]) -> str:
+    """Compute the key identifying a schema source across processes.
+
+    Args:
+    ----
+        source: Either a file path (str) or a dictionary containing the schema
+
+    Returns:
+    -------
+        A hex digest of the schema content
+
+    """
+    if isinstance(source, dict):
+        return dict_key(source)
+    path = Path(source)
+    return source_key(path.read_bytes(), path.suffix)
+
+
+def _reconstruct(key: str, name: str, state: dict[str, Any]) -> BaseModel:
+    """Rebuild an instance sent by a worker as an instance of a local class."""
+    cls = _MODELS[key][name]
+    instance = cls.__new__(cls)
+    instance.__setstate__(state)
+    return instance
+
+
+def _make_picklable(key: str, models: dict[str, type[BaseModel]]) -> None:
+    """Let instances of the worker's models be pickled by schema key and name."""
+
+    def reduce(self: BaseModel) -> tuple[Any, ...]:
+        return _reconstruct, (key, type(self).__name__, self.__getstate__())
+
+    for model in models.values():
+        model.__reduce__ = reduce  # type: ignore[method-assign,assignment]
+
+
+def _init_worker(
+    source: str | dict[str, Any],
+    key: str,
+    model: str,
+    component_modules: Sequence[str],
+) -> None:
+    """Build the models once in a worker process."""
+    global _WORKER_MODEL
+    for module in component_modules:
+        importlib.import_module(module)
+    models = SchemaLoader.load_all(source)
+    _make_picklable(key, models)
+    _WORKER_MODEL = models[model]
+
+
+def _validate_chunk(chunk: list[Any], offset: int) -> ValidationResult:
+    """Validate one chunk of records in a worker process."""
+    assert _WORKER_MODEL is not None
+    with gc_paused():
+        return validate_batch(_WORKER_MODEL, chunk, offset)
+
+
+class ParallelValidator:
+    """Validate records against a schema model on a pool of processes.
+
+    Use it as a context manager so the worker processes are shut down::
+
+        with ParallelValidator("models/user.yaml", "User", workers=8) as pool:
+            for result in pool.validate(records):
+                ...
+    """
+
+    def __init__(
+        self,
+        source: str | dict[str, Any],
+        model: str,
+        workers: int | None = None,
+        chunk_size: int = DEFAULT_BATCH_SIZE,
+        component_modules: Sequence[str] = (),
+        mp_context: BaseContext | None = None,
+    ) -> None:
+        """Initialize the validator and start the worker processes.
+
+        Args:
+        ----
+            source: Either a file path (str) or a dictionary containing the schema
+            model: Name of the model to validate against
+            workers: Number of worker processes (default: number of CPUs)
+            chunk_size: Number of records sent to a worker at a time
+            component_modules: Modules to import in the workers so that custom
+                types, validators and serializers are registered
+            mp_context: The multiprocessing context used to start the workers
+
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        self.key = schema_key(source)
+        if self.key not in _MODELS:
+            _MODELS[self.key] = SchemaLoader.load_all(source)
+        self.models = _MODELS[self.key]
+        self.model = self.models[model]
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=mp_context,
+            initializer=_init_worker,
+            initargs=(source, self.key, model, tuple(component_modules)),
+        )
+
+    def validate(self, records: Iterable[Any]) -> Iterator[ValidationResult]:
+        """Validate records across the worker processes.
+
+        Args:
+        ----
+            records: The records to validate
+
+        Returns:
+        -------
+            An iterator over the result of each chunk, in input order. Valid
+            records are instances of ``self.model``.
+
+        """
+        pending: deque[Future[ValidationResult]] = deque()
+        offset = 0
+        for chunk in batched(records, self.chunk_size):
+            pending.append(self._executor.submit(_validate_chunk, chunk, offset))
+            offset += len(chunk)
+            if len(pending) >= 2 * self.workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+    async def avalidate(
+        self, records: AsyncIterable[Any]
+    ) -> AsyncIterator[ValidationResult]:
+        """Validate an asynchronous stream across the workers.
+
+        No record is taken from the stream while ``2 * workers`` chunks are
+        in flight, so the event loop is never blocked and a slow consumer
+        slows the producer down.
+
+        Args:
+        ----
+            records: The records to validate, for example from a queue consumer
+
+        Returns:
+        -------
+            An asynchronous iterator over the result of each chunk, in input
+            order. Valid records are instances of ``self.model``.
+
+        """
+        pending: deque[asyncio.Future[ValidationResult]] = deque()
+        offset = 0
+        chunk: list[Any] = []
+
+        def submit() -> None:
+            nonlocal offset, chunk
+            future = self._executor.submit(_validate_chunk, chunk, offset)
+            pending.append(asyncio.wrap_future(future))
+            offset += len(chunk)
+            chunk = []
+
+        try:
+            async for record in records:
+                chunk.append(record)
+                if len(chunk) == self.chunk_size:
+                    submit()
+                    if len(pending) >= 2 * self.workers:
+                        yield await pending.popleft()
+            if chunk:
+                submit()
+            while pending:
+                yield await pending.popleft()
+        finally:
+            for future in pending:
+                future.cancel()
+
+    def validate_all(self, records: Iterable[Any]) -> ValidationResult:
+        """Validate records across the workers and merge the results.
+
+        Args:
+        ----
+            records: The records to validate
+
+        Returns:
+        -------
+            The valid instances and per-record errors, in input order
+
+        """
+        merged = ValidationResult()
+        for result in self.validate(records):
+            merged.valid.extend(result.valid)
+            merged.errors.extend(result.errors)
+        return merged
+
+    def close(self) -> None:
+        """Shut down the worker processes."""
+        self._executor.shutdown()
+
+    def __enter__(self) -> "ParallelValidator":
+        """Enter the context manager."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Shut down the worker processes."""
+        self.close()
@@ -0,0 +1,114 @@
+"""Parser backends for schema files.
+
+Each file format is read by a named backend, a function from the raw bytes
+of a file to the schema definitions:
+- ``yaml`` uses the libyaml C loader when PyYAML was built with it, and the
+  pure-Python loader otherwise
+- ``yaml-python`` always uses the pure-Python loader
+- ``json`` uses the standard library
+- ``orjson`` is registered when the optional ``orjson`` package is installed
+
+Another backend is selected for a format with ``parsers.use``.
+"""
+
+import json
+from collections.abc import Callable, Iterable
+from typing import Any
+
+import yaml
+
+Parser = Callable[[bytes], Any]
+
+YAML_LOADER: type[yaml.SafeLoader] = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def parse_yaml(data: bytes) -> Any:
+    """Parse YAML with the fastest safe loader available."""
+    return yaml.load(data, Loader=YAML_LOADER)  # nosec B506
+
+
+def parse_yaml_python(data: bytes) -> Any:
+    """Parse YAML with the pure-Python safe loader."""
+    return yaml.load(data, Loader=yaml.SafeLoader)  # nosec B506
+
+
+def parse_json(data: bytes) -> Any:
+    """Parse JSON with the standard library."""
+    return json.loads(data)
+
+
+class ParserRegistry:
+    """Registry of parser backends and of the backend used for each format.
+
+    Formats are identified by file suffix, such as ``.yaml``.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty parser registry."""
+        self.backends: dict[str, Parser] = {}
+        self.formats: dict[str, str] = {}
+
+    def register(self, name: str, parser: Parser, suffixes: Iterable[str] = ()) -> None:
+        """Register a parser backend.
+
+        Args:
+        ----
+            name: Name of the backend
+            parser: Function parsing the raw content of a file
+            suffixes: File suffixes the backend becomes the default for
+
+        """
+        self.backends[name] = parser
+        for suffix in suffixes:
+            self.formats[suffix] = name
+
+    def use(self, name: str, suffixes: Iterable[str]) -> None:
+        """Select the backend used for some file formats.
+
+        Args:
+        ----
+            name: Name of a registered backend
+            suffixes: File suffixes to parse with the backend
+
+        Raises:
+        ------
+            KeyError: If the backend is not registered
+
+        """
+        if name not in self.backends:
+            raise KeyError(name)
+        for suffix in suffixes:
+            self.formats[suffix] = name
+
+    def get(self, suffix: str) -> Parser:
+        """Get the parser for a file format.
+
+        Args:
+        ----
+            suffix: The file suffix, such as ``.yaml``
+
+        Returns:
+        -------
+            The parser of the backend selected for the format
+
+        Raises:
+        ------
+            ValueError: If no backend parses the format
+
+        """
+        if suffix not in self.formats:
+            raise ValueError(f"Unsupported file format: {suffix}")
+        return self.backends[self.formats[suffix]]
+
+
+parsers = ParserRegistry()
+parsers.register("yaml", parse_yaml, [".yaml", ".yml"])
+parsers.register("yaml-python", parse_yaml_python)
+parsers.register("json", parse_json, [".json"])
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    pass
+else:
+    parsers.register("orjson", orjson.loads)
@@ -0,0 +1,185 @@
+"""Profiling of the validators and serializers called by generated models.
+
+A ``Profiler`` given to ``ModelFactory`` wraps every validator and
+serializer the factory attaches, and aggregates per (model, field,
+component):
+- The number of calls
+- The cumulative time spent in the component
+- The number of calls that raised
+
+Each thread accumulates into its own table, so recording takes no lock, and
+the tables are merged when the stats are read. Factories without a profiler
+attach the components unwrapped. Validators lowered to native constraints
+are enforced by pydantic-core and are not profiled.
+"""
+
+import functools
+import json
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from typing import Any
+
+# (model, field, component); the field is None for model validators
+StatsKey = tuple[str, str | None, str]
+
+
+@dataclass
+class ComponentStats:
+    """Calls of one component on one field of one model.
+
+    Attributes
+    ----------
+        model: The name of the model
+        field: The name of the field, or None for a model validator
+        component: The name of the validator or serializer
+        calls: Number of calls
+        total_time: Seconds spent in the component
+        failures: Number of calls that raised
+
+    """
+
+    model: str
+    field: str | None
+    component: str
+    calls: int = 0
+    total_time: float = 0.0
+    failures: int = 0
+
+    @property
+    def mean_time(self) -> float:
+        """Average seconds per call."""
+        return self.total_time / self.calls if self.calls else 0.0
+
+
+class Profiler:
+    """Thread-safe aggregator of the calls of profiled components."""
+
+    def __init__(self) -> None:
+        """Initialize a profiler with no recorded calls."""
+        self._local = threading.local()
+        self._tables: list[dict[StatsKey, list[Any]]] = []
+        self._lock = threading.Lock()
+
+    def _table(self) -> dict[StatsKey, list[Any]]:
+        """Get the table of the current thread, creating it on first use."""
+        table: dict[StatsKey, list[Any]] | None = getattr(self._local, "table", None)
+        if table is None:
+            table = self._local.table = {}
+            with self._lock:
+                self._tables.append(table)
+        return table
+
+    def record(self, key: StatsKey, elapsed: float, failed: bool) -> None:
+        """Record one call of a component.
+
+        Args:
+        ----
+            key: The model, field and component called
+            elapsed: The duration of the call, in seconds
+            failed: Whether the call raised
+
+        """
+        table = self._table()
+        entry = table.get(key)
+        if entry is None:
+            entry = table[key] = [0, 0.0, 0]
+        entry[0] += 1
+        entry[1] += elapsed
+        if failed:
+            entry[2] += 1
+
+    def wrap(
+        self, function: Callable, model: str, field: str | None, component: str
+    ) -> Callable:
+        """Wrap a component so that its calls are recorded.
+
+        The wrapper keeps the signature of the function, so Pydantic calls
+        it the same way.
+
+        Args:
+        ----
+            function: The validator or serializer
+            model: The model it is attached to
+            field: The field it is attached to, or None for a model validator
+            component: The name of the component
+
+        Returns:
+        -------
+            The profiled function
+
+        """
+        key: StatsKey = (model, field, component)
+        record = self.record
+        clock = time.perf_counter
+
+        @functools.wraps(function)
+        def profiled(*args: Any, **kwargs: Any) -> Any:
+            failed = True
+            start = clock()
+            try:
+                result = function(*args, **kwargs)
+                failed = False
+                return result
+            finally:
+                record(key, clock() - start, failed)
+
+        return profiled
+
+    def stats(self) -> list[ComponentStats]:
+        """Get the stats recorded so far, merged across threads.
+
+        Returns
+        -------
+            The stats of every profiled component, most time-consuming first
+
+        """
+        merged: dict[StatsKey, ComponentStats] = {}
+        with self._lock:
+            tables = list(self._tables)
+        for table in tables:
+            for key, (calls, total_time, failures) in list(table.items()):
+                stats = merged.get(key)
+                if stats is None:
+                    stats = merged[key] = ComponentStats(*key)
+                stats.calls += calls
+                stats.total_time += total_time
+                stats.failures += failures
+        return sorted(merged.values(), key=lambda s: s.total_time, reverse=True)
+
+    def dump(self) -> str:
+        """Get the stats as a JSON document."""
+        return json.dumps(
+            [{**asdict(s), "mean_time": s.mean_time} for s in self.stats()], indent=2
+        )
+
+    def format(self, n: int = 20) -> str:
+        """Get the stats as a human-readable table.
+
+        Args:
+        ----
+            n: Number of components to list
+
+        Returns:
+        -------
+            The ``n`` most time-consuming components
+
+        """
+        lines = [
+            f"{'model.field':<40} {'component':<20} {'calls':>9} {'total ms':>10}"
+            f" {'mean us':>9} {'failures':>9}"
+        ]
+        for s in self.stats()[:n]:
+            location = f"{s.model}.{s.field}" if s.field else s.model
+            lines.append(
+                f"{location:<40} {s.component:<20} {s.calls:9d}"
+                f" {s.total_time * 1000:10.2f} {s.mean_time * 1e6:9.2f} {s.failures:9d}"
+            )
+        return "\n".join(lines)
+
+    def reset(self) -> None:
+        """Forget every call recorded so far."""
+        with self._lock:
+            for table in self._tables:
+                table.clear()
@@ -5,12 +5,18 @@ This module provides access to the global registries for:
 - Validators (field and model)
 - Serializers (field)
 
-These registries are populated automatically when schema components
-are imported from the components directory.
+These registries import the built-in schema components when a schema
+first uses them, and can be layered and frozen (see ``core.scopes``).
 """
 
+from yaml2pydantic.core.scopes import FrozenRegistryError
 from yaml2pydantic.core.serializers import SerializerRegistry
 from yaml2pydantic.core.type_registry import TypeRegistry
 from yaml2pydantic.core.validators import ValidatorRegistry
 
-__all__ = ["SerializerRegistry", "TypeRegistry", "ValidatorRegistry"]
+__all__ = [
+    "FrozenRegistryError",
+    "SerializerRegistry",
+    "TypeRegistry",
+    "ValidatorRegistry",
+]
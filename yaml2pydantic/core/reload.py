@@ -0,0 +1,153 @@
+"""Hot reload of schema files in long-running processes.
+
+A watcher polls a schema file or directory and, when something changed:
+- Re-parses the changed files only, through the directory's per-file cache
+- Compares the new definition of every affected model with the one it was
+  built from
+- Rebuilds the changed models and the models that depend on them, so every
+  other model keeps its class
+"""
+
+import logging
+import threading
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from yaml2pydantic.core.directory import SchemaDirectory, is_collection
+from yaml2pydantic.core.factory import LazyModels, ModelFactory
+from yaml2pydantic.core.parsers import parsers
+
+logger = logging.getLogger(__name__)
+
+
+class SchemaWatcher:
+    """Keep the models of a schema source up to date with its files.
+
+    Use ``check`` to poll from an existing loop, or ``start`` to poll from a
+    background thread::
+
+        watcher = SchemaWatcher("models/", factory, on_reload=print)
+        watcher.start()
+        User = watcher.models["User"]
+
+    Attributes
+    ----------
+        source: The schema file, directory or glob pattern
+        models: The models of the source, built on first access
+        interval: Seconds between two polls of the background thread
+        on_reload: Called with the names of the models rebuilt by a reload
+
+    """
+
+    def __init__(
+        self,
+        source: str,
+        factory: ModelFactory,
+        interval: float = 1.0,
+        on_reload: Callable[[list[str]], Any] | None = None,
+    ) -> None:
+        """Initialize the watcher and read the source.
+
+        Args:
+        ----
+            source: The schema file, directory or glob pattern
+            factory: The factory the models are built with
+            interval: Seconds between two polls of the background thread
+            on_reload: Called with the names of the models rebuilt by a reload
+
+        """
+        self.source = source
+        self.interval = interval
+        self.on_reload = on_reload
+        self._directory: SchemaDirectory | None = None
+        self._stat: tuple[int, int] | None = None
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+        if is_collection(source):
+            self._directory = SchemaDirectory(source)
+            self.models = factory.build_lazy(self._directory)
+        else:
+            self.models = factory.build_lazy(self._read_file())
+
+    def _read_file(self) -> dict[str, Any]:
+        """Parse the source file and remember its modification time and size."""
+        path = Path(self.source)
+        stat = path.stat()
+        self._stat = (stat.st_mtime_ns, stat.st_size)
+        definitions: dict[str, Any] = parsers.get(path.suffix)(path.read_bytes())
+        return definitions
+
+    def _changed_names(self, models: LazyModels) -> set[str] | None:
+        """Re-read what changed, and get the models that may be affected.
+
+        Returns
+        -------
+            The candidate names, None for every model, or an empty set if
+            nothing changed
+
+        """
+        if self._directory is not None:
+            before = self._directory.index
+            paths = self._directory.refresh()
+            if not paths:
+                return set()
+            after = self._directory.index
+            return {
+                name
+                for name, path in [*before.items(), *after.items()]
+                if path in paths
+            }
+
+        stat = Path(self.source).stat()
+        if (stat.st_mtime_ns, stat.st_size) == self._stat:
+            return set()
+        models.definitions = self._read_file()
+        return None
+
+    def check(self) -> list[str]:
+        """Poll the source once and rebuild what changed.
+
+        Returns
+        -------
+            The names of the rebuilt models
+
+        """
+        with self._lock:
+            candidates = self._changed_names(self.models)
+            if candidates is not None and not candidates:
+                return []
+            rebuilt = self.models.rebuild(self.models.changed(candidates))
+        if rebuilt:
+            logger.info("Reloaded %d models from %s", len(rebuilt), self.source)
+            if self.on_reload is not None:
+                self.on_reload(rebuilt)
+        return rebuilt
+
+    def _run(self) -> None:
+        """Poll the source until the watcher is stopped."""
+        while not self._stop.wait(self.interval):
+            try:
+                self.check()
+            except Exception:
+                logger.exception("Failed to reload %s", self.source)
+
+    def start(self) -> None:
+        """Start polling the source from a daemon thread."""
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name=f"yaml2pydantic-watch:{self.source}", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the background thread, waiting for the current poll to end."""
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
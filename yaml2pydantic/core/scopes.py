@@ -0,0 +1,209 @@
+"""Scopes shared by the type, validator and serializer registries.
+
+Registries can be layered and frozen:
+- ``child()`` creates a registry that sees every component of its parent,
+  and keeps the components registered on it to itself
+- ``freeze()`` makes a registry read-only, so it can be shared by threads
+  that each register into a child of it
+
+Writes never reach a parent, so a child is a copy-on-write view of the
+registries below it. Component modules imported through an index register
+themselves on import; a frozen registry skips those registrations instead
+of failing the import. Lookups read plain dictionaries and take no lock;
+registrations are serialized by a lock per registry.
+Every ``ModelFactory`` registers the models it builds into a child of its
+type registry, so concurrent builds do not see each other's models.
+"""
+
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any, ClassVar, Self
+
+from yaml2pydantic.core.discovery import ComponentIndex
+
+
+class FrozenRegistryError(RuntimeError):
+    """Raised when registering a component into a frozen registry."""
+
+
+# Depth of the index-driven imports running on each thread
+_imports = threading.local()
+
+
+@contextmanager
+def importing_components() -> Iterator[None]:
+    """Mark the imports of a block as driven by a component index.
+
+    Registrations into frozen registries made by the imported modules are
+    skipped while the block runs, since the index resolves the components.
+    """
+    _imports.depth = getattr(_imports, "depth", 0) + 1
+    try:
+        yield
+    finally:
+        _imports.depth -= 1
+
+
+class ScopedRegistry:
+    """Base of the registries, layered over an optional parent.
+
+    Attributes
+    ----------
+        index: Index of the components to import on first use. Only the
+            root of a chain of registries imports components
+        parent: The registry looked up for the names this one does not know
+        frozen: Whether registering is forbidden
+
+    """
+
+    # Bumped by a rebind in any registry, so that children can check their
+    # caches against every parent with a single comparison
+    rebinds: ClassVar[int] = 0
+
+    def __init__(
+        self, index: ComponentIndex | None = None, parent: Self | None = None
+    ) -> None:
+        """Initialize an empty registry.
+
+        Args:
+        ----
+            index: Optional index of the components to import on first use
+            parent: Optional registry to fall back on
+
+        """
+        self.index = index
+        self.parent = parent
+        self.frozen = False
+        self._generation = 0
+        self._cache_rebinds = self.rebinds
+        # Serializes registrations and the caches they invalidate
+        self._lock = threading.Lock()
+
+    @property
+    def generation(self) -> int:
+        """Number of times a name was rebound, here or in a parent."""
+        if self.parent is None:
+            return self._generation
+        return self._generation + self.parent.generation
+
+    def child(self) -> Self:
+        """Create an empty registry layered over this one.
+
+        Returns
+        -------
+            A registry seeing the components of this one, whose own
+            registrations do not change this one
+
+        """
+        return type(self)(parent=self)
+
+    def freeze(self) -> Self:
+        """Forbid registering into this registry.
+
+        Returns
+        -------
+            The registry itself
+
+        """
+        self.frozen = True
+        return self
+
+    def _components(self) -> dict[str, Any]:
+        """Get the components registered in this registry itself."""
+        raise NotImplementedError
+
+    def _add(self, name: str, component: Any) -> None:
+        """Register a component imported through the index."""
+        raise NotImplementedError
+
+    def _find(self, name: str) -> Any:
+        """Find a registered component by name, here or in a parent."""
+        registry: ScopedRegistry | None = self
+        while registry is not None:
+            component = registry._components().get(name)
+            if component is not None:
+                return component
+            registry = registry.parent
+        return None
+
+    def _load(self, kind: str, name: str) -> Any:
+        """Import a component from the index of the root registry.
+
+        The component is registered in the root unless it is frozen.
+
+        Args:
+        ----
+            kind: The kind of component, as named in the index
+            name: The name of the component
+
+        Returns:
+        -------
+            The imported component
+
+        Raises:
+        ------
+            KeyError: If the index does not know the component
+
+        """
+        root = self
+        while root.parent is not None:
+            root = root.parent
+        with importing_components():
+            component = root.index.load(kind, name) if root.index else None
+        if component is None:
+            raise KeyError(name)
+        if not root.frozen:
+            root._add(name, component)
+        return component
+
+    def _caches_stale(self) -> bool:
+        """Check whether a name was rebound anywhere since the last check.
+
+        A parent may have rebound a name, so anything a registry derived
+        from its parents' components must be dropped when this is True.
+        """
+        if self._cache_rebinds == ScopedRegistry.rebinds:
+            return False
+        self._cache_rebinds = ScopedRegistry.rebinds
+        return True
+
+    @staticmethod
+    def _declare(component: Any, attribute: str, value: Any) -> None:
+        """Attach a declaration, such as native constraints, to a component.
+
+        Declarations live on the component rather than in a registry, so
+        every registry holding it sees them, including a frozen one that
+        skipped registering it.
+        """
+        setattr(component, attribute, value)
+
+    def _rebound(self) -> None:
+        """Record that a name was rebound to another component."""
+        self._generation += 1
+        ScopedRegistry.rebinds += 1
+
+    def _check_writable(self, name: str) -> bool:
+        """Check whether a component may be registered.
+
+        Args:
+        ----
+            name: The name of the component
+
+        Returns:
+        -------
+            False if the registry is frozen and the registration comes from
+            a module imported through an index, so it must be skipped
+
+        Raises:
+        ------
+            FrozenRegistryError: If the registry is frozen otherwise
+
+        """
+        if not self.frozen:
+            return True
+        if getattr(_imports, "depth", 0):
+            return False
+        raise FrozenRegistryError(
+            f"Cannot register {name!r} in a frozen {type(self).__name__}"
+        )
@@ -1,31 +1,118 @@
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
+from typing import Any, Literal
 
+from pydantic import PlainSerializer
+from pydantic_core import PydanticUndefined
 
-class SerializerRegistry:
+from yaml2pydantic.core.discovery import ComponentIndex, component_index
+from yaml2pydantic.core.scopes import ScopedRegistry
+
+WhenUsed = Literal["always", "unless-none", "json", "json-unless-none"]
+OPTIONS_ATTRIBUTE = "_serializer_options"
+
+
+def chain(*functions: Callable[[Any], Any]) -> Callable[[Any], Any]:
+    """Compose serializers into one function, applied in order.
+
+    Args:
+    ----
+        functions: The serializers of a field, in the order they apply
+
+    Returns:
+    -------
+        A function passing the value through every serializer
+
+    """
+    if len(functions) == 1:
+        return functions[0]
+
+    def chained(value: Any) -> Any:
+        for function in functions:
+            value = function(value)
+        return value
+
+    chained.__name__ = "_".join(f.__name__ for f in functions)
+    return chained
+
+
+class SerializerRegistry(ScopedRegistry):
     """Registry for managing field serializers.
 
     This class maintains a registry of custom serializers that can be
     used to customize field serialization in the generated models.
+    Serializers are attached to fields as ``PlainSerializer`` metadata, so
+    pydantic-core calls them directly, once per field and chain.
+    ``generation`` is bumped whenever a name is rebound to another function.
+    A registry given a ``ComponentIndex`` imports the serializers it does not
+    know yet when they are first requested, and a child registry falls back
+    on its parent.
     """
 
-    def __init__(self) -> None:
-        """Initialize an empty serializer registry."""
+    def __init__(
+        self,
+        index: ComponentIndex | None = None,
+        parent: "SerializerRegistry | None" = None,
+    ) -> None:
+        """Initialize an empty serializer registry.
+
+        Args:
+        ----
+            index: Optional index of the serializers to import on first use
+            parent: Optional registry to look up unknown names in
+
+        """
+        super().__init__(index, parent)
         self.serializers: dict[str, Callable] = {}
+        self.options: dict[str, dict[str, Any]] = {}
+        self._attached: dict[tuple[str, ...], PlainSerializer] = {}
 
-    def serializer(self, func: Callable) -> Callable:
+    def serializer(
+        self,
+        func: Callable | None = None,
+        *,
+        when_used: WhenUsed = "always",
+        return_type: Any = PydanticUndefined,
+    ) -> Callable:
         """Register a serializer function.
 
+        Can be used as ``@registry.serializer`` or, with options, as
+        ``@registry.serializer(when_used="json", return_type=str)``.
+
         Args:
         ----
             func: The serializer function to register
+            when_used: When pydantic applies the serializer
+            return_type: The type the serializer returns, which lets
+                pydantic-core serialize the result without inspecting it
 
         Returns:
         -------
             The original function (for use as a decorator)
 
+        Raises:
+        ------
+            FrozenRegistryError: If the registry is frozen, outside of an
+                index-driven import
+
         """
-        self.serializers[func.__name__] = func
-        return func
+
+        def register(func: Callable) -> Callable:
+            if when_used != "always" or return_type is not PydanticUndefined:
+                options = {"when_used": when_used, "return_type": return_type}
+                self._declare(func, OPTIONS_ATTRIBUTE, options)
+            if not self._check_writable(func.__name__):
+                return func
+            with self._lock:
+                if self._find(func.__name__) not in (None, func):
+                    self._rebound()
+                self.serializers[func.__name__] = func
+                self.options[func.__name__] = getattr(func, OPTIONS_ATTRIBUTE, {})
+                self._attached.clear()
+            return func
+
+        if func is None:
+            return register
+        return register(func)
 
     def get(self, name: str) -> Callable:
         """Get a serializer by name.
@@ -43,7 +130,88 @@ class SerializerRegistry:
             KeyError: If the serializer is not found
 
         """
-        return self.serializers[name]
+        func: Callable | None = self._find(name)
+        if func is None:
+            func = self._load("serializers", name)
+        return func
+
+    def _components(self) -> dict[str, Any]:
+        """Get the serializers registered in this registry itself."""
+        return self.serializers
+
+    def _add(self, name: str, component: Any) -> None:
+        """Register a serializer imported through the index."""
+        self.serializer(component)
+
+    def chain_options(self, names: Sequence[str]) -> dict[str, Any]:
+        """Get the ``PlainSerializer`` options of a chain of serializers.
+
+        The chain returns what its last serializer returns, and applies
+        when all of its serializers apply.
+
+        Args:
+        ----
+            names: Names of the serializers, in the order they apply
+
+        Returns:
+        -------
+            The non-default options of the chain
+
+        Raises:
+        ------
+            KeyError: If a serializer is not found
+            ValueError: If the serializers apply in different modes
+
+        """
+        declared = [getattr(self.get(name), OPTIONS_ATTRIBUTE, {}) for name in names]
+        modes = {options.get("when_used", "always") for options in declared}
+        if len(modes) > 1:
+            raise ValueError(f"Serializers {list(names)} apply in different modes")
+        options: dict[str, Any] = {}
+        when_used = modes.pop()
+        if when_used != "always":
+            options["when_used"] = when_used
+        return_type = declared[-1].get("return_type", PydanticUndefined)
+        if return_type is not PydanticUndefined:
+            options["return_type"] = return_type
+        return options
+
+    def plain_serializer(
+        self,
+        names: Sequence[str],
+        wrap: Callable[[str, Callable], Callable] | None = None,
+    ) -> PlainSerializer:
+        """Get the serializer metadata for a field's chain of serializers.
+
+        The metadata is created once per chain and shared by every field
+        using it, unless the serializers are wrapped.
+
+        Args:
+        ----
+            names: Names of the serializers, in the order they apply
+            wrap: Optional function of a serializer's name and function,
+                returning the function to call instead
+
+        Returns:
+        -------
+            A ``PlainSerializer`` applying the whole chain in one call
+
+        Raises:
+        ------
+            KeyError: If a serializer is not found
+            ValueError: If the serializers apply in different modes
+
+        """
+        key = tuple(names)
+        if self._caches_stale():
+            self._attached.clear()
+        if wrap is not None:
+            function = chain(*(wrap(name, self.get(name)) for name in names))
+            return PlainSerializer(function, **self.chain_options(key))
+        if key not in self._attached:
+            function = chain(*(self.get(name) for name in names))
+            self._attached[key] = PlainSerializer(function, **self.chain_options(key))
+        return self._attached[key]
 
 
-serializer_registry = SerializerRegistry()
+serializer_registry = SerializerRegistry(component_index)
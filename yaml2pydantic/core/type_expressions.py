@@ -0,0 +1,187 @@
+"""Parser for the type expressions used in schema definitions.
+
+The grammar covers the expressions a schema can use for a field type:
+- Plain names: ``str``, ``Address``
+- Subscripted generics: ``list[int]``, ``dict[str, list[Address]]``
+- Special forms: ``Optional[str]``, ``Union[int, str]``, ``Literal["a", 1]``
+- Unions written with ``|``: ``int | str | None``
+
+Parsing is pure, so parsed expressions are cached for the life of the process.
+"""
+
+import ast
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any
+
+_TOKEN = re.compile(
+    r"""\s*(?:
+        (?P<string>"(?:[^"\\]|\\.)*"|'(?:[^'\\]|\\.)*')
+        |(?P<number>-?\d+(?:\.\d+)?)
+        |(?P<name>[A-Za-z_][A-Za-z0-9_]*)
+        |(?P<punct>[\[\],|])
+    )""",
+    re.VERBOSE,
+)
+_CONSTANTS = {"None": None, "True": True, "False": False}
+
+# Names handled by the parser and the registries, never looked up as types
+SPECIAL_FORMS = frozenset({"Literal", "Optional", "Union"})
+
+
+@dataclass(frozen=True)
+class Name:
+    """A reference to a named type, such as ``str`` or ``Address``."""
+
+    name: str
+
+
+@dataclass(frozen=True)
+class Constant:
+    """A literal value, such as the arguments of ``Literal[...]``."""
+
+    value: Any
+
+
+@dataclass(frozen=True)
+class Subscript:
+    """A subscripted type, such as ``list[int]`` or ``Optional[str]``."""
+
+    name: str
+    args: tuple["TypeExpression", ...]
+
+
+@dataclass(frozen=True)
+class UnionOf:
+    """A union written with ``|``, such as ``int | None``."""
+
+    options: tuple["TypeExpression", ...]
+
+
+TypeExpression = Name | Constant | Subscript | UnionOf
+
+
+def names(expression: TypeExpression) -> set[str]:
+    """Get every type name referenced by an expression.
+
+    Args:
+    ----
+        expression: A parsed type expression
+
+    Returns:
+    -------
+        The names of the types and special forms used, without literal values
+
+    """
+    if isinstance(expression, Name):
+        return {expression.name}
+    if isinstance(expression, Subscript):
+        found = {expression.name}
+        for arg in expression.args:
+            found |= names(arg)
+        return found
+    if isinstance(expression, UnionOf):
+        found = set()
+        for option in expression.options:
+            found |= names(option)
+        return found
+    return set()
+
+
+class _Parser:
+    """Recursive descent parser over the tokens of one expression."""
+
+    def __init__(self, source: str) -> None:
+        self.source = source
+        self.tokens: list[tuple[str, str]] = []
+        position = 0
+        stripped = source.rstrip()
+        while position < len(stripped):
+            match = _TOKEN.match(stripped, position)
+            if match is None or match.end() == position:
+                raise ValueError(f"Invalid type expression: {source!r}")
+            kind = match.lastgroup
+            assert kind is not None
+            self.tokens.append((kind, match.group(kind)))
+            position = match.end()
+        self.position = 0
+
+    def _peek(self) -> tuple[str, str] | None:
+        if self.position < len(self.tokens):
+            return self.tokens[self.position]
+        return None
+
+    def _expect(self, value: str) -> None:
+        token = self._peek()
+        if token is None or token[1] != value:
+            raise ValueError(f"Invalid type expression: {self.source!r}")
+        self.position += 1
+
+    def parse(self) -> TypeExpression:
+        expression = self._union()
+        if self._peek() is not None:
+            raise ValueError(f"Invalid type expression: {self.source!r}")
+        return expression
+
+    def _union(self) -> TypeExpression:
+        options = [self._term()]
+        while (token := self._peek()) is not None and token[1] == "|":
+            self.position += 1
+            options.append(self._term())
+        if len(options) == 1:
+            return options[0]
+        return UnionOf(tuple(options))
+
+    def _term(self) -> TypeExpression:
+        token = self._peek()
+        if token is None:
+            raise ValueError(f"Invalid type expression: {self.source!r}")
+        kind, value = token
+        self.position += 1
+
+        if kind == "string":
+            try:
+                return Constant(ast.literal_eval(value))
+            except (SyntaxError, ValueError) as e:
+                raise ValueError(f"Invalid type expression: {self.source!r}") from e
+        if kind == "number":
+            return Constant(float(value) if "." in value else int(value))
+        if kind != "name":
+            raise ValueError(f"Invalid type expression: {self.source!r}")
+
+        following = self._peek()
+        if following is None or following[1] != "[":
+            if value in _CONSTANTS:
+                return Constant(_CONSTANTS[value])
+            return Name(value)
+
+        self.position += 1
+        args = [self._union()]
+        while (token := self._peek()) is not None and token[1] == ",":
+            self.position += 1
+            if (token := self._peek()) is not None and token[1] == "]":
+                break
+            args.append(self._union())
+        self._expect("]")
+        return Subscript(value, tuple(args))
+
+
+@lru_cache(maxsize=4096)
+def parse_type(source: str) -> TypeExpression:
+    """Parse a type expression.
+
+    Args:
+    ----
+        source: The type expression from the schema
+
+    Returns:
+    -------
+        The parsed expression
+
+    Raises:
+    ------
+        ValueError: If the expression is not valid
+
+    """
+    return _Parser(source).parse()
@@ -1,9 +1,34 @@
+from collections import OrderedDict
 from datetime import datetime
-from typing import ClassVar
+from typing import Any, ClassVar, Literal, Optional, Union
 
+from yaml2pydantic.core.discovery import ComponentIndex, component_index
+from yaml2pydantic.core.scopes import ScopedRegistry
+from yaml2pydantic.core.type_expressions import (
+    Constant,
+    Name,
+    TypeExpression,
+    UnionOf,
+    names,
+    parse_type,
+)
 
-class TypeRegistry:
-    """Registry for custom types."""
+
+class TypeRegistry(ScopedRegistry):
+    """Registry for custom types.
+
+    Type expressions are parsed once and the resolved types are kept in an
+    LRU cache keyed on the expression. Registering a name only invalidates
+    the cached expressions that reference it.
+
+    ``generation`` is bumped whenever a name is rebound to another type, so
+    callers holding models built against the registry can tell they are
+    stale. Models registered by a factory while it builds are not tracked.
+
+    A registry given a ``ComponentIndex`` imports the custom types it does not
+    know yet when they are first resolved. A child registry resolves the
+    names it does not know through its parent, and keeps its own cache.
+    """
 
     BUILTIN_TYPES: ClassVar[dict[str, type]] = {
         "str": str,
@@ -13,20 +38,160 @@ class TypeRegistry:
         "datetime": datetime,
     }
 
-    def __init__(self) -> None:
-        """Initialize an empty type registry."""
+    GENERIC_TYPES: ClassVar[dict[str, type]] = {
+        "list": list,
+        "dict": dict,
+        "set": set,
+        "frozenset": frozenset,
+        "tuple": tuple,
+        "List": list,
+        "Dict": dict,
+        "Set": set,
+        "FrozenSet": frozenset,
+        "Tuple": tuple,
+    }
+
+    CACHE_SIZE: ClassVar[int] = 4096
+
+    def __init__(
+        self,
+        index: ComponentIndex | None = None,
+        parent: "TypeRegistry | None" = None,
+    ) -> None:
+        """Initialize an empty type registry.
+
+        Args:
+        ----
+            index: Optional index of the types to import on first use
+            parent: Optional registry to resolve unknown names through
+
+        """
+        super().__init__(index, parent)
         self.custom_types: dict[str, type] = {}
+        self._cache: OrderedDict[str, Any] = OrderedDict()
+        self._dependents: dict[str, set[str]] = {}
+        # Bumped by every registration, so a resolution racing one is not cached
+        self._registrations = 0
+
+    def register(self, name: str, type_class: type, track: bool = True) -> None:
+        """Register a custom type.
+
+        Args:
+        ----
+            name: The name the type is referenced by in schemas
+            type_class: The type
+            track: Whether rebinding the name bumps ``generation``
+
+        Raises:
+        ------
+            FrozenRegistryError: If the registry is frozen, outside of an
+                index-driven import
 
-    def register(self, name: str, type_class: type) -> None:
-        """Register a custom type."""
-        self.custom_types[name] = type_class
+        """
+        if not self._check_writable(name):
+            return
+        with self._lock:
+            existing = self.find(name)
+            if track and existing is not None and existing is not type_class:
+                self._rebound()
+            self.custom_types[name] = type_class
+            self._registrations += 1
+            for type_str in self._dependents.pop(name, ()):
+                self._cache.pop(type_str, None)
+
+    def find(self, name: str) -> Any:
+        """Find a registered custom type by name, here or in a parent.
+
+        Args:
+        ----
+            name: The name the type is referenced by in schemas
+
+        Returns:
+        -------
+            The type, or None if no registry knows the name
+
+        """
+        return self._find(name)
 
     def resolve(self, type_str: str) -> type | None:
         """Resolve a type string to a Python type."""
-        if type_str.startswith("Optional["):
-            inner = type_str[9:-1]
-            return self.resolve(inner) | None  # type: ignore
-        return self.BUILTIN_TYPES.get(type_str) or self.custom_types[type_str]
+        with self._lock:
+            if self.parent is not None and self._caches_stale():
+                self._cache.clear()
+                self._dependents.clear()
+            try:
+                self._cache.move_to_end(type_str)
+                return self._cache[type_str]  # type: ignore[no-any-return]
+            except KeyError:
+                registrations = self._registrations
+
+        # Converting may import and register types, so it runs unlocked
+        expression = parse_type(type_str)
+        resolved = self._convert(expression)
+
+        with self._lock:
+            if registrations == self._registrations:
+                self._cache[type_str] = resolved
+                for name in names(expression):
+                    self._dependents.setdefault(name, set()).add(type_str)
+                if len(self._cache) > self.CACHE_SIZE:
+                    evicted, _ = self._cache.popitem(last=False)
+                    self._forget(evicted)
+        return resolved  # type: ignore[no-any-return]
+
+    def _forget(self, type_str: str) -> None:
+        """Drop an evicted expression from the dependents of its names."""
+        for name in names(parse_type(type_str)):
+            dependents = self._dependents.get(name)
+            if dependents is not None:
+                dependents.discard(type_str)
+                if not dependents:
+                    del self._dependents[name]
+
+    def _lookup(self, name: str) -> Any:
+        """Resolve a single type name."""
+        if name in self.BUILTIN_TYPES:
+            return self.BUILTIN_TYPES[name]
+        type_class = self.find(name)
+        if type_class is not None:
+            return type_class
+        if name in self.GENERIC_TYPES:
+            return self.GENERIC_TYPES[name]
+        return self._load("types", name)
+
+    def _components(self) -> dict[str, Any]:
+        """Get the custom types registered in this registry itself."""
+        return self.custom_types
+
+    def _add(self, name: str, component: Any) -> None:
+        """Register a custom type imported through the index."""
+        self.register(name, component)
+
+    def _convert(self, expression: TypeExpression) -> Any:
+        """Convert a parsed type expression to a Python type."""
+        if isinstance(expression, Name):
+            return self._lookup(expression.name)
+        if isinstance(expression, Constant):
+            if expression.value is None:
+                return None
+            raise ValueError(f"Unexpected literal in type: {expression.value!r}")
+        if isinstance(expression, UnionOf):
+            return Union[tuple(self._convert(o) for o in expression.options)]  # noqa: UP007
+
+        name, args = expression.name, expression.args
+        if name == "Literal":
+            if not all(isinstance(arg, Constant) for arg in args):
+                raise ValueError("Literal[...] only accepts literal values")
+            return Literal[tuple(arg.value for arg in args)]  # type: ignore[union-attr]
+        converted = tuple(self._convert(arg) for arg in args)
+        if name == "Optional":
+            if len(converted) != 1:
+                raise ValueError("Optional[...] takes a single type")
+            return Optional[converted[0]]  # noqa: UP045
+        if name == "Union":
+            return Union[converted]  # noqa: UP007
+        origin = self._lookup(name)
+        return origin[converted if len(converted) > 1 else converted[0]]
 
 
-types = TypeRegistry()
+types = TypeRegistry(component_index)
@@ -0,0 +1,510 @@
+"""Bulk validation of records against generated models.
+
+Records are validated in batches through a cached ``TypeAdapter`` over a
+list of the model, so each batch crosses into pydantic-core once. Invalid
+records are reported per row instead of aborting the whole run. JSON lines
+are validated from their raw text, so nothing is parsed twice in Python:
+- Clean batches go through a plain ``list[Model]`` adapter
+- Once a batch has failed, the following batches use a tolerant adapter
+  that captures each record's errors in place, until a batch is clean again
+- The cyclic garbage collector can be paused while a batch is validated,
+  since allocating thousands of instances triggers repeated collections
+- Asynchronous streams are validated from an event loop, with batches
+  handed to a worker pool and a bounded number of batches in flight
+"""
+
+import asyncio
+import gc
+from collections import deque
+from collections.abc import (
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    Iterable,
+    Iterator,
+)
+from concurrent.futures import Executor
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from functools import wraps
+from itertools import islice
+from typing import Any
+
+from pydantic import BaseModel, GetCoreSchemaHandler, TypeAdapter, ValidationError
+from pydantic_core import CoreSchema, ErrorDetails, core_schema
+
+DEFAULT_BATCH_SIZE = 1000
+DEFAULT_CONCURRENCY = 4
+
+
+@dataclass
+class RecordError:
+    """The validation errors of a single record.
+
+    Attributes
+    ----------
+        index: Position of the record in the input
+        errors: The pydantic error details, located relative to the record
+        record: The invalid input, as it was given
+
+    """
+
+    index: int
+    errors: list[ErrorDetails]
+    record: Any = None
+
+
+@dataclass
+class ValidationResult:
+    """The outcome of validating many records.
+
+    Attributes
+    ----------
+        valid: Instances of the valid records, in input order
+        errors: Errors of the invalid records, in input order
+
+    """
+
+    valid: list[BaseModel] = field(default_factory=list)
+    errors: list[RecordError] = field(default_factory=list)
+
+
+class _Invalid:
+    """Placeholder for a record that failed inside a tolerant batch."""
+
+    __slots__ = ("error",)
+
+    def __init__(self, error: ValidationError) -> None:
+        self.error = error
+
+
+def _capture_errors(value: Any, handler: Any) -> Any:
+    try:
+        return handler(value)
+    except ValidationError as e:
+        return _Invalid(e)
+
+
+class _Item:
+    """The item type of a list adapter, wrapping the schema of a model.
+
+    Unlike ``Annotated[model, ...]`` or ``Json[model]``, it is not kept in
+    the caches of ``typing``, which would keep the model alive.
+    """
+
+    __slots__ = ("model", "wrap")
+
+    def __init__(
+        self, model: type[BaseModel], wrap: Callable[[CoreSchema], CoreSchema]
+    ) -> None:
+        self.model = model
+        self.wrap = wrap
+
+    def __get_pydantic_core_schema__(
+        self, _source_type: Any, handler: GetCoreSchemaHandler
+    ) -> CoreSchema:
+        return self.wrap(handler(self.model))
+
+
+def _tolerant(schema: CoreSchema) -> CoreSchema:
+    return core_schema.no_info_wrap_validator_function(_capture_errors, schema)
+
+
+_AdapterBuilder = Callable[[type[BaseModel]], TypeAdapter[list[Any]]]
+
+
+def _cached_on_model(build: _AdapterBuilder) -> _AdapterBuilder:
+    """Cache the adapter a function builds for a model on the model itself.
+
+    A cache keyed on the model would keep models alive after a reload or
+    once their interner dropped them. Kept on the class, the adapter is
+    collected with it.
+    """
+    attribute = f"__yaml2pydantic_{build.__name__}__"
+
+    @wraps(build)
+    def cached(model: type[BaseModel]) -> TypeAdapter[list[Any]]:
+        # Not inherited: a subclass needs an adapter of its own
+        adapter: TypeAdapter[list[Any]] | None = vars(model).get(attribute)
+        if adapter is None:
+            adapter = build(model)
+            setattr(model, attribute, adapter)
+        return adapter
+
+    return cached
+
+
+@_cached_on_model
+def list_adapter(model: type[BaseModel]) -> TypeAdapter[list[Any]]:
+    """Get the cached adapter validating a list of a model.
+
+    Args:
+    ----
+        model: The model to validate
+
+    Returns:
+    -------
+        A TypeAdapter for ``list[model]``
+
+    """
+    return TypeAdapter(list[model])  # type: ignore[valid-type]
+
+
+@_cached_on_model
+def tolerant_list_adapter(model: type[BaseModel]) -> TypeAdapter[list[Any]]:
+    """Get the cached adapter that validates every record of a list.
+
+    Records that fail are returned as placeholders holding their error, so
+    one invalid record does not discard the rest of the batch.
+
+    Args:
+    ----
+        model: The model to validate
+
+    Returns:
+    -------
+        A TypeAdapter for a list of the model that never raises per record
+
+    """
+    item = _Item(model, _tolerant)
+    return TypeAdapter(list[item])  # type: ignore[valid-type]
+
+
+@_cached_on_model
+def json_list_adapter(model: type[BaseModel]) -> TypeAdapter[list[Any]]:
+    """Get the cached adapter validating a list of raw JSON documents.
+
+    Each item is parsed as a separate document, so a line holding several
+    documents, or half of one, is invalid as it is for ``model_validate_json``.
+
+    Args:
+    ----
+        model: The model to validate
+
+    Returns:
+    -------
+        A TypeAdapter for a list of JSON documents of the model
+
+    """
+    item = _Item(model, core_schema.json_schema)
+    return TypeAdapter(list[item])  # type: ignore[valid-type]
+
+
+@contextmanager
+def gc_paused(enabled: bool = True) -> Iterator[None]:
+    """Pause the cyclic garbage collector for the duration of a block.
+
+    The collector is only re-enabled if it was running when the block
+    started, so nested pauses leave it in its original state. The collector
+    is process-wide: a pause stops collections for every thread, so pausing
+    suits batch jobs rather than services validating from many threads.
+
+    Args:
+    ----
+        enabled: Whether to pause the collector at all
+
+    """
+    if not enabled or not gc.isenabled():
+        yield
+        return
+    gc.disable()
+    try:
+        yield
+    finally:
+        gc.enable()
+
+
+def batched(records: Iterable[Any], batch_size: int) -> Iterator[list[Any]]:
+    """Split an iterable into lists of at most ``batch_size`` items.
+
+    Args:
+    ----
+        records: The items to split
+        batch_size: The maximum size of a batch
+
+    Returns:
+    -------
+        An iterator over the batches
+
+    Raises:
+    ------
+        ValueError: If the batch size is not positive
+
+    """
+    if batch_size < 1:
+        raise ValueError("batch_size must be at least 1")
+    iterator = iter(records)
+    while batch := list(islice(iterator, batch_size)):
+        yield batch
+
+
+def validate_batch(
+    model: type[BaseModel],
+    batch: list[Any],
+    offset: int = 0,
+    tolerant: bool = False,
+) -> ValidationResult:
+    """Validate one batch of records.
+
+    Args:
+    ----
+        model: The model to validate against
+        batch: The records of the batch
+        offset: Index of the first record of the batch in the input
+        tolerant: Validate with the adapter that captures per-record errors,
+            which is faster when the batch is expected to contain failures
+
+    Returns:
+    -------
+        The valid instances and per-record errors of the batch
+
+    """
+    if not tolerant:
+        try:
+            return ValidationResult(valid=list_adapter(model).validate_python(batch))
+        except ValidationError:
+            pass
+
+    result = ValidationResult()
+    for i, item in enumerate(tolerant_list_adapter(model).validate_python(batch)):
+        if isinstance(item, _Invalid):
+            errors = item.error.errors(include_url=False)
+            result.errors.append(RecordError(offset + i, errors, batch[i]))
+        else:
+            result.valid.append(item)
+    return result
+
+
+def validate_many(
+    model: type[BaseModel],
+    records: Iterable[Any],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    pause_gc: bool = False,
+) -> ValidationResult:
+    """Validate many records without stopping at the first invalid one.
+
+    Args:
+    ----
+        model: The model to validate against
+        records: The records to validate (dictionaries or model instances)
+        batch_size: Number of records validated per call into pydantic-core
+        pause_gc: Pause the cyclic garbage collector while each batch runs,
+            which speeds up large batch jobs but affects every thread
+
+    Returns:
+    -------
+        The valid instances and per-record errors, in input order
+
+    """
+    result = ValidationResult()
+    offset = 0
+    tolerant = False
+    for batch in batched(records, batch_size):
+        with gc_paused(pause_gc):
+            batch_result = validate_batch(model, batch, offset, tolerant)
+        tolerant = bool(batch_result.errors)
+        result.valid.extend(batch_result.valid)
+        result.errors.extend(batch_result.errors)
+        offset += len(batch)
+    return result
+
+
+def validate_json_batch(
+    model: type[BaseModel],
+    lines: list[bytes],
+    indices: list[int],
+    per_line: bool = False,
+) -> ValidationResult:
+    """Validate a batch of raw JSON documents.
+
+    The batch is first validated in one call into pydantic-core, which
+    parses each line as a separate document. If that fails, each line is
+    validated with ``model_validate_json`` so invalid and malformed lines
+    are reported individually.
+
+    Args:
+    ----
+        model: The model to validate against
+        lines: The raw JSON documents
+        indices: Position of each document in the input
+        per_line: Skip the batched attempt, which is faster when the batch is
+            expected to contain failures
+
+    Returns:
+    -------
+        The valid instances and per-line errors of the batch
+
+    """
+    if not per_line:
+        try:
+            return ValidationResult(
+                valid=json_list_adapter(model).validate_python(lines)
+            )
+        except ValidationError:
+            pass
+
+    result = ValidationResult()
+    for index, line in zip(indices, lines, strict=True):
+        try:
+            result.valid.append(model.model_validate_json(line))
+        except ValidationError as e:
+            errors = e.errors(include_url=False)
+            result.errors.append(RecordError(index, errors, line))
+    return result
+
+
+def validate_json_lines(
+    model: type[BaseModel],
+    lines: Iterable[bytes | str],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    pause_gc: bool = False,
+) -> Iterator[ValidationResult]:
+    """Validate a stream of JSON lines (NDJSON) in constant memory.
+
+    Blank lines are skipped. Error indices are zero-based line numbers in
+    the input, and each error keeps the raw line it was raised for.
+
+    Args:
+    ----
+        model: The model to validate against
+        lines: The lines of the input, for example an open file
+        batch_size: Number of lines validated per call into pydantic-core
+        pause_gc: Pause the cyclic garbage collector while each batch runs,
+            which speeds up large batch jobs but affects every thread
+
+    Returns:
+    -------
+        An iterator over the results of each batch, in input order
+
+    """
+    if batch_size < 1:
+        raise ValueError("batch_size must be at least 1")
+
+    per_line = False
+    batch: list[bytes] = []
+    indices: list[int] = []
+
+    def flush() -> ValidationResult:
+        with gc_paused(pause_gc):
+            return validate_json_batch(model, batch, indices, per_line)
+
+    for index, line in enumerate(lines):
+        if isinstance(line, str):
+            line = line.encode()
+        if not line.strip():
+            continue
+        batch.append(line)
+        indices.append(index)
+        if len(batch) == batch_size:
+            result = flush()
+            per_line = bool(result.errors)
+            batch, indices = [], []
+            yield result
+
+    if batch:
+        yield flush()
+
+
+def _validate_in_worker(
+    model: type[BaseModel],
+    batch: list[Any],
+    offset: int,
+    tolerant: bool,
+    json: bool,
+    pause_gc: bool,
+) -> ValidationResult:
+    """Validate a batch of records or JSON documents from a worker thread."""
+    with gc_paused(pause_gc):
+        if json:
+            lines = [line.encode() if isinstance(line, str) else line for line in batch]
+            indices = list(range(offset, offset + len(batch)))
+            return validate_json_batch(model, lines, indices, tolerant)
+        return validate_batch(model, batch, offset, tolerant)
+
+
+async def avalidate_stream(
+    model: type[BaseModel],
+    records: AsyncIterable[Any],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    executor: Executor | None = None,
+    json: bool = False,
+    pause_gc: bool = False,
+) -> AsyncIterator[ValidationResult]:
+    """Validate an asynchronous stream of records without blocking the loop.
+
+    Records are gathered into batches, and each batch is validated in the
+    executor. At most ``concurrency`` batches are in flight: once the limit
+    is reached, no record is taken from the stream until the oldest batch
+    is done and its result consumed, so a slow consumer slows the producer
+    down instead of buffering the stream in memory.
+
+    Args:
+    ----
+        model: The model to validate against
+        records: The records to validate, for example from a queue consumer
+        batch_size: Number of records validated per call into pydantic-core
+        concurrency: Maximum number of batches validated at the same time
+        executor: A thread pool, or None for the loop's default executor;
+            models cannot be pickled, see ``ParallelValidator.avalidate``
+            for worker processes
+        json: Whether the records are raw JSON documents (bytes or str)
+        pause_gc: Pause the cyclic garbage collector while each batch runs.
+            The collector is process-wide and batches overlap, so this keeps
+            it off for most of the stream; only enable it for short streams
+            in a process doing nothing else
+
+    Returns:
+    -------
+        An asynchronous iterator over the results of each batch, in input
+        order; error indices are positions in the stream
+
+    Raises:
+    ------
+        ValueError: If the batch size or the concurrency is not positive
+
+    """
+    if batch_size < 1:
+        raise ValueError("batch_size must be at least 1")
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+
+    loop = asyncio.get_running_loop()
+    in_flight: deque[asyncio.Future[ValidationResult]] = deque()
+    tolerant = False
+    offset = 0
+    batch: list[Any] = []
+
+    def submit() -> None:
+        nonlocal offset, batch
+        in_flight.append(
+            loop.run_in_executor(
+                executor,
+                _validate_in_worker,
+                model,
+                batch,
+                offset,
+                tolerant,
+                json,
+                pause_gc,
+            )
+        )
+        offset += len(batch)
+        batch = []
+
+    try:
+        async for record in records:
+            batch.append(record)
+            if len(batch) == batch_size:
+                submit()
+                if len(in_flight) >= concurrency:
+                    result = await in_flight.popleft()
+                    tolerant = bool(result.errors)
+                    yield result
+        if batch:
+            submit()
+        while in_flight:
+            yield await in_flight.popleft()
+    finally:
+        for future in in_flight:
+            future.cancel()
@@ -1,31 +1,89 @@
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
+from typing import Any
 
+from yaml2pydantic.core.discovery import ComponentIndex, component_index
+from yaml2pydantic.core.scopes import ScopedRegistry
 
-class ValidatorRegistry:
+# Native equivalent of a validator: constraints accepted by ``Field``, or a
+# function of the field's type returning them (None when it cannot apply)
+Native = dict[str, Any] | Callable[[Any], dict[str, Any] | None]
+NATIVE_ATTRIBUTE = "_native_constraints"
+
+
+class ValidatorRegistry(ScopedRegistry):
     """Registry for managing field and model validators.
 
     This class maintains a registry of custom validators that can be
     used to validate fields and models in the generated models.
+    A validator can declare a native equivalent, which pydantic-core enforces
+    without calling back into Python.
+    ``generation`` is bumped whenever a name is rebound to another function.
+    A registry given a ``ComponentIndex`` imports the validators it does not
+    know yet when they are first requested, and a child registry falls back
+    on its parent.
     """
 
-    def __init__(self) -> None:
-        """Initialize an empty validator registry."""
+    def __init__(
+        self,
+        index: ComponentIndex | None = None,
+        parent: "ValidatorRegistry | None" = None,
+    ) -> None:
+        """Initialize an empty validator registry.
+
+        Args:
+        ----
+            index: Optional index of the validators to import on first use
+            parent: Optional registry to look up unknown names in
+
+        """
+        super().__init__(index, parent)
         self.validators: dict[str, Callable] = {}
+        self.native: dict[str, Native] = {}
 
-    def validator(self, func: Callable) -> Callable:
+    def validator(
+        self, func: Callable | None = None, *, native: Native | None = None
+    ) -> Callable:
         """Register a validator function.
 
+        Can be used as ``@registry.validator`` or, to declare a native
+        equivalent, as ``@registry.validator(native={"gt": 0})``.
+
         Args:
         ----
             func: The validator function to register
+            native: Constraints equivalent to the validator, or a function of
+                the field's type returning them (or None when they do not apply)
 
         Returns:
         -------
             The original function (for use as a decorator)
 
+        Raises:
+        ------
+            FrozenRegistryError: If the registry is frozen, outside of an
+                index-driven import
+
         """
-        self.validators[func.__name__] = func
-        return func
+
+        def register(func: Callable) -> Callable:
+            if native is not None:
+                self._declare(func, NATIVE_ATTRIBUTE, native)
+            if not self._check_writable(func.__name__):
+                return func
+            with self._lock:
+                if self._find(func.__name__) not in (None, func):
+                    self._rebound()
+                self.validators[func.__name__] = func
+                declared = getattr(func, NATIVE_ATTRIBUTE, None)
+                if declared is None:
+                    self.native.pop(func.__name__, None)
+                else:
+                    self.native[func.__name__] = declared
+            return func
+
+        if func is None:
+            return register
+        return register(func)
 
     def get(self, name: str) -> Callable:
         """Get a validator by name.
@@ -43,7 +101,57 @@ class ValidatorRegistry:
             KeyError: If the validator is not found
 
         """
-        return self.validators[name]
+        func: Callable | None = self._find(name)
+        if func is None:
+            func = self._load("validators", name)
+        return func
+
+    def _components(self) -> dict[str, Any]:
+        """Get the validators registered in this registry itself."""
+        return self.validators
+
+    def _add(self, name: str, component: Any) -> None:
+        """Register a validator imported through the index."""
+        self.validator(component)
+
+    def lower(
+        self, names: Iterable[str], field_type: Any, taken: Iterable[str] = ()
+    ) -> tuple[dict[str, Any], list[str]]:
+        """Split the validators of a field into native constraints and Python.
+
+        A validator is lowered when it declares a native equivalent for the
+        field's type whose constraints the field does not set already, since
+        pydantic keeps only one value per constraint.
+
+        Args:
+        ----
+            names: Names of the field's validators
+            field_type: The resolved type of the field, or None if unknown
+            taken: Constraints the field sets itself
+
+        Returns:
+        -------
+            The constraints to add to the field, and the names of the
+            validators that must still run in Python
+
+        Raises:
+        ------
+            KeyError: If a validator is not found
+
+        """
+        constraints: dict[str, Any] = {}
+        remaining: list[str] = []
+        used = set(taken)
+        for name in names:
+            native = getattr(self.get(name), NATIVE_ATTRIBUTE, None)
+            if callable(native):
+                native = native(field_type) if field_type is not None else None
+            if native is None or used & native.keys():
+                remaining.append(name)
+                continue
+            constraints.update(native)
+            used |= native.keys()
+        return constraints, remaining
 
 
-validator_registry = ValidatorRegistry()
+validator_registry = ValidatorRegistry(component_index)